@@ -143,7 +143,11 @@ class AiNode22(NevilNode):
                 name for name in dir(extended_gestures)
                 if callable(getattr(extended_gestures, name))
                 and not name.startswith('_')
-                and name not in ['time', 'Enum', 'GestureSpeed', 'play_sound', 'honk', 'rev_engine']
+                and name not in ['time', 'Enum', 'GestureSpeed', 'play_sound', 'honk', 'rev_engine',
+                                 'namedtuple', 'Frame', 'safe_gesture',
+                                 'run_gesture', 'load_gesture_file', 'GestureAbort',
+                                 'cancel_gesture', 'set_cancel_check',
+                                 'gesture_guard']
             ]
 
             for gesture_name in gesture_names:
@@ -3,7 +3,7 @@ from .utils import gray_print
 #from vilib import Vilib  # Commented out - import issue
 import time
 import logging
-from .extended_gestures import register_extended
+from .extended_gestures import register_extended, cancel_gesture, set_cancel_check, GESTURE_FRAMES
 
 # Get logger for action_helper module
 logger = logging.getLogger('navigation')
@@ -281,9 +281,7 @@ def rub_hands(car):
         sleep(.6)  # Slightly longer
         car.set_dir_servo_angle(6, smooth=False)
         sleep(.6)
-    car.set_dir_servo_angle(0, smooth=True)  # Smooth return to center
-    car.set_cam_pan_angle(0, smooth=True)
-    car.set_cam_tilt_angle(0, smooth=True)
+    car.recenter()  # Smooth return to center
 
 def think(car):
     car.reset()
@@ -310,9 +308,7 @@ def keep_think(car):
         car.set_dir_servo_angle(i*2, smooth=False)
         sleep(.08)  # Slightly longer delay
     # Reset to center position smoothly
-    car.set_cam_pan_angle(0, smooth=True)
-    car.set_cam_tilt_angle(0, smooth=True)
-    car.set_dir_servo_angle(0, smooth=True)
+    car.recenter()
 
 def shake_head(car):
     car.stop()
@@ -384,9 +380,7 @@ def depressed(car):
     sleep(.15)
 
     sleep(1.5)
-    car.set_cam_tilt_angle(0, smooth=True)  # Smooth reset
-    car.set_cam_pan_angle(0, smooth=True)
-    car.set_dir_servo_angle(0, smooth=True)
+    car.recenter()  # Smooth reset
 
 def twist_body(car):
     car.reset()
@@ -445,9 +439,7 @@ def celebrate(car):
     # car.set_cam_pan_angle(-60, smooth=True)  # UNSAFE - exceeds servo limits
     car.set_cam_pan_angle(-45, smooth=True)  # SAFE - reduced to stay within limits
     sleep(.35)
-    car.set_dir_servo_angle(0, smooth=True)
-    car.set_cam_pan_angle(0, smooth=True)
-    car.set_cam_tilt_angle(0, smooth=True)  # Return tilt to center
+    car.recenter()
     sleep(.25)
 
 def honk(car):
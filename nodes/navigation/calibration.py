@@ -124,6 +124,96 @@ def cali_helper():
     step = 0.4
     # step = (180 / 2000) * (20000 / 4095)  # actual precision of steering gear
 
+    # select the servo / motor
+    def select_servo(num):
+        def handler():
+            global servo_num
+            servo_num = num
+            show_info()
+        return handler
+
+    def select_motor(num):
+        def handler():
+            global motor_num
+            motor_num = num
+            show_info()
+        return handler
+
+    # servos move
+    def inc_servo():
+        servos_offset[servo_num] += step
+        if servos_offset[servo_num] > 50:
+            servos_offset[servo_num] =50
+        servos_offset[servo_num] = round(servos_offset[servo_num], 2)
+        show_info()
+        set_servos_offset(servo_num, servos_offset[servo_num])
+        servos_move(servo_num, 0)
+
+    def dec_servo():
+        servos_offset[servo_num] -= step
+        if servos_offset[servo_num] < -50:
+            servos_offset[servo_num] = -50
+        servos_offset[servo_num] = round(servos_offset[servo_num], 2)
+        show_info()
+        set_servos_offset(servo_num, servos_offset[servo_num])
+        servos_move(servo_num, 0)
+
+    # motors move
+    def flip_motor():
+        nonlocal motor_run
+        motors_offset[motor_num] = -1 * motors_offset[motor_num]
+        px.cali_dir_value = list.copy(motors_offset)
+        motor_run = True
+        px.forward(px_power)
+        show_info()
+
+    def toggle_motor():
+        nonlocal motor_run
+        if motor_run == False:
+            motor_run = True
+            px.forward(px_power)
+        else:
+            motor_run = False
+            px.stop()
+
+    # save
+    def confirm_save():
+        global servos_offset
+        print('Confirm save ?(y/n)')
+        while True:
+            key = readchar.readkey()
+            key = key.lower()
+            if key == 'y':
+                px.dir_servo_calibrate(servos_offset[0])
+                px.cam_pan_servo_calibrate(servos_offset[1])
+                px.cam_tilt_servo_calibrate(servos_offset[2])
+                px.motor_direction_calibrate(motor_num +1 , motors_offset[motor_num])
+                sleep(0.2)
+                servos_offset = [px.dir_cali_val, px.cam_pan_cali_val, px.cam_tilt_cali_val]
+                show_info()
+                print('The calibration value has been saved.')
+                break
+            elif key == 'n':
+                show_info()
+                break
+
+    # key -> handler, looked up once per keypress
+    handlers = {
+        '1': select_servo(0),
+        '2': select_servo(1),
+        '3': select_servo(2),
+        '4': select_motor(0),
+        '5': select_motor(1),
+        'r': servos_test,
+        'w': inc_servo,
+        'd': inc_servo,
+        's': dec_servo,
+        'a': dec_servo,
+        'q': flip_motor,
+        'e': toggle_motor,
+        readchar.key.SPACE: confirm_save,
+    }
+
     # reset
     servos_reset()
     # show_info 
@@ -134,76 +224,14 @@ def cali_helper():
         # readkey
         key = readchar.readkey()
         key = key.lower()
-        # select the servo 
-        if key in ('123'):
-            servo_num = int(key)-1
-            show_info()
-        if key in ('45'):
-            motor_num = int(key)-4
-            show_info()
-        # servos move
-        elif key == 'r':
-            servos_test()
-        elif key == 'w' or key == 'd':
-            servos_offset[servo_num] += step
-            if servos_offset[servo_num] > 50:
-                servos_offset[servo_num] =50
-            servos_offset[servo_num] = round(servos_offset[servo_num], 2) 
-            show_info()
-            set_servos_offset(servo_num, servos_offset[servo_num])
-            servos_move(servo_num, 0)
-        elif key == 's' or key == 'a':
-            servos_offset[servo_num] -= step
-            if servos_offset[servo_num] < -50:
-                servos_offset[servo_num] = -50
-            servos_offset[servo_num] = round(servos_offset[servo_num], 2) 
-            show_info()
-            set_servos_offset(servo_num, servos_offset[servo_num])
-            servos_move(servo_num, 0)
-        # motors move
-        elif key == 'q':
-            motors_offset[motor_num] = -1 * motors_offset[motor_num]
-            px = get_picarx_instance()
-            px.cali_dir_value = list.copy(motors_offset)
-            motor_run = True
-            px.forward(px_power)
-            show_info()
-        elif key == 'e':
-            px = get_picarx_instance()
-            if motor_run == False:
-                motor_run = True
-                px.forward(px_power)
-            else:
-                motor_run = False
-                px.stop()
-        # save
-        elif key == readchar.key.SPACE:
-            print('Confirm save ?(y/n)')
-            while True:
-                key = readchar.readkey()
-                key = key.lower()
-                if key == 'y':
-                    px = get_picarx_instance()
-                    px.dir_servo_calibrate(servos_offset[0])
-                    px.cam_pan_servo_calibrate(servos_offset[1])
-                    px.cam_tilt_servo_calibrate(servos_offset[2])
-                    px.motor_direction_calibrate(motor_num +1 , motors_offset[motor_num])
-                    sleep(0.2)
-                    servos_offset = [px.dir_cali_val, px.cam_pan_cali_val, px.cam_tilt_cali_val]
-                    show_info()
-                    print('The calibration value has been saved.')
-                    break
-                elif key == 'n':
-                    show_info()
-                    break   
-                sleep(0.01) 
-
         # quit
-        elif key == readchar.key.CTRL_C or key in readchar.key.ESC:
+        if key == readchar.key.CTRL_C or key == readchar.key.ESC:
             print('quit')
-            break 
+            break
 
-        sleep(0.01)
+        handler = handlers.get(key)
+        if handler:
+            handler()
 
 
 if __name__ == "__main__":
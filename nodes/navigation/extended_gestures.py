@@ -2,9 +2,20 @@
 # Extended gesture library for PiCar-X expressive choreography.
 # Redesigned for REAL VARIETY - static poses, real locomotion, dance movements
 # Import time in case caller module doesn't import it.
+import contextlib
+import errno
+import functools
+import logging
+import operator
+import os
+import sys
+import threading
 import time
+from collections import namedtuple
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 # GESTURE SPEED SYSTEM
 # Speed affects pause durations throughout gestures for expressive variation
 class GestureSpeed(Enum):
@@ -23,1827 +34,1284 @@ SPEED_MULTIPLIERS = {
     GestureSpeed.FAST: GestureSpeed.FAST.value
 }
 
-def _sleep(duration, speed='med'):
-    """Sleep with speed multiplier applied - accepts string or GestureSpeed enum"""
+def _speed_multiplier(speed='med'):
+    """Pause multiplier for a speed - accepts string or GestureSpeed enum"""
     if isinstance(speed, GestureSpeed):
-        multiplier = speed.value
+        return speed.value
     elif isinstance(speed, str):
-        multiplier = SPEED_MULTIPLIERS.get(speed, 1.0)
-    else:
-        multiplier = 1.0
-    time.sleep(duration * multiplier)
+        return SPEED_MULTIPLIERS.get(speed, 1.0)
+    return 1.0
 
-# Helper: optional nudge forward/back small distances via raw motor speeds.
-def _pulse(car, speed, dur, gesture_speed='med'):
-    car.set_motor_speed(1, speed)
-    car.set_motor_speed(2, speed)
-    _sleep(dur, gesture_speed)
-    car.set_motor_speed(1, 0)
-    car.set_motor_speed(2, 0)
+def _scaled(duration, speed='med'):
+    """Duration with speed multiplier applied - accepts string or GestureSpeed enum"""
+    return duration * _speed_multiplier(speed)
+
+def _sleep(duration, speed='med'):
+    """Sleep with speed multiplier applied - accepts string or GestureSpeed enum"""
+    time.sleep(_scaled(duration, speed))
+
+# Every motion gesture is a frame table, and most end by recentering, holding,
+# then car.stop() with the motors already off (see _compile_frames). That
+# hold only lets the servos settle before the next gesture, which
+# re-commands them anyway, so it can be scaled down (0 drops it) with
+# NEVIL_GESTURE_TAIL once measured on the car. 1.0 keeps the authored holds.
+TAIL_HOLD = float(os.getenv('NEVIL_GESTURE_TAIL', '1.0'))
+
+# Absolute-deadline sleep. On Linux, clock_nanosleep(CLOCK_MONOTONIC,
+# TIMER_ABSTIME) - the same clock as time.monotonic() - lets the kernel wake us
+# at the deadline itself rather than after a relative delay computed a moment
+# earlier. Elsewhere fall back to time.sleep of the remaining time.
+_clock_nanosleep = None
+if sys.platform.startswith('linux'):
+    try:
+        import ctypes
+        import ctypes.util
+
+        class _Timespec(ctypes.Structure):
+            _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+        _clock_nanosleep = ctypes.CDLL(ctypes.util.find_library('c')).clock_nanosleep
+        _clock_nanosleep.argtypes = [ctypes.c_int, ctypes.c_int,
+                                     ctypes.POINTER(_Timespec), ctypes.POINTER(_Timespec)]
+    except (ImportError, OSError, AttributeError):
+        _clock_nanosleep = None
+_CLOCK_MONOTONIC = 1
+_TIMER_ABSTIME = 1
+
+def _sleep_until(deadline):
+    """Sleep until a time.monotonic() deadline; returns at once if it has passed"""
+    if _clock_nanosleep is not None:
+        sec = int(deadline)
+        ts = _Timespec(sec, int((deadline - sec) * 1e9))
+        while _clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ts, None) == errno.EINTR:
+            pass
+    else:
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+# Timeline runner: a frame table compiles to a time-ordered tuple of
+# (t_offset, action(car)). Offsets are nominal seconds from gesture start
+# (scaled by speed) and are waited on as absolute deadlines, so time spent
+# inside a step is absorbed by the next wait instead of being added on top.
+# Timelines are tuples so the speed-scaled copy can be built once and reused.
+@functools.lru_cache(maxsize=None)
+def _scaled_timeline(timeline, multiplier):
+    return tuple((t_offset * multiplier, action) for t_offset, action in timeline)
+
+# Cancellation: timeline gestures wait through _hold_until, which polls for a
+# cancel request while holding, so a caller on another thread can cut a
+# multi-second gesture short within one poll interval. The abort surfaces as
+# GestureAbort, which @safe_gesture turns into a reset to neutral.
+_CANCEL_POLL = 0.05
+_gesture_cancel = threading.Event()
+_cancel_check = None
+
+def cancel_gesture():
+    """Abort the running timeline gesture at its next wait"""
+    _gesture_cancel.set()
+
+def set_cancel_check(check):
+    """Install a callable polled while gestures hold; True aborts the gesture"""
+    global _cancel_check
+    _cancel_check = check
+
+def _hold_until(deadline):
+    """_sleep_until that raises GestureAbort once a cancel is requested"""
+    check = _cancel_check
+    while True:
+        if _gesture_cancel.is_set() or (check is not None and check()):
+            _gesture_cancel.clear()
+            raise GestureAbort("cancelled")
+        if deadline - time.monotonic() <= _CANCEL_POLL:
+            break
+        _gesture_cancel.wait(_CANCEL_POLL)
+    # Last stretch on the precise clock
+    _sleep_until(deadline)
+
+# Watchdog: a timeline has a known length, so a gesture still running well
+# past it is stuck in a driver call. One long-lived thread watches the
+# deadline of whichever timeline is playing; on expiry it cancels the gesture
+# so it aborts at its next wait, and cuts the outputs from its own thread
+# (rather than waiting on the stuck one to reach its except path). Steps and
+# resets both run under _drive_lock, so the reset never lands on the bus in
+# the middle of a step: it goes out as soon as the stuck call returns, or
+# not at all if that takes longer than WATCHDOG_LOCK_TIMEOUT, leaving the
+# gesture's own abort path to reset the car.
+WATCHDOG_FACTOR = 2.0
+WATCHDOG_MARGIN = 0.5  # seconds, covers short gestures and blocking stop()
+WATCHDOG_LOCK_TIMEOUT = 2.0
+
+_drive_lock = threading.Lock()
+_watchdog_cond = threading.Condition()
+_watchdog_armed = None  # (deadline, car) while a timeline plays
+_watchdog_thread = None
+
+def _watchdog_arm(car, deadline):
+    global _watchdog_armed, _watchdog_thread
+    with _watchdog_cond:
+        _watchdog_armed = (deadline, car)
+        if _watchdog_thread is None:
+            _watchdog_thread = threading.Thread(target=_watchdog_loop, name='gesture_watchdog', daemon=True)
+            _watchdog_thread.start()
+        _watchdog_cond.notify()
+
+def _watchdog_disarm():
+    global _watchdog_armed
+    with _watchdog_cond:
+        _watchdog_armed = None
+        _watchdog_cond.notify()
+
+def _watchdog_loop():
+    global _watchdog_armed
+    while True:
+        with _watchdog_cond:
+            while True:
+                armed = _watchdog_armed
+                if armed is None:
+                    _watchdog_cond.wait()
+                    continue
+                remaining = armed[0] - time.monotonic()
+                if remaining <= 0:
+                    break
+                _watchdog_cond.wait(remaining)
+            _watchdog_armed = None
+        _watchdog_expired(armed[1])
+
+def _watchdog_expired(car):
+    logger.error("Gesture overran its watchdog deadline; cutting outputs")
+    _gesture_cancel.set()
+    if not _safe_reset(car, timeout=WATCHDOG_LOCK_TIMEOUT):
+        logger.error("Gesture still stuck in a driver call; leaving the reset to its abort path")
+
+def _play_timeline(car, scaled):
+    """Run an already speed-scaled timeline"""
+    # Loop-invariant lookup hoisted out of the per-step path
+    sleep_until = _hold_until
+    # A cancel left over from an earlier gesture doesn't apply to this one
+    _gesture_cancel.clear()
+    t0 = time.monotonic()
+    _watchdog_arm(car, t0 + WATCHDOG_FACTOR * scaled[-1][0] + WATCHDOG_MARGIN)
+    try:
+        for t_offset, action in scaled:
+            sleep_until(t0 + t_offset)
+            with _drive_lock:
+                action(car)
+    finally:
+        _watchdog_disarm()
+
+# Frame table: a gesture is a tuple of Frames, each one car.apply() of the
+# non-None fields followed by a hold of dt (nominal seconds). Motors keep the
+# last commanded speed until a later frame changes them. Smooth servo moves
+# run on the car's background servo thread, so they overlap the hold.
+Frame = namedtuple('Frame', 'pan tilt steer m1 m2 dt smooth', defaults=(None, None, None, None, None, 0, True))
+
+_STOP = operator.methodcaller('stop')
+
+@functools.lru_cache(maxsize=None)
+def _compile_frames(frames, tail_hold=1.0):
+    """Turn a frame table into a timeline ending in car.stop()
+
+    The last frame's hold is scaled by tail_hold (TAIL_HOLD) when it
+    recenters servos with the motors off by then: that trailing settle only
+    lets the servos finish. A final pose hold keeps its authored length.
+    """
+    timeline = []
+    t_offset = 0.0
+    moving = False
+    last = {}
+    for f in frames:
+        if f.m1 is not None or f.m2 is not None:
+            moving = bool(f.m1) or bool(f.m2)
+        # Drop fields restating what the table last set: the write is a no-op
+        # on the car, and sending it would cut short a ramp still in flight
+        fields = {k: v for k, v in zip(Frame._fields[:5], f) if v is not None and last.get(k) != v}
+        last.update(fields)
+        # Pure holds (no commands) just extend the wait, so runs of them
+        # collapse into a single sleep
+        if fields:
+            # Resolve the frame's fields once here rather than on every run
+            kwargs = dict(fields, smooth=f.smooth, wait=False)
+            # methodcaller is implemented in C, so a step is one native call
+            # into car.apply rather than an extra Python frame
+            timeline.append((t_offset, operator.methodcaller('apply', **kwargs)))
+        t_offset += f.dt
+    if frames and not moving:
+        servos = [v for v in frames[-1][:3] if v is not None]
+        if servos and not any(servos):
+            t_offset -= frames[-1].dt * (1 - tail_hold)
+    timeline.append((t_offset, _STOP))
+    return tuple(timeline)
+
+def _safe_reset(car, timeout=-1):
+    """Best-effort stop and recenter after a failed gesture
+
+    Waits for any timeline step in progress (see _drive_lock). Returns
+    False if that takes longer than timeout seconds; the reset is skipped.
+    """
+    if not _drive_lock.acquire(timeout=timeout):
+        return False
+    try:
+        car.safe_neutral()
+    except Exception:
+        pass
+    finally:
+        _drive_lock.release()
+    return True
+
+class GestureAbort(Exception):
+    """Raise inside a gesture to stop it and return the car to neutral"""
+
+# Driver-level failures (I2C/GPIO I/O, timeouts) that abort a gesture quietly
+HW_ERRORS = (OSError, TimeoutError)
+
+@contextlib.contextmanager
+def gesture_guard(car, name='gesture'):
+    """Stop and recenter the car if the block fails.
+
+    Hardware errors and GestureAbort are logged and swallowed; anything else
+    is a bug, so the car is still made safe but the exception propagates.
+    """
+    try:
+        yield
+    except (GestureAbort,) + HW_ERRORS as e:
+        logger.warning("Gesture %s aborted: %s", name, e)
+        _safe_reset(car)
+    except BaseException:
+        _safe_reset(car)
+        raise
+
+def safe_gesture(fn):
+    """Decorator form of gesture_guard for a whole gesture function"""
+    @functools.wraps(fn)
+    def wrapper(car, *args, **kwargs):
+        with gesture_guard(car, fn.__name__):
+            return fn(car, *args, **kwargs)
+    return wrapper
+
+def _prepare_gesture(name, multiplier, tail_hold):
+    return _scaled_timeline(_compile_frames(GESTURE_FRAMES[name], tail_hold), multiplier)
+
+def run_gesture(car, name, speed='med', tail=True):
+    """Run the frame table registered under name in GESTURE_FRAMES.
+
+    tail=False drops the trailing return-to-center hold, for a gesture that
+    another one follows straight away.
+    """
+    _play_timeline(car, _prepare_gesture(name, _speed_multiplier(speed), TAIL_HOLD if tail else 0.0))
+
+def _frame_from_mapping(name, frame):
+    """Build a Frame from one file entry, rejecting values apply() can't take"""
+    if not isinstance(frame, dict):
+        raise ValueError(f"Bad frame in gesture '{name}': expected a mapping, got {frame!r}")
+    unknown = set(frame) - set(Frame._fields)
+    if unknown:
+        raise ValueError(f"Bad frame in gesture '{name}': unknown fields {sorted(unknown)}")
+    for field in Frame._fields[:5] + ('dt',):
+        value = frame.get(field)
+        if value is None and field != 'dt':
+            continue
+        # bool is an int, but True/False as an angle or speed is a typo
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Bad frame in gesture '{name}': {field} must be a number, got {value!r}")
+    if 'dt' in frame and frame['dt'] < 0:
+        raise ValueError(f"Bad frame in gesture '{name}': dt must be >= 0, got {frame['dt']!r}")
+    if not isinstance(frame.get('smooth', True), bool):
+        raise ValueError(f"Bad frame in gesture '{name}': smooth must be true or false, got {frame['smooth']!r}")
+    return Frame(**frame)
+
+def _table_gesture(name):
+    """Gesture function for a table that has no hand-written wrapper"""
+    def gesture(car, speed='med', tail=True):
+        run_gesture(car, name, speed, tail)
+    gesture.__name__ = gesture.__qualname__ = name
+    gesture.__doc__ = f"Frame table '{name}' loaded from a gesture file"
+    return safe_gesture(gesture)
+
+def load_gesture_file(path):
+    """Load frame tables from a YAML (or JSON) file into GESTURE_FRAMES.
+
+    The file maps gesture name -> list of frames, each a mapping of Frame
+    fields (pan, tilt, steer, m1, m2, dt, smooth); omitted fields keep their
+    defaults. Tables replace built-ins of the same name, so gesture tweaks
+    are an asset swap; new names are added to EXTENDED_GESTURES. The whole
+    file is checked before anything is installed, so a bad entry raises
+    ValueError and leaves the loaded gestures as they were. Returns the
+    names loaded.
+    """
+    import yaml  # JSON is valid YAML
+    with open(path) as f:
+        try:
+            data = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"Gesture file {path} is not valid YAML: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"Gesture file {path} must map gesture names to frame lists")
+    tables = {}
+    for name, frames in data.items():
+        if name in EXTENDED_GESTURES and name not in GESTURE_FRAMES:
+            raise ValueError(f"Gesture '{name}' is not a frame gesture and can't be replaced from a file")
+        if not isinstance(frames, list) or not frames:
+            raise ValueError(f"Gesture '{name}' must be a non-empty list of frames")
+        table = tuple(_frame_from_mapping(name, frame) for frame in frames)
+        _compile_frames(table, TAIL_HOLD)
+        tables[name] = table
+    GESTURE_FRAMES.update(tables)
+    for name in tables:
+        _precompute_gesture(name)
+        if name not in EXTENDED_GESTURES:
+            EXTENDED_GESTURES[name] = _table_gesture(name)
+    return list(tables)
 
 
 # ============================================================================
 # OBSERVATION GESTURES (15) - STATIC or HEAD-ONLY
 # ============================================================================
 
-def look_left_then_right(car, speed='med'):
+_LOOK_LEFT_THEN_RIGHT = (
+    # Smooth sweep left
+    Frame(pan=-35, tilt=0, dt=0.4),
+    # Pause at left
+    Frame(dt=0.3),
+    # Smooth sweep to right
+    Frame(pan=35, dt=0.6),
+    # Pause at right
+    Frame(dt=0.3),
+    # Return to center
+    Frame(pan=0, dt=0.4),
+)
+
+@safe_gesture
+def look_left_then_right(car, speed='med', tail=True):
     """HEAD ONLY - Smooth pan sweep from left to right, no wheel movement"""
-    try:
-        # Smooth sweep left
-        car.set_cam_pan_angle(-35, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
+    run_gesture(car, 'look_left_then_right', speed, tail)
+
+
+_LOOK_UP_THEN_DOWN = (
+    # Tilt up to look at ceiling/sky
+    Frame(pan=0, tilt=30, dt=0.5),
+    # Pause at top
+    Frame(dt=0.4),
+    # Tilt down to look at floor
+    Frame(tilt=-30, dt=0.6),
+    # Pause at bottom
+    Frame(dt=0.4),
+    # Return to center
+    Frame(tilt=0, dt=0.4),
+)
+
+@safe_gesture
+def look_up_then_down(car, speed='med', tail=True):
+    """HEAD ONLY - Tilt up then down, no wheel movement"""
+    run_gesture(car, 'look_up_then_down', speed, tail)
 
-        # Pause at left
-        _sleep(0.3, speed)
 
-        # Smooth sweep to right
-        car.set_cam_pan_angle(35, smooth=True)
-        _sleep(0.6, speed)
+_LOOK_UP = (
+    # Tilt camera up and hold
+    # Don't reset camera - leave it looking up for better view
+    Frame(pan=0, tilt=35, dt=0.5),
+)
 
-        # Pause at right
-        _sleep(0.3, speed)
+@safe_gesture
+def look_up(car, speed='med', tail=True):
+    """STATIC - Just tilt camera up 35°, hold"""
+    run_gesture(car, 'look_up', speed, tail)
+
+
+_INSPECT_FLOOR = (
+    # Tilt camera down to look at floor
+    Frame(pan=0, tilt=-30, dt=0.4),
+    # Slight forward movement to get closer
+    Frame(m1=15, m2=-15, dt=0.13),  # Move ~10cm forward
+    # Hold position and observe
+    Frame(m1=0, m2=0, dt=0.6),
+    # Return to center
+    Frame(tilt=0, dt=0.3),
+)
+
+@safe_gesture
+def inspect_floor(car, speed='med', tail=True):
+    """STATIC - Tilt down and move forward slightly to inspect floor"""
+    run_gesture(car, 'inspect_floor', speed, tail)
+
+
+_LOOK_AROUND_NERVOUSLY = (
+    # Quick snap to right
+    Frame(pan=35, dt=0.15, smooth=False),
+    # Quick snap to left
+    Frame(pan=-35, dt=0.2, smooth=False),
+    # Quick snap back to right
+    Frame(pan=30, dt=0.15, smooth=False),
+    # Quick snap to center
+    Frame(pan=0, dt=0.2, smooth=False),
+    # Quick snap left again
+    Frame(pan=-25, dt=0.15, smooth=False),
+    # Return to center
+    Frame(pan=0, dt=0.3),
+)
+
+@safe_gesture
+def look_around_nervously(car, speed='med', tail=True):
+    """HEAD ONLY - Quick pan snaps left-right-left, nervous energy"""
+    run_gesture(car, 'look_around_nervously', speed, tail)
 
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.4, speed)
 
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_CURIOUS_PEEK = (
+    # Move forward slightly (lean in) - ~10cm
+    Frame(pan=0, m1=15, m2=-15, dt=0.13),
+    # Stop and tilt head to peek, hold
+    Frame(tilt=20, m1=0, m2=0, dt=0.9),
+    # Return head to center
+    Frame(tilt=0, dt=0.3),
+)
 
+@safe_gesture
+def curious_peek(car, speed='med', tail=True):
+    """STATIC+HEAD - Lean forward 10cm, tilt head 20°"""
+    run_gesture(car, 'curious_peek', speed, tail)
 
-def look_up_then_down(car, speed='med'):
-    """HEAD ONLY - Tilt up then down, no wheel movement"""
-    try:
-        # Tilt up to look at ceiling/sky
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(30, smooth=True)
-        _sleep(0.5, speed)
 
-        # Pause at top
-        _sleep(0.4, speed)
+_REVERSE_PEEK = (
+    # Move backward (retreat) - ~10cm
+    Frame(m1=-15, m2=15, dt=0.13),
+    # Stop and tilt head sideways to peek, hold
+    Frame(pan=30, tilt=15, m1=0, m2=0, dt=0.9),
+    # Return head to center
+    Frame(pan=0, tilt=0, dt=0.3),
+)
 
-        # Tilt down to look at floor
-        car.set_cam_tilt_angle(-30, smooth=True)
-        _sleep(0.6, speed)
+@safe_gesture
+def reverse_peek(car, speed='med', tail=True):
+    """STATIC+HEAD - Back 10cm, tilt head sideways"""
+    run_gesture(car, 'reverse_peek', speed, tail)
+
+
+_HEAD_SPIN_SURVEY = (
+    # Start from center
+    Frame(pan=0, dt=0.2),
+    # Slow continuous pan to create 360° effect
+    # Pan left
+    Frame(pan=-50, dt=0.6),
+    # Continue panning through right
+    Frame(pan=50, dt=1.2),  # Slow sweep across
+    # Return to center
+    Frame(pan=0, dt=0.6),
+)
+
+@safe_gesture
+def head_spin_survey(car, speed='med', tail=True):
+    """HEAD ONLY - Slow 360° pan rotation"""
+    run_gesture(car, 'head_spin_survey', speed, tail)
+
+
+_ALERT_SCAN = (
+    # Fast snap left
+    Frame(pan=-40, dt=0.2, smooth=False),
+    # Fast snap right
+    Frame(pan=40, dt=0.2, smooth=False),
+    # Fast snap left again
+    Frame(pan=-40, dt=0.2, smooth=False),
+    # Return to center
+    Frame(pan=0, dt=0.3),
+)
+
+@safe_gesture
+def alert_scan(car, speed='med', tail=True):
+    """HEAD ONLY - Fast pan -40° +40° -40°"""
+    run_gesture(car, 'alert_scan', speed, tail)
+
+
+_SEARCH_PATTERN = (
+    # Start panning head left
+    Frame(pan=-35, dt=0.3),
+    # Turn body slowly right while panning head
+    Frame(steer=30, dt=0.2),
+    Frame(m1=12, m2=-12, dt=0.5),
+    # Stop, pan head right while body settles
+    Frame(pan=35, m1=0, m2=0, dt=0.6),
+    # Return to center
+    Frame(pan=0, steer=0, dt=0.3),
+)
+
+@safe_gesture
+def search_pattern(car, speed='med', tail=True):
+    """HEAD+SLOW TURN - Pan while slow 90° turn"""
+    run_gesture(car, 'search_pattern', speed, tail)
+
+
+_SCOUT_MODE = (
+    # Look ahead
+    Frame(pan=0, tilt=-10, dt=0.2),
+    # Move forward - ~20cm
+    Frame(m1=20, m2=-20, dt=0.22),
+    # Stop and scan left
+    Frame(pan=-30, m1=0, m2=0, dt=0.4),
+    # Scan right
+    Frame(pan=30, dt=0.6),
+    # Return to center
+    Frame(pan=0, tilt=0, dt=0.3),
+)
+
+@safe_gesture
+def scout_mode(car, speed='med', tail=True):
+    """FORWARD+HEAD - Move 20cm forward, scan around"""
+    run_gesture(car, 'scout_mode', speed, tail)
 
-        # Pause at bottom
-        _sleep(0.4, speed)
 
-        # Return to center
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
+_INVESTIGATE_NOISE = (
+    # Quick snap to right (investigating sound)
+    Frame(pan=40, smooth=False),
+    Frame(tilt=5, dt=0.2),
+    # Hold and "listen"
+    Frame(dt=0.8),
+    # Return to center
+    Frame(pan=0, tilt=0, dt=0.3),
+)
 
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+@safe_gesture
+def investigate_noise(car, speed='med', tail=True):
+    """HEAD ONLY - Snap turn to one side, hold, listen"""
+    run_gesture(car, 'investigate_noise', speed, tail)
+
+
+_SCAN_ENVIRONMENT = (
+    # Scan to left
+    Frame(pan=-35, dt=0.5),
+    # Hold at left
+    Frame(dt=0.3),
+    # Scan to center
+    Frame(pan=0, dt=0.4),
+    # Hold at center
+    Frame(dt=0.3),
+    # Scan to right
+    Frame(pan=35, dt=0.5),
+    # Hold at right
+    Frame(dt=0.3),
+    # Return to center
+    Frame(pan=0, dt=0.4),
+)
+
+@safe_gesture
+def scan_environment(car, speed='med', tail=True):
+    """HEAD ONLY - Methodical left-center-right scan"""
+    run_gesture(car, 'scan_environment', speed, tail)
+
+
+_APPROACH_OBJECT = (
+    # Tilt camera down to watch approach
+    Frame(tilt=-15, dt=0.3),
+    # Move forward smoothly
+    Frame(m1=18, m2=-18, dt=0.18),  # ~15cm forward
+    # Hold and observe
+    Frame(m1=0, m2=0, dt=0.4),
+    # Return camera to center
+    Frame(tilt=0, dt=0.3),
+)
+
+@safe_gesture
+def approach_object(car, speed='med', tail=True):
+    """FORWARD - Smooth 15cm forward, look down"""
+    run_gesture(car, 'approach_object', speed, tail)
 
 
-def look_up(car, speed='med'):
-    """STATIC - Just tilt camera up 35°, hold"""
-    try:
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(35, smooth=True)
-        _sleep(0.5, speed)
-        # Don't reset camera - leave it looking up for better view
-    except Exception:
-        try:
-            car.stop()
-        except Exception:
-            pass
+_AVOID_OBJECT = (
+    # Quick backward movement
+    Frame(m1=-22, m2=22, dt=0.14),  # ~15cm backward
+    # Turn 45° to avoid
+    Frame(steer=35, m1=0, m2=0, dt=0.2),
+    Frame(m1=15, m2=-15, dt=0.15),
+    # Return steering to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
 
+@safe_gesture
+def avoid_object(car, speed='med', tail=True):
+    """BACKWARD - Quick 15cm back, turn 45°"""
+    run_gesture(car, 'avoid_object', speed, tail)
 
-def inspect_floor(car, speed='med'):
-    """STATIC - Tilt down and move forward slightly to inspect floor"""
-    try:
-        # Tilt camera down to look at floor
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(-30, smooth=True)
-        _sleep(0.4, speed)
-
-        # Slight forward movement to get closer
-        car.set_motor_speed(1, 15)
-        car.set_motor_speed(2, -15)
-        _sleep(0.13, speed)  # Move ~10cm forward
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Hold position and observe
-        _sleep(0.6, speed)
-
-        # Return to center
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+# ============================================================================
+# MOVEMENT GESTURES (16) - REAL LOCOMOTION
+# ============================================================================
 
-def look_around_nervously(car, speed='med'):
-    """HEAD ONLY - Quick pan snaps left-right-left, nervous energy"""
-    try:
-        # Quick snap to right
-        car.set_cam_pan_angle(35, smooth=False)
-        _sleep(0.15, speed)
+_CIRCLE_DANCE = (
+    # Set steering for turning in place
+    Frame(steer=40, dt=0.2),
+    # Spin 360° - differential steering creates rotation
+    Frame(m1=20, m2=-20, dt=1.5),  # Duration for ~360° turn
+    # Return steering to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
+
+@safe_gesture
+def circle_dance(car, speed='med', tail=True):
+    """SPIN - 360° turn at speed 20"""
+    run_gesture(car, 'circle_dance', speed, tail)
+
+
+_WIGGLE_AND_WAIT = (
+    # Shift weight right
+    Frame(steer=25, dt=0.3),
+    # Shift weight left
+    Frame(steer=-25, dt=0.3),
+    # Shift right again
+    Frame(steer=25, dt=0.3),
+    # Shift left again
+    Frame(steer=-25, dt=0.3),
+    # Return to center
+    Frame(steer=0, dt=0.3),
+)
+
+@safe_gesture
+def wiggle_and_wait(car, speed='med', tail=True):
+    """DANCE - Side-to-side weight shift (differential)"""
+    run_gesture(car, 'wiggle_and_wait', speed, tail)
 
-        # Quick snap to left
-        car.set_cam_pan_angle(-35, smooth=False)
-        _sleep(0.2, speed)
 
-        # Quick snap back to right
-        car.set_cam_pan_angle(30, smooth=False)
-        _sleep(0.15, speed)
+_BUMP_CHECK = (
+    # Move forward 5cm
+    Frame(m1=18, m2=-18, dt=0.06),
+    # Pause
+    Frame(m1=0, m2=0, dt=0.3),
+    # Move back 3cm
+    Frame(m1=-18, m2=18, dt=0.04),
+    Frame(m1=0, m2=0, dt=0.2),
+)
 
-        # Quick snap to center
-        car.set_cam_pan_angle(0, smooth=False)
-        _sleep(0.2, speed)
+@safe_gesture
+def bump_check(car, speed='med', tail=True):
+    """FORWARD-STOP - 5cm fwd, pause, 3cm back"""
+    run_gesture(car, 'bump_check', speed, tail)
 
-        # Quick snap left again
-        car.set_cam_pan_angle(-25, smooth=False)
-        _sleep(0.15, speed)
 
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.3, speed)
+_APPROACH_GENTLY = (
+    # Gentle forward motion
+    Frame(m1=12, m2=-12, dt=0.5),  # ~30cm at slow speed
+    Frame(m1=0, m2=0, dt=0.2),
+)
 
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+@safe_gesture
+def approach_gently(car, speed='med', tail=True):
+    """SLOW FORWARD - 30cm at speed 12"""
+    run_gesture(car, 'approach_gently', speed, tail)
 
 
-def curious_peek(car, speed='med'):
-    """STATIC+HEAD - Lean forward 10cm, tilt head 20°"""
-    try:
-        # Move forward slightly (lean in)
-        car.set_motor_speed(1, 15)
-        car.set_motor_speed(2, -15)
-        _sleep(0.13, speed)  # ~10cm forward
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Tilt head to peek
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(20, smooth=True)
-        _sleep(0.5, speed)
-
-        # Hold peek position
-        _sleep(0.4, speed)
-
-        # Return head to center
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_HAPPY_SPIN = (
+    # Set steering for turning
+    Frame(steer=40, dt=0.2),
+    # Fast double spin 720°
+    Frame(m1=25, m2=-25, dt=2.5),  # Duration for ~720° turn
+    # Return steering to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
 
+@safe_gesture
+def happy_spin(car, speed='med', tail=True):
+    """FAST SPIN - 720° double rotation speed 25"""
+    run_gesture(car, 'happy_spin', speed, tail)
+
+
+_EAGER_START = (
+    # Forward bounce
+    Frame(m1=22, m2=-22, dt=0.05),
+    Frame(m1=0, m2=0, dt=0.1),
+    # Back bounce
+    Frame(m1=-20, m2=20, dt=0.04),
+    Frame(m1=0, m2=0, dt=0.1),
+    # Forward bounce again
+    Frame(m1=22, m2=-22, dt=0.05),
+    Frame(m1=0, m2=0, dt=0.1),
+    # Back bounce again
+    Frame(m1=-20, m2=20, dt=0.04),
+    Frame(m1=0, m2=0, dt=0.2),
+)
+
+@safe_gesture
+def eager_start(car, speed='med', tail=True):
+    """BOUNCE - Fwd 5cm, back 3cm, fwd 5cm, back 3cm"""
+    run_gesture(car, 'eager_start', speed, tail)
+
+
+_SHOW_OFF = (
+    # Quick 180° spin right
+    Frame(steer=40, m1=28, m2=-28, dt=0.75),  # ~180° turn
+    # Pause
+    Frame(m1=0, m2=0, dt=0.4),
+    # Quick 180° spin back left
+    Frame(steer=-40, m1=28, m2=-28, dt=0.75),  # ~180° turn back
+    # Return to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
+
+@safe_gesture
+def show_off(car, speed='med', tail=True):
+    """SPIN+STOP - Quick 180° spin, pause, 180° back"""
+    run_gesture(car, 'show_off', speed, tail)
 
-def reverse_peek(car, speed='med'):
-    """STATIC+HEAD - Back 10cm, tilt head sideways"""
-    try:
-        # Move backward (retreat)
-        car.set_motor_speed(1, -15)
-        car.set_motor_speed(2, 15)
-        _sleep(0.13, speed)  # ~10cm backward
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Tilt head sideways to peek
-        car.set_cam_pan_angle(30, smooth=True)
-        car.set_cam_tilt_angle(15, smooth=True)
-        _sleep(0.5, speed)
-
-        # Hold peek position
-        _sleep(0.4, speed)
-
-        # Return head to center
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_ZIGZAG = (
+    # Forward with left turn
+    Frame(steer=-30, m1=20, m2=-20, dt=0.12),  # ~10cm
+    # Forward with right turn
+    Frame(steer=30, m1=0, m2=0, dt=0.1),
+    Frame(m1=20, m2=-20, dt=0.12),  # ~10cm
+    # Return to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
 
-def head_spin_survey(car, speed='med'):
-    """HEAD ONLY - Slow 360° pan rotation"""
-    try:
-        # Start from center
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.2, speed)
+@safe_gesture
+def zigzag(car, speed='med', tail=True):
+    """ZIGZAG - Fwd 10cm turn left, fwd 10cm turn right"""
+    run_gesture(car, 'zigzag', speed, tail)
 
-        # Slow continuous pan to create 360° effect
-        # Pan left
-        car.set_cam_pan_angle(-50, smooth=True)
-        _sleep(0.6, speed)
 
-        # Continue panning through right
-        car.set_cam_pan_angle(50, smooth=True)
-        _sleep(1.2, speed)  # Slow sweep across
+_CHARGE_FORWARD = (
+    # Fast forward charge
+    Frame(m1=35, m2=-35, dt=0.25),  # ~40cm at high speed
+    Frame(m1=0, m2=0, dt=0.2),
+)
 
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.6, speed)
+@safe_gesture
+def charge_forward(car, speed='med', tail=True):
+    """BURST - 40cm forward at speed 35"""
+    run_gesture(car, 'charge_forward', speed, tail)
 
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_RETREAT_FAST = (
+    # Fast backward retreat
+    Frame(m1=-30, m2=30, dt=0.28),  # ~40cm backward
+    Frame(m1=0, m2=0, dt=0.2),
+)
 
-def alert_scan(car, speed='med'):
-    """HEAD ONLY - Fast pan -40° +40° -40°"""
-    try:
-        # Fast snap left
-        car.set_cam_pan_angle(-40, smooth=False)
-        _sleep(0.2, speed)
+@safe_gesture
+def retreat_fast(car, speed='med', tail=True):
+    """BURST BACK - 40cm backward at speed 30"""
+    run_gesture(car, 'retreat_fast', speed, tail)
+
+
+_PATROL_MODE = (
+    # Forward 20cm
+    Frame(m1=20, m2=-20, dt=0.22),
+    Frame(m1=0, m2=0, dt=0.2),
+    # Turn 90° right
+    Frame(steer=40, m1=22, m2=-22, dt=0.6),  # ~90° turn
+    # Forward 20cm
+    Frame(steer=0, m1=0, m2=0, dt=0.1),
+    Frame(m1=20, m2=-20, dt=0.22),
+    Frame(m1=0, m2=0, dt=0.2),
+)
+
+@safe_gesture
+def patrol_mode(car, speed='med', tail=True):
+    """PATROL - Fwd 20cm, turn 90°, fwd 20cm"""
+    run_gesture(car, 'patrol_mode', speed, tail)
+
+
+_MOONWALK = (
+    # Sway left while moving backward
+    Frame(steer=-20, m1=-18, m2=18, dt=0.15),
+    # Sway right while moving backward
+    Frame(steer=20, dt=0.1),
+    Frame(dt=0.15),
+    # Sway left while moving backward
+    Frame(steer=-20, dt=0.1),
+    Frame(dt=0.15),
+    # Return to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
+
+@safe_gesture
+def moonwalk(car, speed='med', tail=True):
+    """BACKWARD DANCE - Smooth backward 25cm with sway"""
+    run_gesture(car, 'moonwalk', speed, tail)
 
-        # Fast snap right
-        car.set_cam_pan_angle(40, smooth=False)
-        _sleep(0.2, speed)
 
-        # Fast snap left again
-        car.set_cam_pan_angle(-40, smooth=False)
-        _sleep(0.2, speed)
+_BALLET_SPIN = (
+    # Set steering for gentle turn
+    Frame(steer=35, dt=0.2),
+    # Slow graceful 360° spin
+    Frame(m1=15, m2=-15, dt=2.0),  # Slow elegant rotation
+    # Return steering to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
 
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.3, speed)
+@safe_gesture
+def ballet_spin(car, speed='med', tail=True):
+    """GRACEFUL SPIN - Slow 360° turn speed 15"""
+    run_gesture(car, 'ballet_spin', speed, tail)
 
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_FIGURE_EIGHT = (
+    # First curve - turn left while moving forward
+    Frame(steer=-35, m1=20, m2=-20, dt=0.8),
+    # Second curve - turn right while moving forward
+    Frame(steer=35, dt=0.1),
+    Frame(dt=0.8),
+    # Return to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
 
-def search_pattern(car, speed='med'):
-    """HEAD+SLOW TURN - Pan while slow 90° turn"""
-    try:
-        # Start panning head left
-        car.set_cam_pan_angle(-35, smooth=True)
-        _sleep(0.3, speed)
-
-        # Turn body slowly right while panning head
-        car.set_dir_servo_angle(30, smooth=True)
-        _sleep(0.2, speed)
-        car.set_motor_speed(1, 12)
-        car.set_motor_speed(2, -12)
-        _sleep(0.5, speed)  # Slow turn
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Pan head right while body settles
-        car.set_cam_pan_angle(35, smooth=True)
-        _sleep(0.6, speed)
-
-        # Return to center
-        car.set_dir_servo_angle(0, smooth=True)
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+@safe_gesture
+def figure_eight(car, speed='med', tail=True):
+    """FIGURE 8 - Flowing S-curve path"""
+    run_gesture(car, 'figure_eight', speed, tail)
 
 
-def scout_mode(car, speed='med'):
-    """FORWARD+HEAD - Move 20cm forward, scan around"""
-    try:
-        # Look ahead
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(-10, smooth=True)
-        _sleep(0.2, speed)
-
-        # Move forward
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.22, speed)  # ~20cm forward
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Scan left
-        car.set_cam_pan_angle(-30, smooth=True)
-        _sleep(0.4, speed)
-
-        # Scan right
-        car.set_cam_pan_angle(30, smooth=True)
-        _sleep(0.6, speed)
-
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_CRESCENT_ARC_LEFT = (
+    # Arc left while moving forward
+    Frame(steer=-30, m1=22, m2=-22, dt=0.9),  # Wide arc
+    # Return to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
 
+@safe_gesture
+def crescent_arc_left(car, speed='med', tail=True):
+    """ARC LEFT - Wide arc turn going forward"""
+    run_gesture(car, 'crescent_arc_left', speed, tail)
 
-def investigate_noise(car, speed='med'):
-    """HEAD ONLY - Snap turn to one side, hold, listen"""
-    try:
-        # Quick snap to right (investigating sound)
-        car.set_cam_pan_angle(40, smooth=False)
-        car.set_cam_tilt_angle(5, smooth=True)
-        _sleep(0.2, speed)
 
-        # Hold and "listen"
-        _sleep(0.8, speed)
+_CRESCENT_ARC_RIGHT = (
+    # Arc right while moving forward
+    Frame(steer=30, m1=22, m2=-22, dt=0.9),  # Wide arc
+    # Return to center
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
 
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
+@safe_gesture
+def crescent_arc_right(car, speed='med', tail=True):
+    """ARC RIGHT - Wide arc turn going forward"""
+    run_gesture(car, 'crescent_arc_right', speed, tail)
 
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+# ============================================================================
+# REACTIONS GESTURES (13) - QUICK/JERKY responses
+# ============================================================================
 
+_RECOIL_SURPRISE = (
+    # Sudden backward jerk
+    # Snap head up simultaneously
+    Frame(tilt=30, m1=-35, m2=35, dt=0.08, smooth=False),  # Short burst
+    # Hold surprised pose
+    Frame(m1=0, m2=0, dt=0.5),
+    # Return head
+    Frame(tilt=0, dt=0.3),
+)
+
+@safe_gesture
+def recoil_surprise(car, speed='med', tail=True):
+    """FAST JERK - Quick 12cm back + head snap up"""
+    run_gesture(car, 'recoil_surprise', speed, tail)
 
-def scan_environment(car, speed='med'):
-    """HEAD ONLY - Methodical left-center-right scan"""
-    try:
-        # Scan to left
-        car.set_cam_pan_angle(-35, smooth=True)
-        _sleep(0.5, speed)
 
-        # Hold at left
-        _sleep(0.3, speed)
+_FLINCH = (
+    # Quick flinch backward + head snap left
+    Frame(pan=-40, m1=-30, m2=30, dt=0.04, smooth=False),  # Very short
+    Frame(m1=0, m2=0, dt=0.2),
+    # Return head
+    Frame(pan=0, dt=0.3),
+)
 
-        # Scan to center
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.4, speed)
+@safe_gesture
+def flinch(car, speed='med', tail=True):
+    """INSTANT JERK - 5cm back + pan away fast"""
+    run_gesture(car, 'flinch', speed, tail)
+
+
+_TWITCHY_NERVOUS = (
+    # Twitch 1: pan right
+    Frame(pan=20, dt=0.08, smooth=False),
+    # Twitch 2: pan left
+    Frame(pan=-25, dt=0.08, smooth=False),
+    # Twitch 3: tilt down
+    Frame(tilt=-15, dt=0.08, smooth=False),
+    # Twitch 4: pan center
+    Frame(pan=0, dt=0.08, smooth=False),
+    # Twitch 5: tilt up
+    Frame(tilt=10, dt=0.08, smooth=False),
+    # Return to center
+    Frame(pan=0, tilt=0, dt=0.2),
+)
+
+@safe_gesture
+def twitchy_nervous(car, speed='med', tail=True):
+    """RAPID TWITCHES - Fast servo snaps, no wheels"""
+    run_gesture(car, 'twitchy_nervous', speed, tail)
+
+
+_ANGRY_SHAKE = (
+    # Shake left-right-left-right rapidly
+    Frame(pan=-30, dt=0.1, smooth=False),
+    Frame(pan=30, dt=0.1, smooth=False),
+    Frame(pan=-30, dt=0.1, smooth=False),
+    Frame(pan=30, dt=0.1, smooth=False),
+    Frame(pan=-30, dt=0.1, smooth=False),
+    # Return to center
+    Frame(pan=0, dt=0.3),
+)
+
+@safe_gesture
+def angry_shake(car, speed='med', tail=True):
+    """VIOLENT SHAKE - Fast pan oscillations"""
+    run_gesture(car, 'angry_shake', speed, tail)
 
-        # Hold at center
-        _sleep(0.3, speed)
 
-        # Scan to right
-        car.set_cam_pan_angle(35, smooth=True)
-        _sleep(0.5, speed)
+_BOUNCE_UNIT = (
+    # Forward bounce
+    Frame(m1=25, m2=-25, dt=0.04),
+    Frame(m1=0, m2=0, dt=0.06),
+    # Backward bounce
+    Frame(m1=-25, m2=25, dt=0.04),
+    Frame(m1=0, m2=0, dt=0.06),
+)
 
-        # Hold at right
-        _sleep(0.3, speed)
+# Unrolled at import so playback walks one flat table with no loop
+_PLAYFUL_BOUNCE = _BOUNCE_UNIT * 4
 
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.4, speed)
+@safe_gesture
+def playful_bounce(car, speed='med', tail=True):
+    """BOUNCE - Rapid fwd-back-fwd-back 4cm pulses"""
+    run_gesture(car, 'playful_bounce', speed, tail)
 
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_BACKFLIP_ATTEMPT = (
+    # Sudden backward burst with head tilt up
+    Frame(tilt=35, m1=-40, m2=40, dt=0.08, smooth=False),
+    # Hold
+    Frame(m1=0, m2=0, dt=0.4),
+    # Return head
+    Frame(tilt=0, dt=0.3),
+)
 
-def approach_object(car, speed='med'):
-    """FORWARD - Smooth 15cm forward, look down"""
-    try:
-        # Tilt camera down to watch approach
-        car.set_cam_tilt_angle(-15, smooth=True)
-        _sleep(0.3, speed)
+@safe_gesture
+def backflip_attempt(car, speed='med', tail=True):
+    """BURST BACK - 15cm sudden backward + head up"""
+    run_gesture(car, 'backflip_attempt', speed, tail)
 
-        # Move forward smoothly
-        car.set_motor_speed(1, 18)
-        car.set_motor_speed(2, -18)
-        _sleep(0.18, speed)  # ~15cm forward
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
 
-        # Hold and observe
-        _sleep(0.4, speed)
+_DEFENSIVE_CURL = (
+    # Retreat backward
+    Frame(tilt=-25, m1=-22, m2=22, dt=0.2),  # ~20cm back
+    # Hold defensive position
+    Frame(m1=0, m2=0, dt=0.6),
+    # Return head
+    Frame(tilt=0, dt=0.3),
+)
 
-        # Return camera to center
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
+@safe_gesture
+def defensive_curl(car, speed='med', tail=True):
+    """RETREAT - 20cm back + head down defensive"""
+    run_gesture(car, 'defensive_curl', speed, tail)
 
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_JUMP_UNIT = (
+    Frame(m1=30, m2=-30, dt=0.025),  # Very short pulse
+    Frame(m1=0, m2=0, dt=0.05),  # Quick pause between
+)
 
-def avoid_object(car, speed='med'):
-    """BACKWARD - Quick 15cm back, turn 45°"""
-    try:
-        # Quick backward movement
-        car.set_motor_speed(1, -22)
-        car.set_motor_speed(2, 22)
-        _sleep(0.14, speed)  # ~15cm backward
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Turn 45° to avoid
-        car.set_dir_servo_angle(35, smooth=True)
-        _sleep(0.2, speed)
-        car.set_motor_speed(1, 15)
-        car.set_motor_speed(2, -15)
-        _sleep(0.15, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return steering to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_JUMP_EXCITED = _JUMP_UNIT * 6 + (Frame(dt=0.2),)
 
+@safe_gesture
+def jump_excited(car, speed='med', tail=True):
+    """RAPID PULSES - 6x quick 3cm forward jumps"""
+    run_gesture(car, 'jump_excited', speed, tail)
 
-# ============================================================================
-# MOVEMENT GESTURES (16) - REAL LOCOMOTION
-# ============================================================================
 
-def circle_dance(car, speed='med'):
-    """SPIN - 360° turn at speed 20"""
-    try:
-        # Set steering for turning in place
-        car.set_dir_servo_angle(40, smooth=True)
-        _sleep(0.2, speed)
-
-        # Spin 360° - differential steering creates rotation
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(1.5, speed)  # Duration for ~360° turn
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return steering to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_QUICK_LOOK_LEFT = (
+    # Snap left
+    Frame(pan=-40, dt=0.4, smooth=False),
+    # Return
+    Frame(pan=0, dt=0.2),
+)
 
+@safe_gesture
+def quick_look_left(car, speed='med', tail=True):
+    """HEAD SNAP - Instant pan left, hold, return"""
+    run_gesture(car, 'quick_look_left', speed, tail)
 
-def wiggle_and_wait(car, speed='med'):
-    """DANCE - Side-to-side weight shift (differential)"""
-    try:
-        # Shift weight right
-        car.set_dir_servo_angle(25, smooth=True)
-        _sleep(0.3, speed)
 
-        # Shift weight left
-        car.set_dir_servo_angle(-25, smooth=True)
-        _sleep(0.3, speed)
+_QUICK_LOOK_RIGHT = (
+    # Snap right
+    Frame(pan=40, dt=0.4, smooth=False),
+    # Return
+    Frame(pan=0, dt=0.2),
+)
 
-        # Shift right again
-        car.set_dir_servo_angle(25, smooth=True)
-        _sleep(0.3, speed)
+@safe_gesture
+def quick_look_right(car, speed='med', tail=True):
+    """HEAD SNAP - Instant pan right, hold, return"""
+    run_gesture(car, 'quick_look_right', speed, tail)
 
-        # Shift left again
-        car.set_dir_servo_angle(-25, smooth=True)
-        _sleep(0.3, speed)
 
-        # Return to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
+_SHOW_SURPRISE = (
+    # Sudden backward + head up + pan
+    Frame(pan=25, tilt=30, m1=-32, m2=32, dt=0.06, smooth=False),
+    # Hold surprised look
+    Frame(m1=0, m2=0, dt=0.5),
+    # Return
+    Frame(pan=0, tilt=0, dt=0.3),
+)
 
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+@safe_gesture
+def show_surprise(car, speed='med', tail=True):
+    """BURST - Quick 8cm back + head snap up + pan wide"""
+    run_gesture(car, 'show_surprise', speed, tail)
 
 
-def bump_check(car, speed='med'):
-    """FORWARD-STOP - 5cm fwd, pause, 3cm back"""
-    try:
-        # Move forward 5cm
-        car.set_motor_speed(1, 18)
-        car.set_motor_speed(2, -18)
-        _sleep(0.06, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Pause
-        _sleep(0.3, speed)
-
-        # Move back 3cm
-        car.set_motor_speed(1, -18)
-        car.set_motor_speed(2, 18)
-        _sleep(0.04, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        _sleep(0.2, speed)
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_SHOW_FEAR = (
+    # Fast backward retreat + head down
+    Frame(tilt=-30, m1=-28, m2=28, dt=0.2),  # ~25cm back
+    # Hold fearful position
+    Frame(m1=0, m2=0, dt=0.6),
+    # Return head
+    Frame(tilt=0, dt=0.3),
+)
 
+@safe_gesture
+def show_fear(car, speed='med', tail=True):
+    """FEAR - 25cm fast retreat + head down"""
+    run_gesture(car, 'show_fear', speed, tail)
 
-def approach_gently(car, speed='med'):
-    """SLOW FORWARD - 30cm at speed 12"""
-    try:
-        # Gentle forward motion
-        car.set_motor_speed(1, 12)
-        car.set_motor_speed(2, -12)
-        _sleep(0.5, speed)  # ~30cm at slow speed
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        _sleep(0.2, speed)
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_SHOW_DISGUST = (
+    # Sharp pan away + small backward
+    Frame(pan=-35, tilt=15, m1=-18, m2=18, dt=0.08, smooth=False),
+    # Hold disgusted look
+    Frame(m1=0, m2=0, dt=0.5),
+    # Return
+    Frame(pan=0, tilt=0, dt=0.3),
+)
 
-def happy_spin(car, speed='med'):
-    """FAST SPIN - 720° double rotation speed 25"""
-    try:
-        # Set steering for turning
-        car.set_dir_servo_angle(40, smooth=True)
-        _sleep(0.2, speed)
-
-        # Fast double spin 720°
-        car.set_motor_speed(1, 25)
-        car.set_motor_speed(2, -25)
-        _sleep(2.5, speed)  # Duration for ~720° turn
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return steering to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+@safe_gesture
+def show_disgust(car, speed='med', tail=True):
+    """RECOIL - Pan away sharp + slight back"""
+    run_gesture(car, 'show_disgust', speed, tail)
 
 
-def eager_start(car, speed='med'):
-    """BOUNCE - Fwd 5cm, back 3cm, fwd 5cm, back 3cm"""
-    try:
-        # Forward bounce
-        car.set_motor_speed(1, 22)
-        car.set_motor_speed(2, -22)
-        _sleep(0.05, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        _sleep(0.1, speed)
-
-        # Back bounce
-        car.set_motor_speed(1, -20)
-        car.set_motor_speed(2, 20)
-        _sleep(0.04, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        _sleep(0.1, speed)
-
-        # Forward bounce again
-        car.set_motor_speed(1, 22)
-        car.set_motor_speed(2, -22)
-        _sleep(0.05, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        _sleep(0.1, speed)
-
-        # Back bounce again
-        car.set_motor_speed(1, -20)
-        car.set_motor_speed(2, 20)
-        _sleep(0.04, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        _sleep(0.2, speed)
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+# ============================================================================
+# SOCIAL GESTURES (14) - STATIC POSES or SLOW SEQUENCES
+# ============================================================================
 
-def show_off(car, speed='med'):
-    """SPIN+STOP - Quick 180° spin, pause, 180° back"""
-    try:
-        # Quick 180° spin right
-        car.set_dir_servo_angle(40, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 28)
-        car.set_motor_speed(2, -28)
-        _sleep(0.75, speed)  # ~180° turn
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Pause
-        _sleep(0.4, speed)
-
-        # Quick 180° spin back left
-        car.set_dir_servo_angle(-40, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 28)
-        car.set_motor_speed(2, -28)
-        _sleep(0.75, speed)  # ~180° turn back
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_BOW_RESPECTFULLY = (
+    # Slow bow down
+    Frame(tilt=-35, dt=0.8),  # Slow descent
+    # Hold bow
+    Frame(dt=0.6),
+    # Slow return up
+    Frame(tilt=0, dt=0.8),
+)
+
+@safe_gesture
+def bow_respectfully(car, speed='med', tail=True):
+    """SLOW BOW - Gradual tilt down, hold, gradual up"""
+    run_gesture(car, 'bow_respectfully', speed, tail)
 
 
-def zigzag(car, speed='med'):
-    """ZIGZAG - Fwd 10cm turn left, fwd 10cm turn right"""
-    try:
-        # Forward with left turn
-        car.set_dir_servo_angle(-30, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.12, speed)  # ~10cm
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Forward with right turn
-        car.set_dir_servo_angle(30, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.12, speed)  # ~10cm
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_BOW_APOLOGETICALLY = (
+    # Very slow deep bow
+    Frame(tilt=-40, dt=1.2),  # Very slow descent
+    # Long hold
+    Frame(dt=1.0),
+    # Slow return
+    Frame(tilt=0, dt=1.0),
+)
 
+@safe_gesture
+def bow_apologetically(car, speed='med', tail=True):
+    """DEEP SLOW BOW - Very gradual deep tilt, long hold"""
+    run_gesture(car, 'bow_apologetically', speed, tail)
 
-def charge_forward(car, speed='med'):
-    """BURST - 40cm forward at speed 35"""
-    try:
-        # Fast forward charge
-        car.set_motor_speed(1, 35)
-        car.set_motor_speed(2, -35)
-        _sleep(0.25, speed)  # ~40cm at high speed
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        _sleep(0.2, speed)
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_INTRO_POSE = (
+    Frame(pan=0, tilt=20, dt=0.5),
+    # Hold proud pose
+    Frame(dt=0.8),
+)
 
-def retreat_fast(car, speed='med'):
-    """BURST BACK - 40cm backward at speed 30"""
-    try:
-        # Fast backward retreat
-        car.set_motor_speed(1, -30)
-        car.set_motor_speed(2, 30)
-        _sleep(0.28, speed)  # ~40cm backward
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        _sleep(0.2, speed)
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+@safe_gesture
+def intro_pose(car, speed='med', tail=True):
+    """STATIC - Head up 20°, hold proud"""
+    run_gesture(car, 'intro_pose', speed, tail)
 
 
-def patrol_mode(car, speed='med'):
-    """PATROL - Fwd 20cm, turn 90°, fwd 20cm"""
-    try:
-        # Forward 20cm
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.22, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        _sleep(0.2, speed)
-
-        # Turn 90° right
-        car.set_dir_servo_angle(40, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 22)
-        car.set_motor_speed(2, -22)
-        _sleep(0.6, speed)  # ~90° turn
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Forward 20cm
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.22, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        _sleep(0.2, speed)
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_END_POSE = (
+    Frame(pan=0, tilt=0, steer=0, dt=0.5),
+    # Hold still
+    Frame(dt=0.6),
+)
 
+@safe_gesture
+def end_pose(car, speed='med', tail=True):
+    """STATIC - Return to center, composed stillness"""
+    run_gesture(car, 'end_pose', speed, tail)
 
-def moonwalk(car, speed='med'):
-    """BACKWARD DANCE - Smooth backward 25cm with sway"""
-    try:
-        # Sway left while moving backward
-        car.set_dir_servo_angle(-20, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, -18)
-        car.set_motor_speed(2, 18)
-        _sleep(0.15, speed)
-
-        # Sway right while moving backward
-        car.set_dir_servo_angle(20, smooth=True)
-        _sleep(0.1, speed)
-        _sleep(0.15, speed)
-
-        # Sway left while moving backward
-        car.set_dir_servo_angle(-20, smooth=True)
-        _sleep(0.1, speed)
-        _sleep(0.15, speed)
-
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def ballet_spin(car, speed='med'):
-    """GRACEFUL SPIN - Slow 360° turn speed 15"""
-    try:
-        # Set steering for gentle turn
-        car.set_dir_servo_angle(35, smooth=True)
-        _sleep(0.2, speed)
-
-        # Slow graceful 360° spin
-        car.set_motor_speed(1, 15)
-        car.set_motor_speed(2, -15)
-        _sleep(2.0, speed)  # Slow elegant rotation
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return steering to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def figure_eight(car, speed='med'):
-    """FIGURE 8 - Flowing S-curve path"""
-    try:
-        # First curve - turn left while moving forward
-        car.set_dir_servo_angle(-35, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.8, speed)
-
-        # Second curve - turn right while moving forward
-        car.set_dir_servo_angle(35, smooth=True)
-        _sleep(0.1, speed)
-        _sleep(0.8, speed)
-
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def crescent_arc_left(car, speed='med'):
-    """ARC LEFT - Wide arc turn going forward"""
-    try:
-        # Arc left while moving forward
-        car.set_dir_servo_angle(-30, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 22)
-        car.set_motor_speed(2, -22)
-        _sleep(0.9, speed)  # Wide arc
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def crescent_arc_right(car, speed='med'):
-    """ARC RIGHT - Wide arc turn going forward"""
-    try:
-        # Arc right while moving forward
-        car.set_dir_servo_angle(30, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 22)
-        car.set_motor_speed(2, -22)
-        _sleep(0.9, speed)  # Wide arc
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-
-        # Return to center
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-# ============================================================================
-# REACTIONS GESTURES (13) - QUICK/JERKY responses
-# ============================================================================
-
-def recoil_surprise(car, speed='med'):
-    """FAST JERK - Quick 12cm back + head snap up"""
-    try:
-        # Sudden backward jerk
-        car.set_motor_speed(1, -35)
-        car.set_motor_speed(2, 35)
-        car.set_cam_tilt_angle(30, smooth=False)  # Snap head up simultaneously
-        _sleep(0.08, speed)  # Short burst
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold surprised pose
-        _sleep(0.5, speed)
-        
-        # Return head
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def flinch(car, speed='med'):
-    """INSTANT JERK - 5cm back + pan away fast"""
-    try:
-        # Quick flinch backward + head snap left
-        car.set_motor_speed(1, -30)
-        car.set_motor_speed(2, 30)
-        car.set_cam_pan_angle(-40, smooth=False)
-        _sleep(0.04, speed)  # Very short
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        _sleep(0.2, speed)
-        
-        # Return head
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def twitchy_nervous(car, speed='med'):
-    """RAPID TWITCHES - Fast servo snaps, no wheels"""
-    try:
-        # Twitch 1: pan right
-        car.set_cam_pan_angle(20, smooth=False)
-        _sleep(0.08, speed)
-        
-        # Twitch 2: pan left
-        car.set_cam_pan_angle(-25, smooth=False)
-        _sleep(0.08, speed)
-        
-        # Twitch 3: tilt down
-        car.set_cam_tilt_angle(-15, smooth=False)
-        _sleep(0.08, speed)
-        
-        # Twitch 4: pan center
-        car.set_cam_pan_angle(0, smooth=False)
-        _sleep(0.08, speed)
-        
-        # Twitch 5: tilt up
-        car.set_cam_tilt_angle(10, smooth=False)
-        _sleep(0.08, speed)
-        
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def angry_shake(car, speed='med'):
-    """VIOLENT SHAKE - Fast pan oscillations"""
-    try:
-        # Shake left-right-left-right rapidly
-        car.set_cam_pan_angle(-30, smooth=False)
-        _sleep(0.1, speed)
-        car.set_cam_pan_angle(30, smooth=False)
-        _sleep(0.1, speed)
-        car.set_cam_pan_angle(-30, smooth=False)
-        _sleep(0.1, speed)
-        car.set_cam_pan_angle(30, smooth=False)
-        _sleep(0.1, speed)
-        car.set_cam_pan_angle(-30, smooth=False)
-        _sleep(0.1, speed)
-        
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def playful_bounce(car, speed='med'):
-    """BOUNCE - Rapid fwd-back-fwd-back 4cm pulses"""
-    try:
-        for _ in range(4):
-            # Forward bounce
-            car.set_motor_speed(1, 25)
-            car.set_motor_speed(2, -25)
-            _sleep(0.04, speed)
-            car.set_motor_speed(1, 0)
-            car.set_motor_speed(2, 0)
-            _sleep(0.06, speed)
-            
-            # Backward bounce
-            car.set_motor_speed(1, -25)
-            car.set_motor_speed(2, 25)
-            _sleep(0.04, speed)
-            car.set_motor_speed(1, 0)
-            car.set_motor_speed(2, 0)
-            _sleep(0.06, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def backflip_attempt(car, speed='med'):
-    """BURST BACK - 15cm sudden backward + head up"""
-    try:
-        # Sudden backward burst with head tilt up
-        car.set_motor_speed(1, -40)
-        car.set_motor_speed(2, 40)
-        car.set_cam_tilt_angle(35, smooth=False)
-        _sleep(0.08, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold
-        _sleep(0.4, speed)
-        
-        # Return head
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def defensive_curl(car, speed='med'):
-    """RETREAT - 20cm back + head down defensive"""
-    try:
-        # Retreat backward
-        car.set_motor_speed(1, -22)
-        car.set_motor_speed(2, 22)
-        car.set_cam_tilt_angle(-25, smooth=True)
-        _sleep(0.2, speed)  # ~20cm back
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold defensive position
-        _sleep(0.6, speed)
-        
-        # Return head
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def jump_excited(car, speed='med'):
-    """RAPID PULSES - 6x quick 3cm forward jumps"""
-    try:
-        for _ in range(6):
-            car.set_motor_speed(1, 30)
-            car.set_motor_speed(2, -30)
-            _sleep(0.025, speed)  # Very short pulse
-            car.set_motor_speed(1, 0)
-            car.set_motor_speed(2, 0)
-            _sleep(0.05, speed)  # Quick pause between
-        
-        _sleep(0.2, speed)
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def quick_look_left(car, speed='med'):
-    """HEAD SNAP - Instant pan left, hold, return"""
-    try:
-        # Snap left
-        car.set_cam_pan_angle(-40, smooth=False)
-        _sleep(0.4, speed)
-        
-        # Return
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def quick_look_right(car, speed='med'):
-    """HEAD SNAP - Instant pan right, hold, return"""
-    try:
-        # Snap right
-        car.set_cam_pan_angle(40, smooth=False)
-        _sleep(0.4, speed)
-        
-        # Return
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def show_surprise(car, speed='med'):
-    """BURST - Quick 8cm back + head snap up + pan wide"""
-    try:
-        # Sudden backward + head up + pan
-        car.set_motor_speed(1, -32)
-        car.set_motor_speed(2, 32)
-        car.set_cam_tilt_angle(30, smooth=False)
-        car.set_cam_pan_angle(25, smooth=False)
-        _sleep(0.06, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold surprised look
-        _sleep(0.5, speed)
-        
-        # Return
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def show_fear(car, speed='med'):
-    """FEAR - 25cm fast retreat + head down"""
-    try:
-        # Fast backward retreat + head down
-        car.set_motor_speed(1, -28)
-        car.set_motor_speed(2, 28)
-        car.set_cam_tilt_angle(-30, smooth=True)
-        _sleep(0.2, speed)  # ~25cm back
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold fearful position
-        _sleep(0.6, speed)
-        
-        # Return head
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def show_disgust(car, speed='med'):
-    """RECOIL - Pan away sharp + slight back"""
-    try:
-        # Sharp pan away + small backward
-        car.set_cam_pan_angle(-35, smooth=False)
-        car.set_cam_tilt_angle(15, smooth=False)
-        car.set_motor_speed(1, -18)
-        car.set_motor_speed(2, 18)
-        _sleep(0.08, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold disgusted look
-        _sleep(0.5, speed)
-        
-        # Return
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-
-# ============================================================================
-# SOCIAL GESTURES (14) - STATIC POSES or SLOW SEQUENCES
-# ============================================================================
-
-def bow_respectfully(car, speed='med'):
-    """SLOW BOW - Gradual tilt down, hold, gradual up"""
-    try:
-        # Slow bow down
-        car.set_cam_tilt_angle(-35, smooth=True)
-        _sleep(0.8, speed)  # Slow descent
-        
-        # Hold bow
-        _sleep(0.6, speed)
-        
-        # Slow return up
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.8, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def bow_apologetically(car, speed='med'):
-    """DEEP SLOW BOW - Very gradual deep tilt, long hold"""
-    try:
-        # Very slow deep bow
-        car.set_cam_tilt_angle(-40, smooth=True)
-        _sleep(1.2, speed)  # Very slow descent
-        
-        # Long hold
-        _sleep(1.0, speed)
-        
-        # Slow return
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(1.0, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def intro_pose(car, speed='med'):
-    """STATIC - Head up 20°, hold proud"""
-    try:
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(20, smooth=True)
-        _sleep(0.5, speed)
-        
-        # Hold proud pose
-        _sleep(0.8, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_GREET_WAVE = (
+    # Continuous wave motion - no pauses
+    Frame(pan=-30, dt=0.5),
+    Frame(pan=30, dt=0.7),
+    Frame(pan=-30, dt=0.7),
+    Frame(pan=0, dt=0.5),
+)
 
-def end_pose(car, speed='med'):
-    """STATIC - Return to center, composed stillness"""
-    try:
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.5, speed)
-        
-        # Hold still
-        _sleep(0.6, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-        except Exception:
-            pass
-
-
-def greet_wave(car, speed='med'):
+@safe_gesture
+def greet_wave(car, speed='med', tail=True):
     """WAVE - Slow continuous pan left-right-left"""
-    try:
-        # Continuous wave motion - no pauses
-        car.set_cam_pan_angle(-30, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_pan_angle(30, smooth=True)
-        _sleep(0.7, speed)
-        
-        car.set_cam_pan_angle(-30, smooth=True)
-        _sleep(0.7, speed)
-        
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def farewell_wave(car, speed='med'):
+    run_gesture(car, 'greet_wave', speed, tail)
+
+
+_FAREWELL_WAVE = (
+    # Start backing slowly while waving
+    # Wave left
+    Frame(pan=-25, m1=-12, m2=12, dt=0.4),
+    # Wave right
+    Frame(pan=25, dt=0.4),
+    # Wave left
+    Frame(pan=-25, dt=0.4),
+    # Stop and center
+    Frame(pan=0, m1=0, m2=0, dt=0.3),
+)
+
+@safe_gesture
+def farewell_wave(car, speed='med', tail=True):
     """WAVE + RETREAT - Pan wave while backing 15cm"""
-    try:
-        # Start backing slowly while waving
-        car.set_motor_speed(1, -12)
-        car.set_motor_speed(2, 12)
-        
-        # Wave left
-        car.set_cam_pan_angle(-25, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Wave right
-        car.set_cam_pan_angle(25, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Wave left
-        car.set_cam_pan_angle(-25, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Stop and center
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'farewell_wave', speed, tail)
 
 
-def hello_friend(car, speed='med'):
-    """APPROACH - Slow 15cm forward + head nod"""
-    try:
-        # Slow forward approach
-        car.set_motor_speed(1, 12)
-        car.set_motor_speed(2, -12)
-        _sleep(0.28, speed)  # ~15cm
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Friendly nod
-        car.set_cam_tilt_angle(-15, smooth=True)
-        _sleep(0.4, speed)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_HELLO_FRIEND = (
+    # Slow forward approach
+    Frame(m1=12, m2=-12, dt=0.28),  # ~15cm
+    # Friendly nod
+    Frame(tilt=-15, m1=0, m2=0, dt=0.4),
+    Frame(tilt=0, dt=0.4),
+)
 
+@safe_gesture
+def hello_friend(car, speed='med', tail=True):
+    """APPROACH - Slow 15cm forward + head nod"""
+    run_gesture(car, 'hello_friend', speed, tail)
 
-def goodbye_friend(car, speed='med'):
-    """SLOW BACK - 20cm retreat + slow head down"""
-    try:
-        # Slow backward + head tilt down gradually
-        car.set_motor_speed(1, -10)
-        car.set_motor_speed(2, 10)
-        car.set_cam_tilt_angle(-25, smooth=True)
-        _sleep(0.45, speed)  # ~20cm slow
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold
-        _sleep(0.4, speed)
-        
-        # Return head
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_GOODBYE_FRIEND = (
+    # Slow backward + head tilt down gradually
+    Frame(tilt=-25, m1=-10, m2=10, dt=0.45),  # ~20cm slow
+    # Hold
+    Frame(m1=0, m2=0, dt=0.4),
+    # Return head
+    Frame(tilt=0, dt=0.5),
+)
 
-def beckon_forward(car, speed='med'):
+@safe_gesture
+def goodbye_friend(car, speed='med', tail=True):
+    """SLOW BACK - 20cm retreat + slow head down"""
+    run_gesture(car, 'goodbye_friend', speed, tail)
+
+
+_BECKON_FORWARD = (
+    # Start backing
+    # Continuous nodding motion
+    Frame(tilt=-20, m1=-12, m2=12, dt=0.3),
+    Frame(tilt=5, dt=0.3),
+    Frame(tilt=-20, dt=0.3),
+    Frame(tilt=0, dt=0.2),
+    # Stop motors
+    Frame(m1=0, m2=0),
+)
+
+@safe_gesture
+def beckon_forward(car, speed='med', tail=True):
     """BECKONING - Continuous nod while backing"""
-    try:
-        # Start backing
-        car.set_motor_speed(1, -12)
-        car.set_motor_speed(2, 12)
-        
-        # Continuous nodding motion
-        car.set_cam_tilt_angle(-20, smooth=True)
-        _sleep(0.3, speed)
-        car.set_cam_tilt_angle(5, smooth=True)
-        _sleep(0.3, speed)
-        car.set_cam_tilt_angle(-20, smooth=True)
-        _sleep(0.3, speed)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        # Stop motors
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'beckon_forward', speed, tail)
+
 
+_WAIT_HERE = (
+    Frame(pan=15, tilt=5, dt=0.4),
+    # Hold idle position
+    Frame(dt=1.0),
+)
 
-def wait_here(car, speed='med'):
+@safe_gesture
+def wait_here(car, speed='med', tail=True):
     """STATIC - Slight pan aside, hold still"""
-    try:
-        car.set_cam_pan_angle(15, smooth=True)
-        car.set_cam_tilt_angle(5, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Hold idle position
-        _sleep(1.0, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'wait_here', speed, tail)
 
 
-def bashful_hide(car, speed='med'):
+_BASHFUL_HIDE = (
+    # Slow retreat + gradual head drop
+    Frame(pan=-15, tilt=-28, m1=-10, m2=10, dt=0.4),  # ~18cm slow retreat
+    # Hold shy position
+    Frame(m1=0, m2=0, dt=0.7),
+    # Gradual return
+    Frame(pan=0, tilt=0, dt=0.6),
+)
+
+@safe_gesture
+def bashful_hide(car, speed='med', tail=True):
     """SHY - 18cm slow back + head down gradual"""
-    try:
-        # Slow retreat + gradual head drop
-        car.set_motor_speed(1, -10)
-        car.set_motor_speed(2, 10)
-        car.set_cam_tilt_angle(-28, smooth=True)
-        car.set_cam_pan_angle(-15, smooth=True)
-        _sleep(0.4, speed)  # ~18cm slow retreat
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold shy position
-        _sleep(0.7, speed)
-        
-        # Gradual return
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.6, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'bashful_hide', speed, tail)
 
 
-def peekaboo(car, speed='med'):
-    """PLAYFUL - Continuous down-up-down-up rhythm"""
-    try:
-        # Continuous rhythmic motion - no pauses
-        car.set_cam_tilt_angle(-30, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.set_cam_tilt_angle(25, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_tilt_angle(-30, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_tilt_angle(25, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_PEEKABOO = (
+    # Continuous rhythmic motion - no pauses
+    Frame(tilt=-30, dt=0.4),
+    Frame(tilt=25, dt=0.5),
+    Frame(tilt=-30, dt=0.5),
+    Frame(tilt=25, dt=0.5),
+    Frame(tilt=0, dt=0.4),
+)
 
+@safe_gesture
+def peekaboo(car, speed='med', tail=True):
+    """PLAYFUL - Continuous down-up-down-up rhythm"""
+    run_gesture(car, 'peekaboo', speed, tail)
 
-def show_love(car, speed='med'):
-    """HEART SHAPE - Continuous pan arc right-down-left-up"""
-    try:
-        # Draw heart shape with continuous movement
-        car.set_cam_pan_angle(20, smooth=True)
-        car.set_cam_tilt_angle(15, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.set_cam_tilt_angle(-10, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.set_cam_pan_angle(-20, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_tilt_angle(15, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_SHOW_LOVE = (
+    # Draw heart shape with continuous movement
+    Frame(pan=20, tilt=15, dt=0.4),
+    Frame(tilt=-10, dt=0.4),
+    Frame(pan=-20, dt=0.5),
+    Frame(tilt=15, dt=0.4),
+    Frame(pan=0, tilt=0, dt=0.4),
+)
 
-def present_left(car, speed='med'):
+@safe_gesture
+def show_love(car, speed='med', tail=True):
+    """HEART SHAPE - Continuous pan arc right-down-left-up"""
+    run_gesture(car, 'show_love', speed, tail)
+
+
+_PRESENT_LEFT = (
+    # Turn body to show left side
+    Frame(pan=-25, steer=-35, dt=0.5),
+    # Small forward to show off
+    Frame(m1=15, m2=-15, dt=0.1),
+    # Hold pose
+    Frame(m1=0, m2=0, dt=0.8),
+    # Return
+    Frame(pan=0, steer=0, dt=0.4),
+)
+
+@safe_gesture
+def present_left(car, speed='med', tail=True):
     """STATIC - Turn body 45° left, hold pose"""
-    try:
-        # Turn body to show left side
-        car.set_dir_servo_angle(-35, smooth=True)
-        car.set_cam_pan_angle(-25, smooth=True)
-        _sleep(0.5, speed)
-        
-        # Small forward to show off
-        car.set_motor_speed(1, 15)
-        car.set_motor_speed(2, -15)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold pose
-        _sleep(0.8, speed)
-        
-        # Return
-        car.set_dir_servo_angle(0, smooth=True)
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def present_right(car, speed='med'):
+    run_gesture(car, 'present_left', speed, tail)
+
+
+_PRESENT_RIGHT = (
+    # Turn body to show right side
+    Frame(pan=25, steer=35, dt=0.5),
+    # Small forward to show off
+    Frame(m1=15, m2=-15, dt=0.1),
+    # Hold pose
+    Frame(m1=0, m2=0, dt=0.8),
+    # Return
+    Frame(pan=0, steer=0, dt=0.4),
+)
+
+@safe_gesture
+def present_right(car, speed='med', tail=True):
     """STATIC - Turn body 45° right, hold pose"""
-    try:
-        # Turn body to show right side
-        car.set_dir_servo_angle(35, smooth=True)
-        car.set_cam_pan_angle(25, smooth=True)
-        _sleep(0.5, speed)
-        
-        # Small forward to show off
-        car.set_motor_speed(1, 15)
-        car.set_motor_speed(2, -15)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold pose
-        _sleep(0.8, speed)
-        
-        # Return
-        car.set_dir_servo_angle(0, smooth=True)
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'present_right', speed, tail)
 
 
 
@@ -1851,245 +1319,126 @@ def present_right(car, speed='med'):
 # CELEBRATION GESTURES (7) - ENERGETIC
 # ============================================================================
 
-def spin_celebrate(car, speed='med'):
+_SPIN_CELEBRATE = (
+    # Fast 360° spin
+    Frame(steer=40, dt=0.1),
+    Frame(m1=28, m2=-28, dt=1.3),  # ~360° turn
+    # Excited nod
+    Frame(steer=0, m1=0, m2=0),
+    Frame(tilt=-20, dt=0.15, smooth=False),
+    Frame(tilt=10, dt=0.15, smooth=False),
+    Frame(tilt=0, dt=0.2),
+)
+
+@safe_gesture
+def spin_celebrate(car, speed='med', tail=True):
     """CELEBRATION - 360° spin + excited nod"""
-    try:
-        # Fast 360° spin
-        car.set_dir_servo_angle(40, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 28)
-        car.set_motor_speed(2, -28)
-        _sleep(1.3, speed)  # ~360° turn
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Excited nod
-        car.set_dir_servo_angle(0, smooth=True)
-        car.set_cam_tilt_angle(-20, smooth=False)
-        _sleep(0.15, speed)
-        car.set_cam_tilt_angle(10, smooth=False)
-        _sleep(0.15, speed)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'spin_celebrate', speed, tail)
 
 
-def spin_reverse(car, speed='med'):
-    """CELEBRATION - 360° reverse spin"""
-    try:
-        # Fast 360° spin opposite direction
-        car.set_dir_servo_angle(-40, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 28)
-        car.set_motor_speed(2, -28)
-        _sleep(1.3, speed)  # ~360° turn
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Return
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
+_SPIN_REVERSE = (
+    # Fast 360° spin opposite direction
+    Frame(steer=-40, dt=0.1),
+    Frame(m1=28, m2=-28, dt=1.3),  # ~360° turn
+    # Return
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
 
-def cheer_wave(car, speed='med'):
+@safe_gesture
+def spin_reverse(car, speed='med', tail=True):
+    """CELEBRATION - 360° reverse spin"""
+    run_gesture(car, 'spin_reverse', speed, tail)
+
+
+_CHEER_WAVE = (
+    # Fast wave left
+    Frame(pan=-35, m1=20, m2=-20, dt=0.08, smooth=False),
+    Frame(m1=0, m2=0, dt=0.1),
+    # Fast wave right
+    Frame(pan=35, m1=20, m2=-20, dt=0.08, smooth=False),
+    Frame(m1=0, m2=0, dt=0.1),
+    # Fast wave left
+    Frame(pan=-35, m1=20, m2=-20, dt=0.08, smooth=False),
+    # Return
+    Frame(pan=0, m1=0, m2=0, dt=0.2),
+)
+
+@safe_gesture
+def cheer_wave(car, speed='med', tail=True):
     """ENERGETIC - Fast pan waves + bounces"""
-    try:
-        # Fast wave left
-        car.set_cam_pan_angle(-35, smooth=False)
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.08, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        _sleep(0.1, speed)
-        
-        # Fast wave right
-        car.set_cam_pan_angle(35, smooth=False)
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.08, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        _sleep(0.1, speed)
-        
-        # Fast wave left
-        car.set_cam_pan_angle(-35, smooth=False)
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.08, speed)
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Return
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
+    run_gesture(car, 'cheer_wave', speed, tail)
 
-def celebrate_big(car, speed='med'):
-    """BIG CELEBRATION - 720° spin + head up"""
-    try:
-        # Double spin 720°
-        car.set_dir_servo_angle(40, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 30)
-        car.set_motor_speed(2, -30)
-        car.set_cam_tilt_angle(25, smooth=True)
-        _sleep(2.5, speed)  # ~720° double spin
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold triumphant pose
-        _sleep(0.5, speed)
-        
-        # Return
-        car.set_dir_servo_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_CELEBRATE_BIG = (
+    # Double spin 720°
+    Frame(steer=40, dt=0.1),
+    Frame(tilt=25, m1=30, m2=-30, dt=2.5),  # ~720° double spin
+    # Hold triumphant pose
+    Frame(m1=0, m2=0, dt=0.5),
+    # Return
+    Frame(tilt=0, steer=0, dt=0.4),
+)
 
-def applaud_motion(car, speed='med'):
+@safe_gesture
+def celebrate_big(car, speed='med', tail=True):
+    """BIG CELEBRATION - 720° spin + head up"""
+    run_gesture(car, 'celebrate_big', speed, tail)
+
+
+_APPLAUD_MOTION = (
+    # Hop left (differential turn without moving forward)
+    Frame(steer=-30, dt=0.08),
+    Frame(steer=0, dt=0.08),
+    # Hop right
+    Frame(steer=30, dt=0.08),
+    Frame(steer=0, dt=0.08),
+    # Hop left
+    Frame(steer=-30, dt=0.08),
+    Frame(steer=0, dt=0.08),
+    # Hop right
+    Frame(steer=30, dt=0.08),
+    Frame(steer=0, dt=0.08),
+)
+
+@safe_gesture
+def applaud_motion(car, speed='med', tail=True):
     """APPLAUSE - Left-right hops"""
-    try:
-        # Hop left (differential turn without moving forward)
-        car.set_dir_servo_angle(-30, smooth=True)
-        _sleep(0.08, speed)
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.08, speed)
-        
-        # Hop right
-        car.set_dir_servo_angle(30, smooth=True)
-        _sleep(0.08, speed)
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.08, speed)
-        
-        # Hop left
-        car.set_dir_servo_angle(-30, smooth=True)
-        _sleep(0.08, speed)
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.08, speed)
-        
-        # Hop right
-        car.set_dir_servo_angle(30, smooth=True)
-        _sleep(0.08, speed)
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.08, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def victory_pose(car, speed='med'):
+    run_gesture(car, 'applaud_motion', speed, tail)
+
+
+_VICTORY_POSE = (
+    # Triumphant head tilt up
+    Frame(tilt=35, dt=0.4),
+    # Victory roll forward
+    Frame(m1=22, m2=-22, dt=0.1),  # ~10cm
+    # Hold victory pose
+    Frame(m1=0, m2=0, dt=0.8),
+    # Return
+    Frame(tilt=0, dt=0.4),
+)
+
+@safe_gesture
+def victory_pose(car, speed='med', tail=True):
     """VICTORY - Head up high + forward 10cm"""
-    try:
-        # Triumphant head tilt up
-        car.set_cam_tilt_angle(35, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Victory roll forward
-        car.set_motor_speed(1, 22)
-        car.set_motor_speed(2, -22)
-        _sleep(0.1, speed)  # ~10cm
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold victory pose
-        _sleep(0.8, speed)
-        
-        # Return
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def show_joy(car, speed='med'):
+    run_gesture(car, 'victory_pose', speed, tail)
+
+
+_SHOW_JOY = (
+    # Bouncy excited nod
+    Frame(tilt=-15, dt=0.1, smooth=False),
+    Frame(tilt=10, dt=0.1, smooth=False),
+    Frame(tilt=-15, dt=0.1, smooth=False),
+    # Happy 180° turn
+    Frame(tilt=0, steer=40, dt=0.1),
+    Frame(m1=25, m2=-25, dt=0.7),  # ~180° turn
+    # Return
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
+
+@safe_gesture
+def show_joy(car, speed='med', tail=True):
     """JOY - Bouncy nod + 180° turn"""
-    try:
-        # Bouncy excited nod
-        car.set_cam_tilt_angle(-15, smooth=False)
-        _sleep(0.1, speed)
-        car.set_cam_tilt_angle(10, smooth=False)
-        _sleep(0.1, speed)
-        car.set_cam_tilt_angle(-15, smooth=False)
-        _sleep(0.1, speed)
-        car.set_cam_tilt_angle(0, smooth=True)
-        
-        # Happy 180° turn
-        car.set_dir_servo_angle(40, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 25)
-        car.set_motor_speed(2, -25)
-        _sleep(0.7, speed)  # ~180° turn
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Return
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'show_joy', speed, tail)
 
 
 
@@ -2097,431 +1446,229 @@ def show_joy(car, speed='med'):
 # EMOTIONAL GESTURES (15) - SLOW/EXPRESSIVE continuous movements
 # ============================================================================
 
-def sad_turnaway(car, speed='med'):
+_SAD_TURNAWAY = (
+    # Very slow backward retreat + continuous head drop
+    Frame(pan=-20, tilt=-30, m1=-8, m2=8, dt=0.55),  # ~20cm very slow
+    # Hold sad pose
+    Frame(m1=0, m2=0, dt=0.9),
+    # Slow return
+    Frame(pan=0, tilt=0, dt=0.7),
+)
+
+@safe_gesture
+def sad_turnaway(car, speed='med', tail=True):
     """SLOW SAD - Gradual back 20cm + slow head droop"""
-    try:
-        # Very slow backward retreat + continuous head drop
-        car.set_motor_speed(1, -8)
-        car.set_motor_speed(2, 8)
-        car.set_cam_tilt_angle(-30, smooth=True)
-        car.set_cam_pan_angle(-20, smooth=True)
-        _sleep(0.55, speed)  # ~20cm very slow
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold sad pose
-        _sleep(0.9, speed)
-        
-        # Slow return
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.7, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
-
-def confused_tilt(car, speed='med'):
+    run_gesture(car, 'sad_turnaway', speed, tail)
+
+
+_CONFUSED_TILT = (
+    # Continuous slow tilt left
+    Frame(pan=-25, tilt=15, dt=0.8),
+    # Pause confused
+    Frame(dt=0.4),
+    # Continuous slow tilt right
+    Frame(pan=25, tilt=15, dt=0.8),
+    # Return slowly
+    Frame(pan=0, tilt=0, dt=0.6),
+)
+
+@safe_gesture
+def confused_tilt(car, speed='med', tail=True):
     """SLOW CONTINUOUS - Gradual tilt left, pause, tilt right"""
-    try:
-        # Continuous slow tilt left
-        car.set_cam_pan_angle(-25, smooth=True)
-        car.set_cam_tilt_angle(15, smooth=True)
-        _sleep(0.8, speed)
-        
-        # Pause confused
-        _sleep(0.4, speed)
-        
-        # Continuous slow tilt right
-        car.set_cam_pan_angle(25, smooth=True)
-        car.set_cam_tilt_angle(15, smooth=True)
-        _sleep(0.8, speed)
-        
-        # Return slowly
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.6, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'confused_tilt', speed, tail)
 
 
-def look_proud(car, speed='med'):
-    """SLOW RISE - Gradual head lift up, hold high"""
-    try:
-        # Slow continuous rise
-        car.set_cam_tilt_angle(35, smooth=True)
-        _sleep(0.9, speed)
-        
-        # Hold proud
-        _sleep(1.0, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
-
+_LOOK_PROUD = (
+    # Slow continuous rise
+    Frame(tilt=35, dt=0.9),
+    # Hold proud
+    Frame(dt=1.0),
+)
 
-def sigh(car, speed='med'):
-    """SLOW DROOP - Gradual head drop, long hold"""
-    try:
-        # Very slow droop
-        car.set_cam_tilt_angle(-30, smooth=True)
-        _sleep(1.2, speed)
-        
-        # Long hold
-        _sleep(1.0, speed)
-        
-        # Slow rise
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.8, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+@safe_gesture
+def look_proud(car, speed='med', tail=True):
+    """SLOW RISE - Gradual head lift up, hold high"""
+    run_gesture(car, 'look_proud', speed, tail)
 
 
-def yawn(car, speed='med'):
-    """SLOW STRETCH - Gradual tilt up, pause, slow down"""
-    try:
-        # Slow stretch up
-        car.set_cam_tilt_angle(30, smooth=True)
-        _sleep(1.0, speed)
-        
-        # Hold at top
-        _sleep(0.6, speed)
-        
-        # Slow drop down
-        car.set_cam_tilt_angle(-25, smooth=True)
-        _sleep(0.9, speed)
-        
-        # Return
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.6, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_SIGH = (
+    # Very slow droop
+    Frame(tilt=-30, dt=1.2),
+    # Long hold
+    Frame(dt=1.0),
+    # Slow rise
+    Frame(tilt=0, dt=0.8),
+)
 
+@safe_gesture
+def sigh(car, speed='med', tail=True):
+    """SLOW DROOP - Gradual head drop, long hold"""
+    run_gesture(car, 'sigh', speed, tail)
+
+
+_YAWN = (
+    # Slow stretch up
+    Frame(tilt=30, dt=1.0),
+    # Hold at top
+    Frame(dt=0.6),
+    # Slow drop down
+    Frame(tilt=-25, dt=0.9),
+    # Return
+    Frame(tilt=0, dt=0.6),
+)
+
+@safe_gesture
+def yawn(car, speed='med', tail=True):
+    """SLOW STRETCH - Gradual tilt up, pause, slow down"""
+    run_gesture(car, 'yawn', speed, tail)
+
+
+_STRETCH = (
+    # Slow forward stretch
+    Frame(tilt=25, m1=8, m2=-8, dt=0.42),  # ~15cm very slow
+    # Hold stretch
+    Frame(m1=0, m2=0, dt=0.7),
+    # Return head
+    Frame(tilt=0, dt=0.5),
+)
 
-def stretch(car, speed='med'):
+@safe_gesture
+def stretch(car, speed='med', tail=True):
     """SLOW FORWARD - Gradual 15cm extension + head up"""
-    try:
-        # Slow forward stretch
-        car.set_motor_speed(1, 8)
-        car.set_motor_speed(2, -8)
-        car.set_cam_tilt_angle(25, smooth=True)
-        _sleep(0.42, speed)  # ~15cm very slow
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold stretch
-        _sleep(0.7, speed)
-        
-        # Return head
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'stretch', speed, tail)
 
 
-def bored_idle(car, speed='med'):
+_BORED_IDLE = (
+    # Very slow drift left
+    Frame(pan=-15, dt=1.2),
+    # Very slow drift right
+    Frame(pan=15, dt=1.5),
+    # Very slow return
+    Frame(pan=0, dt=1.0),
+)
+
+@safe_gesture
+def bored_idle(car, speed='med', tail=True):
     """VERY SLOW - Tiny continuous pan left-center-right"""
-    try:
-        # Very slow drift left
-        car.set_cam_pan_angle(-15, smooth=True)
-        _sleep(1.2, speed)
-        
-        # Very slow drift right
-        car.set_cam_pan_angle(15, smooth=True)
-        _sleep(1.5, speed)
-        
-        # Very slow return
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(1.0, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'bored_idle', speed, tail)
+
 
+_THINK_LONG = (
+    # Slow continuous spiral motion
+    Frame(pan=-30, tilt=20, dt=0.9),
+    Frame(pan=30, tilt=-20, dt=1.2),
+    Frame(pan=0, tilt=0, dt=0.9),
+    # Pause thinking
+    Frame(dt=0.6),
+)
 
-def think_long(car, speed='med'):
+@safe_gesture
+def think_long(car, speed='med', tail=True):
     """SLOW SPIRAL - Continuous pan and tilt together"""
-    try:
-        # Slow continuous spiral motion
-        car.set_cam_pan_angle(-30, smooth=True)
-        car.set_cam_tilt_angle(20, smooth=True)
-        _sleep(0.9, speed)
-        
-        car.set_cam_pan_angle(30, smooth=True)
-        car.set_cam_tilt_angle(-20, smooth=True)
-        _sleep(1.2, speed)
-        
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.9, speed)
-        
-        # Pause thinking
-        _sleep(0.6, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'think_long', speed, tail)
 
 
-def ponder(car, speed='med'):
-    """SLOW ALTERNATING - Gradual tilt left, right, left"""
-    try:
-        # Slow continuous alternating tilts
-        car.set_cam_pan_angle(-20, smooth=True)
-        car.set_cam_tilt_angle(10, smooth=True)
-        _sleep(0.9, speed)
-        
-        car.set_cam_pan_angle(20, smooth=True)
-        _sleep(1.0, speed)
-        
-        car.set_cam_pan_angle(-20, smooth=True)
-        _sleep(1.0, speed)
-        
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.7, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_PONDER = (
+    # Slow continuous alternating tilts
+    Frame(pan=-20, tilt=10, dt=0.9),
+    Frame(pan=20, dt=1.0),
+    Frame(pan=-20, dt=1.0),
+    Frame(pan=0, tilt=0, dt=0.7),
+)
 
+@safe_gesture
+def ponder(car, speed='med', tail=True):
+    """SLOW ALTERNATING - Gradual tilt left, right, left"""
+    run_gesture(car, 'ponder', speed, tail)
 
-def dreamy_stare(car, speed='med'):
-    """STATIC - Head up, complete stillness"""
-    try:
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(25, smooth=True)
-        _sleep(0.6, speed)
-        
-        # Long dreamy stillness
-        _sleep(1.5, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_DREAMY_STARE = (
+    Frame(pan=0, tilt=25, dt=0.6),
+    # Long dreamy stillness
+    Frame(dt=1.5),
+)
 
-def ponder_and_nod(car, speed='med'):
+@safe_gesture
+def dreamy_stare(car, speed='med', tail=True):
+    """STATIC - Head up, complete stillness"""
+    run_gesture(car, 'dreamy_stare', speed, tail)
+
+
+_PONDER_AND_NOD = (
+    # Pondering tilt
+    Frame(pan=-18, tilt=12, dt=0.8),
+    # Pause
+    Frame(dt=0.6),
+    # Return to center
+    Frame(pan=0, dt=0.4),
+    # Slow nod 1
+    Frame(tilt=-15, dt=0.6),
+    Frame(tilt=5, dt=0.6),
+    # Slow nod 2
+    Frame(tilt=-15, dt=0.6),
+    Frame(tilt=0, dt=0.5),
+)
+
+@safe_gesture
+def ponder_and_nod(car, speed='med', tail=True):
     """SLOW SEQUENCE - Think then slow double nod"""
-    try:
-        # Pondering tilt
-        car.set_cam_pan_angle(-18, smooth=True)
-        car.set_cam_tilt_angle(12, smooth=True)
-        _sleep(0.8, speed)
-        
-        # Pause
-        _sleep(0.6, speed)
-        
-        # Return to center
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Slow nod 1
-        car.set_cam_tilt_angle(-15, smooth=True)
-        _sleep(0.6, speed)
-        car.set_cam_tilt_angle(5, smooth=True)
-        _sleep(0.6, speed)
-        
-        # Slow nod 2
-        car.set_cam_tilt_angle(-15, smooth=True)
-        _sleep(0.6, speed)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'ponder_and_nod', speed, tail)
 
 
-def approach_slowly(car, speed='med'):
+_APPROACH_SLOWLY = (
+    # Very slow forward
+    Frame(m1=8, m2=-8, dt=0.7),  # ~25cm very slow
+    Frame(m1=0, m2=0, dt=0.3),
+)
+
+@safe_gesture
+def approach_slowly(car, speed='med', tail=True):
     """VERY SLOW - 25cm at speed 8 with pauses"""
-    try:
-        # Very slow forward
-        car.set_motor_speed(1, 8)
-        car.set_motor_speed(2, -8)
-        _sleep(0.7, speed)  # ~25cm very slow
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        _sleep(0.3, speed)
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'approach_slowly', speed, tail)
+
 
+_BACK_OFF_SLOWLY = (
+    # Very slow backward
+    Frame(tilt=15, m1=-8, m2=8, dt=0.7),  # ~25cm very slow
+    # Hold
+    Frame(m1=0, m2=0, dt=0.4),
+    # Return head
+    Frame(tilt=0, dt=0.5),
+)
 
-def back_off_slowly(car, speed='med'):
+@safe_gesture
+def back_off_slowly(car, speed='med', tail=True):
     """VERY SLOW BACK - 25cm retreat speed 8 + head up"""
-    try:
-        # Very slow backward
-        car.set_motor_speed(1, -8)
-        car.set_motor_speed(2, 8)
-        car.set_cam_tilt_angle(15, smooth=True)
-        _sleep(0.7, speed)  # ~25cm very slow
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold
-        _sleep(0.4, speed)
-        
-        # Return head
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'back_off_slowly', speed, tail)
 
 
-def dance_sad(car, speed='med'):
+_DANCE_SAD = (
+    # Continuous slow sway left-right-left
+    Frame(pan=-15, tilt=-10, steer=-25, dt=1.0),
+    Frame(pan=15, steer=25, dt=1.2),
+    Frame(pan=-15, steer=-25, dt=1.2),
+    # Return
+    Frame(pan=0, tilt=0, steer=0, dt=0.8),
+)
+
+@safe_gesture
+def dance_sad(car, speed='med', tail=True):
     """SLOW SWAY - Continuous slow steering sway, no forward"""
-    try:
-        # Continuous slow sway left-right-left
-        car.set_dir_servo_angle(-25, smooth=True)
-        car.set_cam_pan_angle(-15, smooth=True)
-        car.set_cam_tilt_angle(-10, smooth=True)
-        _sleep(1.0, speed)
-        
-        car.set_dir_servo_angle(25, smooth=True)
-        car.set_cam_pan_angle(15, smooth=True)
-        _sleep(1.2, speed)
-        
-        car.set_dir_servo_angle(-25, smooth=True)
-        car.set_cam_pan_angle(-15, smooth=True)
-        _sleep(1.2, speed)
-        
-        # Return
-        car.set_dir_servo_angle(0, smooth=True)
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.8, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'dance_sad', speed, tail)
+
 
+_SHOW_THOUGHTFULNESS = (
+    # Continuous thoughtful motion - both servos move together
+    Frame(pan=-25, tilt=15, dt=1.0),
+    Frame(pan=25, tilt=-15, dt=1.3),
+    Frame(pan=-25, tilt=15, dt=1.3),
+    Frame(pan=0, tilt=0, dt=0.9),
+)
 
-def show_thoughtfulness(car, speed='med'):
+@safe_gesture
+def show_thoughtfulness(car, speed='med', tail=True):
     """SLOW CONTINUOUS - Pan and tilt oscillate together"""
-    try:
-        # Continuous thoughtful motion - both servos move together
-        car.set_cam_pan_angle(-25, smooth=True)
-        car.set_cam_tilt_angle(15, smooth=True)
-        _sleep(1.0, speed)
-        
-        car.set_cam_pan_angle(25, smooth=True)
-        car.set_cam_tilt_angle(-15, smooth=True)
-        _sleep(1.3, speed)
-        
-        car.set_cam_pan_angle(-25, smooth=True)
-        car.set_cam_tilt_angle(15, smooth=True)
-        _sleep(1.3, speed)
-        
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.9, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'show_thoughtfulness', speed, tail)
 
 
 
@@ -2529,298 +1676,163 @@ def show_thoughtfulness(car, speed='med'):
 # FUNCTIONAL GESTURES (12) - CLEAR POSES
 # ============================================================================
 
-def sleep_mode(car, speed='med'):
+_SLEEP_MODE = (
+    Frame(pan=0, tilt=-35, dt=0.6),
+    # Hold sleep position
+    Frame(dt=0.8),
+)
+
+@safe_gesture
+def sleep_mode(car, speed='med', tail=True):
     """STATIC - Head down, complete stillness"""
-    try:
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(-35, smooth=True)
-        _sleep(0.6, speed)
-        
-        # Hold sleep position
-        _sleep(0.8, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'sleep_mode', speed, tail)
+
 
+_WAKE_UP = (
+    # Rise from sleep
+    Frame(tilt=0, dt=0.7),
+    # Small shake awake
+    Frame(pan=-10, dt=0.1, smooth=False),
+    Frame(pan=10, dt=0.1, smooth=False),
+    Frame(pan=0, dt=0.2),
+)
 
-def wake_up(car, speed='med'):
+@safe_gesture
+def wake_up(car, speed='med', tail=True):
     """RISE - Gradual head lift + small shake"""
-    try:
-        # Rise from sleep
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.7, speed)
-        
-        # Small shake awake
-        car.set_cam_pan_angle(-10, smooth=False)
-        _sleep(0.1, speed)
-        car.set_cam_pan_angle(10, smooth=False)
-        _sleep(0.1, speed)
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'wake_up', speed, tail)
 
 
-def guard_pose(car, speed='med'):
+_GUARD_POSE = (
+    Frame(pan=0, tilt=0, dt=0.3),
+    # Slow guard scan
+    Frame(pan=-30, dt=1.0),
+    Frame(pan=30, dt=1.2),
+    Frame(pan=0, dt=0.8),
+)
+
+@safe_gesture
+def guard_pose(car, speed='med', tail=True):
     """STATIC - Centered, head slow pan"""
-    try:
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        # Slow guard scan
-        car.set_cam_pan_angle(-30, smooth=True)
-        _sleep(1.0, speed)
-        
-        car.set_cam_pan_angle(30, smooth=True)
-        _sleep(1.2, speed)
-        
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.8, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'guard_pose', speed, tail)
+
 
+_LISTEN = (
+    Frame(pan=0, tilt=12, dt=0.4),
+    # Complete stillness while listening
+    Frame(dt=1.2),
+)
 
-def listen(car, speed='med'):
+@safe_gesture
+def listen(car, speed='med', tail=True):
     """STATIC - Slight tilt up, total stillness"""
-    try:
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(12, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Complete stillness while listening
-        _sleep(1.2, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'listen', speed, tail)
 
 
-def listen_close(car, speed='med'):
+_LISTEN_CLOSE = (
+    # Lean in closer
+    Frame(tilt=8, m1=12, m2=-12, dt=0.15),  # ~8cm
+    # Hold listening position
+    Frame(m1=0, m2=0, dt=1.0),
+    # Return head
+    Frame(tilt=0, dt=0.4),
+)
+
+@safe_gesture
+def listen_close(car, speed='med', tail=True):
     """LEAN IN - 8cm forward + head forward"""
-    try:
-        # Lean in closer
-        car.set_motor_speed(1, 12)
-        car.set_motor_speed(2, -12)
-        car.set_cam_tilt_angle(8, smooth=True)
-        _sleep(0.15, speed)  # ~8cm
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold listening position
-        _sleep(1.0, speed)
-        
-        # Return head
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'listen_close', speed, tail)
+
 
+_READY_POSE = (
+    Frame(pan=0, tilt=0, steer=0, dt=0.4),
+    # Hold ready
+    Frame(dt=0.6),
+)
 
-def ready_pose(car, speed='med'):
+@safe_gesture
+def ready_pose(car, speed='med', tail=True):
     """STATIC - Center all, ready stance"""
-    try:
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Hold ready
-        _sleep(0.6, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'ready_pose', speed, tail)
 
 
-def charge_pose(car, speed='med'):
+_CHARGE_POSE = (
+    Frame(pan=0, tilt=-15, dt=0.4),
+    # Hold charge ready pose
+    Frame(dt=0.7),
+)
+
+@safe_gesture
+def charge_pose(car, speed='med', tail=True):
     """STATIC - Head down slightly, coiled ready"""
-    try:
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(-15, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Hold charge ready pose
-        _sleep(0.7, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'charge_pose', speed, tail)
+
 
+_FAILURE_POSE = (
+    # Defeated head drop + slow retreat
+    Frame(tilt=-35, m1=-10, m2=10, dt=0.35),  # ~15cm slow retreat
+    # Hold defeated pose
+    Frame(m1=0, m2=0, dt=0.8),
+)
 
-def failure_pose(car, speed='med'):
+@safe_gesture
+def failure_pose(car, speed='med', tail=True):
     """DROOP - Head down + slow 15cm back"""
-    try:
-        # Defeated head drop + slow retreat
-        car.set_motor_speed(1, -10)
-        car.set_motor_speed(2, 10)
-        car.set_cam_tilt_angle(-35, smooth=True)
-        _sleep(0.35, speed)  # ~15cm slow retreat
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold defeated pose
-        _sleep(0.8, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'failure_pose', speed, tail)
 
 
-def question_pose(car, speed='med'):
+_QUESTION_POSE = (
+    Frame(pan=25, tilt=18, dt=0.5),
+    # Hold questioning pose
+    Frame(dt=0.9),
+)
+
+@safe_gesture
+def question_pose(car, speed='med', tail=True):
     """STATIC - Tilt right, hold still questioningly"""
-    try:
-        car.set_cam_pan_angle(25, smooth=True)
-        car.set_cam_tilt_angle(18, smooth=True)
-        _sleep(0.5, speed)
-        
-        # Hold questioning pose
-        _sleep(0.9, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'question_pose', speed, tail)
+
 
+_AFFIRM_POSE = (
+    # Quick nod down
+    Frame(tilt=-18, dt=0.15, smooth=False),
+    # Quick nod up
+    Frame(tilt=0, dt=0.2),
+)
 
-def affirm_pose(car, speed='med'):
+@safe_gesture
+def affirm_pose(car, speed='med', tail=True):
     """NOD - Quick single nod"""
-    try:
-        # Quick nod down
-        car.set_cam_tilt_angle(-18, smooth=False)
-        _sleep(0.15, speed)
-        
-        # Quick nod up
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'affirm_pose', speed, tail)
 
 
-def idle_breath(car, speed='med'):
+_IDLE_BREATH = (
+    # Very subtle breathing motion
+    Frame(tilt=3, dt=1.0),
+    Frame(tilt=-3, dt=1.2),
+    Frame(tilt=3, dt=1.2),
+    Frame(tilt=0, dt=0.8),
+)
+
+@safe_gesture
+def idle_breath(car, speed='med', tail=True):
     """VERY SLOW - Micro tilt up-down continuous"""
-    try:
-        # Very subtle breathing motion
-        car.set_cam_tilt_angle(3, smooth=True)
-        _sleep(1.0, speed)
-        
-        car.set_cam_tilt_angle(-3, smooth=True)
-        _sleep(1.2, speed)
-        
-        car.set_cam_tilt_angle(3, smooth=True)
-        _sleep(1.2, speed)
-        
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.8, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'idle_breath', speed, tail)
+
 
+_SHOW_SHYNESS = (
+    # Shy retreat
+    Frame(pan=-12, tilt=-25, m1=-10, m2=10, dt=0.28),  # ~12cm slow
+    # Hold shy
+    Frame(m1=0, m2=0, dt=0.8),
+    # Return head
+    Frame(pan=0, tilt=0, dt=0.6),
+)
 
-def show_shyness(car, speed='med'):
+@safe_gesture
+def show_shyness(car, speed='med', tail=True):
     """SHY - Head down + slow 12cm back"""
-    try:
-        # Shy retreat
-        car.set_motor_speed(1, -10)
-        car.set_motor_speed(2, 10)
-        car.set_cam_tilt_angle(-25, smooth=True)
-        car.set_cam_pan_angle(-12, smooth=True)
-        _sleep(0.28, speed)  # ~12cm slow
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold shy
-        _sleep(0.8, speed)
-        
-        # Return head
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.6, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'show_shyness', speed, tail)
 
 
 
@@ -2828,280 +1840,146 @@ def show_shyness(car, speed='med'):
 # SIGNALING GESTURES (10) - DISTINCT CLEAR signals
 # ============================================================================
 
-def wave_head_no(car, speed='med'):
-    """NO SIGNAL - Wide pan oscillation left-right-left"""
-    try:
-        # Wide "no" shake
-        car.set_cam_pan_angle(-40, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.set_cam_pan_angle(40, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_pan_angle(-40, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+_WAVE_HEAD_NO = (
+    # Wide "no" shake
+    Frame(pan=-40, dt=0.4),
+    Frame(pan=40, dt=0.5),
+    Frame(pan=-40, dt=0.5),
+    Frame(pan=0, dt=0.4),
+)
 
+@safe_gesture
+def wave_head_no(car, speed='med', tail=True):
+    """NO SIGNAL - Wide pan oscillation left-right-left"""
+    run_gesture(car, 'wave_head_no', speed, tail)
 
-def wave_head_yes(car, speed='med'):
-    """YES SIGNAL - Slow firm nod down-up-down"""
-    try:
-        # Slow deliberate nod
-        car.set_cam_tilt_angle(-25, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_tilt_angle(5, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_tilt_angle(-25, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
 
+_WAVE_HEAD_YES = (
+    # Slow deliberate nod
+    Frame(tilt=-25, dt=0.5),
+    Frame(tilt=5, dt=0.5),
+    Frame(tilt=-25, dt=0.5),
+    Frame(tilt=0, dt=0.4),
+)
 
-def call_attention(car, speed='med'):
+@safe_gesture
+def wave_head_yes(car, speed='med', tail=True):
+    """YES SIGNAL - Slow firm nod down-up-down"""
+    run_gesture(car, 'wave_head_yes', speed, tail)
+
+
+_CALL_ATTENTION = (
+    # Quick 90° turn to get attention
+    Frame(steer=40, dt=0.1),
+    Frame(m1=25, m2=-25, dt=0.55),  # ~90° turn
+    # Attention nod
+    Frame(tilt=-20, m1=0, m2=0, dt=0.15, smooth=False),
+    Frame(tilt=0, dt=0.2),
+    # Return steering
+    Frame(steer=0, dt=0.3),
+)
+
+@safe_gesture
+def call_attention(car, speed='med', tail=True):
     """ATTENTION - Quick 90° spin + nod"""
-    try:
-        # Quick 90° turn to get attention
-        car.set_dir_servo_angle(40, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 25)
-        car.set_motor_speed(2, -25)
-        _sleep(0.55, speed)  # ~90° turn
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Attention nod
-        car.set_cam_tilt_angle(-20, smooth=False)
-        _sleep(0.15, speed)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        # Return steering
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'call_attention', speed, tail)
 
 
-def show_curiosity(car, speed='med'):
+_SHOW_CURIOSITY = (
+    # Curious exploration motion
+    Frame(pan=-25, tilt=15, dt=0.7),
+    Frame(pan=25, tilt=-10, dt=0.9),
+    Frame(pan=0, tilt=0, dt=0.6),
+)
+
+@safe_gesture
+def show_curiosity(car, speed='med', tail=True):
     """CURIOUS - Slow pan/tilt exploration"""
-    try:
-        # Curious exploration motion
-        car.set_cam_pan_angle(-25, smooth=True)
-        car.set_cam_tilt_angle(15, smooth=True)
-        _sleep(0.7, speed)
-        
-        car.set_cam_pan_angle(25, smooth=True)
-        car.set_cam_tilt_angle(-10, smooth=True)
-        _sleep(0.9, speed)
-        
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.6, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'show_curiosity', speed, tail)
+
 
+_ACKNOWLEDGE_SIGNAL = (
+    # Clear acknowledgment nod
+    Frame(tilt=-22, dt=0.3),
+    Frame(tilt=0, dt=0.3),
+)
 
-def acknowledge_signal(car, speed='med'):
+@safe_gesture
+def acknowledge_signal(car, speed='med', tail=True):
     """ACK - Single firm nod"""
-    try:
-        # Clear acknowledgment nod
-        car.set_cam_tilt_angle(-22, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'acknowledge_signal', speed, tail)
 
 
-def reject_signal(car, speed='med'):
+_REJECT_SIGNAL = (
+    # Rejection shake
+    Frame(pan=-30, m1=-15, m2=15, dt=0.12, smooth=False),
+    Frame(pan=30, dt=0.12, smooth=False),
+    Frame(pan=0, m1=0, m2=0, dt=0.3),
+)
+
+@safe_gesture
+def reject_signal(car, speed='med', tail=True):
     """REJECT - Head shake + 8cm back"""
-    try:
-        # Rejection shake
-        car.set_cam_pan_angle(-30, smooth=False)
-        car.set_motor_speed(1, -15)
-        car.set_motor_speed(2, 15)
-        _sleep(0.12, speed)
-        
-        car.set_cam_pan_angle(30, smooth=False)
-        _sleep(0.12, speed)
-        
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        car.set_cam_pan_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'reject_signal', speed, tail)
+
 
+_ERROR_SHRUG = (
+    Frame(pan=-20, tilt=-15, dt=0.5),
+    # Hold error pose
+    Frame(dt=0.6),
+    # Return
+    Frame(pan=0, tilt=0, dt=0.4),
+)
 
-def error_shrug(car, speed='med'):
+@safe_gesture
+def error_shrug(car, speed='med', tail=True):
     """ERROR - Tilt down + pan aside"""
-    try:
-        car.set_cam_pan_angle(-20, smooth=True)
-        car.set_cam_tilt_angle(-15, smooth=True)
-        _sleep(0.5, speed)
-        
-        # Hold error pose
-        _sleep(0.6, speed)
-        
-        # Return
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'error_shrug', speed, tail)
 
 
-def signal_complete(car, speed='med'):
+_SIGNAL_COMPLETE = (
+    # Completion nod
+    Frame(tilt=-20, dt=0.4),
+    Frame(tilt=0, dt=0.4),
+    # Return to rest
+    Frame(pan=0, steer=0, dt=0.3),
+)
+
+@safe_gesture
+def signal_complete(car, speed='med', tail=True):
     """COMPLETE - Nod + return to rest"""
-    try:
-        # Completion nod
-        car.set_cam_tilt_angle(-20, smooth=True)
-        _sleep(0.4, speed)
-        
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.4, speed)
-        
-        # Return to rest
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'signal_complete', speed, tail)
+
 
+_SIGNAL_ERROR = (
+    # Error shake
+    Frame(pan=-25, dt=0.12, smooth=False),
+    Frame(pan=25, dt=0.12, smooth=False),
+    # Short backward step
+    Frame(pan=0, m1=-15, m2=15, dt=0.08),  # ~5cm back
+    Frame(m1=0, m2=0, dt=0.2),
+)
 
-def signal_error(car, speed='med'):
+@safe_gesture
+def signal_error(car, speed='med', tail=True):
     """ERROR - Shake head + short back"""
-    try:
-        # Error shake
-        car.set_cam_pan_angle(-25, smooth=False)
-        _sleep(0.12, speed)
-        car.set_cam_pan_angle(25, smooth=False)
-        _sleep(0.12, speed)
-        car.set_cam_pan_angle(0, smooth=True)
-        
-        # Short backward step
-        car.set_motor_speed(1, -15)
-        car.set_motor_speed(2, 15)
-        _sleep(0.08, speed)  # ~5cm back
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        _sleep(0.2, speed)
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'signal_error', speed, tail)
 
 
-def show_confidence(car, speed='med'):
+_SHOW_CONFIDENCE = (
+    # Confident forward march
+    Frame(pan=0, tilt=5, dt=0.2),
+    Frame(m1=20, m2=-20, dt=0.22),  # ~20cm steady
+    # Hold confident pose
+    Frame(m1=0, m2=0, dt=0.5),
+    # Return head
+    Frame(tilt=0, dt=0.3),
+)
+
+@safe_gesture
+def show_confidence(car, speed='med', tail=True):
     """CONFIDENT - Steady 20cm forward, level head"""
-    try:
-        # Confident forward march
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_cam_tilt_angle(5, smooth=True)
-        _sleep(0.2, speed)
-        
-        car.set_motor_speed(1, 20)
-        car.set_motor_speed(2, -20)
-        _sleep(0.22, speed)  # ~20cm steady
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Hold confident pose
-        _sleep(0.5, speed)
-        
-        # Return head
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'show_confidence', speed, tail)
 
 
 
@@ -3109,111 +1987,59 @@ def show_confidence(car, speed='med'):
 # ADVANCED GESTURES (4) - PRECISE MOVEMENT
 # ============================================================================
 
-def dance_happy(car, speed='med'):
+_DANCE_HAPPY = (
+    # Dance sequence with continuous motion
+    # Turn left
+    Frame(steer=-30, dt=0.1),
+    Frame(m1=18, m2=-18, dt=0.3),
+    # Straight
+    Frame(steer=0, dt=0.2),
+    # Turn right
+    Frame(steer=30, dt=0.4),
+    # Straight
+    Frame(steer=0, dt=0.2),
+    # Return
+    Frame(steer=0, m1=0, m2=0, dt=0.3),
+)
+
+@safe_gesture
+def dance_happy(car, speed='med', tail=True):
     """DANCE - Rhythmic continuous turn-forward-turn"""
-    try:
-        # Dance sequence with continuous motion
-        # Turn left
-        car.set_dir_servo_angle(-30, smooth=True)
-        _sleep(0.1, speed)
-        car.set_motor_speed(1, 18)
-        car.set_motor_speed(2, -18)
-        _sleep(0.3, speed)
-        
-        # Straight
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        # Turn right
-        car.set_dir_servo_angle(30, smooth=True)
-        _sleep(0.1, speed)
-        _sleep(0.3, speed)
-        
-        # Straight
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.2, speed)
-        
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        
-        # Return
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'dance_happy', speed, tail)
+
 
+def _sway(side, dt, pan=22, steer=15):
+    """Head and wheels turned together to one side (-1 left, 1 right)"""
+    return Frame(pan=pan * side, steer=steer * side, dt=dt)
 
-def flirt(car, speed='med'):
+_FLIRT = (
+    # Playful flirtatious motion - continuous
+    _sway(-1, 0.6),
+    _sway(1, 0.7),
+    _sway(-1, 0.7),
+    # Return
+    Frame(pan=0, steer=0, dt=0.5),
+)
+
+@safe_gesture
+def flirt(car, speed='med', tail=True):
     """PLAYFUL - Light continuous pan sweeps + tiny sway"""
-    try:
-        # Playful flirtatious motion - continuous
-        car.set_cam_pan_angle(-22, smooth=True)
-        car.set_dir_servo_angle(-15, smooth=True)
-        _sleep(0.6, speed)
-        
-        car.set_cam_pan_angle(22, smooth=True)
-        car.set_dir_servo_angle(15, smooth=True)
-        _sleep(0.7, speed)
-        
-        car.set_cam_pan_angle(-22, smooth=True)
-        car.set_dir_servo_angle(-15, smooth=True)
-        _sleep(0.7, speed)
-        
-        # Return
-        car.set_cam_pan_angle(0, smooth=True)
-        car.set_dir_servo_angle(0, smooth=True)
-        _sleep(0.5, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'flirt', speed, tail)
+
 
+_COME_ON_THEN = (
+    # Start backing, with continuous beckoning nods
+    Frame(tilt=-18, m1=-12, m2=12, dt=0.25),
+    Frame(tilt=8, dt=0.25),
+    Frame(tilt=-18, dt=0.25),
+    Frame(tilt=8, dt=0.25),
+    Frame(tilt=0, m1=0, m2=0, dt=0.3),
+)
 
-def come_on_then(car, speed='med'):
+@safe_gesture
+def come_on_then(car, speed='med', tail=True):
     """BECKONING - Continuous nods while backing 15cm"""
-    try:
-        # Start backing
-        car.set_motor_speed(1, -12)
-        car.set_motor_speed(2, 12)
-        
-        # Continuous beckoning nods
-        car.set_cam_tilt_angle(-18, smooth=True)
-        _sleep(0.25, speed)
-        car.set_cam_tilt_angle(8, smooth=True)
-        _sleep(0.25, speed)
-        car.set_cam_tilt_angle(-18, smooth=True)
-        _sleep(0.25, speed)
-        car.set_cam_tilt_angle(8, smooth=True)
-        _sleep(0.25, speed)
-        
-        car.set_motor_speed(1, 0)
-        car.set_motor_speed(2, 0)
-        car.set_cam_tilt_angle(0, smooth=True)
-        _sleep(0.3, speed)
-        
-        car.stop()
-    except Exception:
-        try:
-            car.stop()
-            car.set_cam_pan_angle(0, smooth=True)
-            car.set_cam_tilt_angle(0, smooth=True)
-            car.set_dir_servo_angle(0, smooth=True)
-        except Exception:
-            pass
+    run_gesture(car, 'come_on_then', speed, tail)
 
 
 def play_sound(car, sound_name=None, volume=100, speed='med'):
@@ -3265,6 +2091,147 @@ def rev_engine(car, speed='med'):
     play_sound(car, "rev_engine", 100, speed)
 
 
+# Frame tables by gesture name. run_gesture() reads from here, so tables
+# loaded with load_gesture_file() take effect without a redeploy.
+GESTURE_FRAMES = {
+    # OBSERVATION
+    "look_left_then_right": _LOOK_LEFT_THEN_RIGHT,
+    "look_up_then_down": _LOOK_UP_THEN_DOWN,
+    "look_up": _LOOK_UP,
+    "inspect_floor": _INSPECT_FLOOR,
+    "look_around_nervously": _LOOK_AROUND_NERVOUSLY,
+    "curious_peek": _CURIOUS_PEEK,
+    "reverse_peek": _REVERSE_PEEK,
+    "head_spin_survey": _HEAD_SPIN_SURVEY,
+    "alert_scan": _ALERT_SCAN,
+    "search_pattern": _SEARCH_PATTERN,
+    "scout_mode": _SCOUT_MODE,
+    "investigate_noise": _INVESTIGATE_NOISE,
+    "scan_environment": _SCAN_ENVIRONMENT,
+    "approach_object": _APPROACH_OBJECT,
+    "avoid_object": _AVOID_OBJECT,
+
+    # MOVEMENT
+    "circle_dance": _CIRCLE_DANCE,
+    "wiggle_and_wait": _WIGGLE_AND_WAIT,
+    "bump_check": _BUMP_CHECK,
+    "approach_gently": _APPROACH_GENTLY,
+    "happy_spin": _HAPPY_SPIN,
+    "eager_start": _EAGER_START,
+    "show_off": _SHOW_OFF,
+    "zigzag": _ZIGZAG,
+    "charge_forward": _CHARGE_FORWARD,
+    "retreat_fast": _RETREAT_FAST,
+    "patrol_mode": _PATROL_MODE,
+    "moonwalk": _MOONWALK,
+    "ballet_spin": _BALLET_SPIN,
+    "figure_eight": _FIGURE_EIGHT,
+    "crescent_arc_left": _CRESCENT_ARC_LEFT,
+    "crescent_arc_right": _CRESCENT_ARC_RIGHT,
+
+    # REACTIONS
+    "recoil_surprise": _RECOIL_SURPRISE,
+    "flinch": _FLINCH,
+    "twitchy_nervous": _TWITCHY_NERVOUS,
+    "angry_shake": _ANGRY_SHAKE,
+    "playful_bounce": _PLAYFUL_BOUNCE,
+    "backflip_attempt": _BACKFLIP_ATTEMPT,
+    "defensive_curl": _DEFENSIVE_CURL,
+    "jump_excited": _JUMP_EXCITED,
+    "quick_look_left": _QUICK_LOOK_LEFT,
+    "quick_look_right": _QUICK_LOOK_RIGHT,
+    "show_surprise": _SHOW_SURPRISE,
+    "show_fear": _SHOW_FEAR,
+    "show_disgust": _SHOW_DISGUST,
+
+    # SOCIAL
+    "bow_respectfully": _BOW_RESPECTFULLY,
+    "bow_apologetically": _BOW_APOLOGETICALLY,
+    "intro_pose": _INTRO_POSE,
+    "end_pose": _END_POSE,
+    "greet_wave": _GREET_WAVE,
+    "farewell_wave": _FAREWELL_WAVE,
+    "hello_friend": _HELLO_FRIEND,
+    "goodbye_friend": _GOODBYE_FRIEND,
+    "beckon_forward": _BECKON_FORWARD,
+    "wait_here": _WAIT_HERE,
+    "bashful_hide": _BASHFUL_HIDE,
+    "peekaboo": _PEEKABOO,
+    "show_love": _SHOW_LOVE,
+    "present_left": _PRESENT_LEFT,
+    "present_right": _PRESENT_RIGHT,
+
+    # CELEBRATION
+    "spin_celebrate": _SPIN_CELEBRATE,
+    "spin_reverse": _SPIN_REVERSE,
+    "cheer_wave": _CHEER_WAVE,
+    "celebrate_big": _CELEBRATE_BIG,
+    "applaud_motion": _APPLAUD_MOTION,
+    "victory_pose": _VICTORY_POSE,
+    "show_joy": _SHOW_JOY,
+
+    # EMOTIONAL
+    "sad_turnaway": _SAD_TURNAWAY,
+    "confused_tilt": _CONFUSED_TILT,
+    "look_proud": _LOOK_PROUD,
+    "sigh": _SIGH,
+    "yawn": _YAWN,
+    "stretch": _STRETCH,
+    "bored_idle": _BORED_IDLE,
+    "think_long": _THINK_LONG,
+    "ponder": _PONDER,
+    "dreamy_stare": _DREAMY_STARE,
+    "ponder_and_nod": _PONDER_AND_NOD,
+    "approach_slowly": _APPROACH_SLOWLY,
+    "back_off_slowly": _BACK_OFF_SLOWLY,
+    "dance_sad": _DANCE_SAD,
+    "show_thoughtfulness": _SHOW_THOUGHTFULNESS,
+
+    # FUNCTIONAL
+    "sleep_mode": _SLEEP_MODE,
+    "wake_up": _WAKE_UP,
+    "guard_pose": _GUARD_POSE,
+    "listen": _LISTEN,
+    "listen_close": _LISTEN_CLOSE,
+    "ready_pose": _READY_POSE,
+    "charge_pose": _CHARGE_POSE,
+    "failure_pose": _FAILURE_POSE,
+    "question_pose": _QUESTION_POSE,
+    "affirm_pose": _AFFIRM_POSE,
+    "idle_breath": _IDLE_BREATH,
+    "show_shyness": _SHOW_SHYNESS,
+
+    # SIGNALING
+    "wave_head_no": _WAVE_HEAD_NO,
+    "wave_head_yes": _WAVE_HEAD_YES,
+    "call_attention": _CALL_ATTENTION,
+    "show_curiosity": _SHOW_CURIOSITY,
+    "acknowledge_signal": _ACKNOWLEDGE_SIGNAL,
+    "reject_signal": _REJECT_SIGNAL,
+    "error_shrug": _ERROR_SHRUG,
+    "signal_complete": _SIGNAL_COMPLETE,
+    "signal_error": _SIGNAL_ERROR,
+    "show_confidence": _SHOW_CONFIDENCE,
+
+    # ADVANCED
+    "dance_happy": _DANCE_HAPPY,
+    "flirt": _FLIRT,
+    "come_on_then": _COME_ON_THEN,
+}
+
+# Speed is a closed set, and the tail hold is either kept or dropped, so
+# build every table's scaled timeline at import; run_gesture() then starts
+# from a cache hit instead of compiling and scaling on the first call of
+# each gesture/speed pair.
+def _precompute_gesture(name):
+    for multiplier in set(SPEED_MULTIPLIERS.values()):
+        for tail_hold in {TAIL_HOLD, 0.0}:
+            _prepare_gesture(name, multiplier, tail_hold)
+
+for _name in GESTURE_FRAMES:
+    _precompute_gesture(_name)
+del _name
+
 # Build the EXTENDED_GESTURES dictionary mapping names to functions
 EXTENDED_GESTURES = {
     # OBSERVATION (15)
@@ -3398,6 +2365,16 @@ EXTENDED_GESTURES = {
 }
 
 def register_extended(actions_dict: dict) -> dict:
-    """Update an existing actions_dict with the extended gestures and return it."""
+    """Update an existing actions_dict with the extended gestures and return it.
+
+    Tables from the file named by NEVIL_GESTURE_FILE are loaded first, so
+    they override the built-ins and new names are registered as actions.
+    """
+    path = os.getenv('NEVIL_GESTURE_FILE')
+    if path:
+        try:
+            logger.info("Loaded gestures %s from %s", load_gesture_file(path), path)
+        except (OSError, ValueError) as e:
+            logger.error("Gesture file %s not loaded: %s", path, e)
     actions_dict.update(EXTENDED_GESTURES)
     return actions_dict
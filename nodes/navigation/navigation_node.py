@@ -8,8 +8,12 @@ Uses proven v1.0 action_helper for all movement implementations.
 import time
 import threading
 import queue
+import importlib.util
+import inspect
 import json
+import logging
 import os
+import re
 import sys
 from typing import Dict, Any, List, Optional
 from nevil_framework.base_node import NevilNode
@@ -19,47 +23,46 @@ from nevil_framework.microphone_mutex import microphone_mutex
 # from nevil_framework.speech_idle_animator import SpeechIdleAnimator
 from robot_hat import reset_mcu
 
-# Import Automatic module for autonomous behavior
-try:
-    from .automatic import Automatic
-except ImportError:
+def _load_local(name):
+    """Import nodes/navigation/<name>.py once per process
+
+    The launcher loads this file by path, so relative imports aren't
+    available here. Modules are registered under their package name, which
+    lets a module imported along the way (calibration pulls in picarx) be
+    reused instead of executed a second time.
+    """
+    key = f"nodes.navigation.{name}"
+    module = sys.modules.get(key)
+    if module is not None:
+        return module
+    path = os.path.join(os.path.dirname(__file__), f"{name}.py")
+    spec = importlib.util.spec_from_file_location(key, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load spec for {path}")
+    module = importlib.util.module_from_spec(spec)
+    # Set __package__ so relative imports (.utils) work correctly
+    module.__package__ = 'nodes.navigation'
+    sys.modules[key] = module
     try:
-        from automatic import Automatic
-    except ImportError:
-        import importlib.util
-        automatic_path = os.path.join(os.path.dirname(__file__), 'automatic.py')
-        spec = importlib.util.spec_from_file_location("automatic", automatic_path)
-        automatic_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(automatic_module)
-        Automatic = automatic_module.Automatic
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[key]
+        raise
+    return module
+
+# Import Automatic module for autonomous behavior
+Automatic = _load_local('automatic').Automatic
 
 # Hardware interface - use local picarx.py
-try:
-   from .calibration import servos_reset
-except ImportError:
-    # For dynamic loading, import directly
-    import importlib.util
-    calibration_path = os.path.join(os.path.dirname(__file__), 'calibration.py')
-    spec = importlib.util.spec_from_file_location("calibration", calibration_path)
-    calibration_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(calibration_module)
-    servos_reset = calibration_module.servos_reset
-
-# Import v1.0 action functions using importlib directly (no sys.path pollution)
-import importlib.util
-nav_dir = os.path.dirname(__file__)
-action_helper_path = os.path.join(nav_dir, 'action_helper.py')
+servos_reset = _load_local('calibration').servos_reset
 
+# Import v1.0 action functions
 try:
-    spec = importlib.util.spec_from_file_location("action_helper", action_helper_path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load spec for {action_helper_path}")
-
-    action_helper_module = importlib.util.module_from_spec(spec)
-    # Set __package__ so relative imports (.utils) work correctly
-    action_helper_module.__package__ = 'nodes.navigation'
-    spec.loader.exec_module(action_helper_module)
+    action_helper_module = _load_local('action_helper')
     actions_dict = action_helper_module.actions_dict
+    cancel_gesture = action_helper_module.cancel_gesture
+    set_cancel_check = action_helper_module.set_cancel_check
+    gesture_frames = action_helper_module.GESTURE_FRAMES
     print(f"[NAVIGATION] Imported actions_dict: {len(actions_dict)} actions")
 except Exception as e:
     print(f"[NAVIGATION ERROR] Failed to import action_helper: {e}")
@@ -67,19 +70,23 @@ except Exception as e:
     traceback.print_exc()
     # Fallback if action_helper not available
     actions_dict = {}
+    cancel_gesture = lambda: None
+    set_cancel_check = lambda check: None
+    gesture_frames = {}
     print(f"[NAVIGATION WARNING] Using empty actions_dict fallback")
 
 # Hardware interface - use local picarx.py
-try:
-    from .picarx import Picarx
-except ImportError:
-    # For dynamic loading, import directly
-    import importlib.util
-    picarx_path = os.path.join(os.path.dirname(__file__), 'picarx.py')
-    spec = importlib.util.spec_from_file_location("picarx", picarx_path)
-    picarx_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(picarx_module)
-    Picarx = picarx_module.Picarx
+Picarx = _load_local('picarx').Picarx
+
+# Auto mode voice triggers, matched anywhere in the lowercased source text.
+# One alternation scans the text once instead of once per phrase.
+AUTO_TRIGGERS_RE = re.compile('|'.join(map(re.escape, [
+    'start auto', 'go play', 'seeya nevil', 'see ya nevil',
+    'auto mode', 'automatic mode', 'go have fun', 'go explore',
+    'entertain yourself', 'do your thing'])))
+STOP_TRIGGERS_RE = re.compile('|'.join(map(re.escape, [
+    'stop auto', 'stop playing', 'come back', 'stop automatic',
+    'manual mode', 'stop exploring'])))
 
 
 class NavigationNode(NevilNode):
@@ -100,6 +107,21 @@ class NavigationNode(NevilNode):
         self.action_queue = queue.PriorityQueue(maxsize=50)
         self.current_action = None
         self.action_lock = threading.Lock()
+        # Opt-in SCHED_FIFO priority for the action thread so short gesture
+        # pulses wake on time. Off by default: every node shares this
+        # process and its GIL, and threads the action thread starts inherit
+        # the policy, so a spinning FIFO thread could starve audio and STT
+        self.action_rt_priority = int(os.getenv('NEVIL_ACTION_RT_PRIORITY', '0'))
+        # Sequences already queued when one starts run with it, up to this many
+        self.action_batch_max = 4
+        # Pause after an action so servos finish moving before the next one.
+        # v1.0 used 0.5s; frame-table gestures need none since they end
+        # once their last frame has played out
+        self.action_settle_time = 0.5
+        # Smooth servo moves finish on the car's servo thread after a gesture
+        # returns; wait up to this long for them before the microphone goes
+        # back to listening, so it doesn't pick up the last recenter
+        self.servo_idle_timeout = 1.0
 
         # Movement configuration
         self.default_speed = 30
@@ -112,6 +134,18 @@ class NavigationNode(NevilNode):
         print(f"[NAVIGATION DEBUG] self.action_functions set to: {len(self.action_functions)} actions")
         if self.action_functions:
             print(f"[NAVIGATION DEBUG] Available actions: {list(self.action_functions.keys())[:10]}")
+        # Parsed actions by raw action string; the vocabulary is fixed after
+        # init and replies reuse the same few gestures
+        self._parse_cache = {}
+        self.parse_cache_size = 512
+        # Parameter names each action function accepts, so executing an
+        # action doesn't re-run inspect.signature()
+        self._func_params = {}
+        for func in set(self.action_functions.values()):
+            try:
+                self._accepted_params(func)
+            except (TypeError, ValueError):
+                pass  # not introspectable; _execute_action will report it
 
         # Processing state
         self.actions_processed = 0
@@ -124,10 +158,11 @@ class NavigationNode(NevilNode):
         self.shutdown_event = threading.Event()
 
         # Autonomous mode GPT response handling
-        self.auto_response_queue = queue.Queue(maxsize=1)
+        # One request is in flight at a time (auto_conversation_id), so its
+        # text_response and robot_action each get a single slot
         self.auto_conversation_id = None
-        self.auto_pending_response = {}  # Store text_response and robot_action until both received
-        self.auto_response_lock = threading.Lock()
+        self._auto_text_q = queue.Queue(maxsize=1)
+        self._auto_action_q = queue.Queue(maxsize=1)
 
         # Speech idle animator - provides subtle movement while talking
         # COMMENTED OUT: Using original SpeechAnimationManager instead
@@ -177,6 +212,10 @@ class NavigationNode(NevilNode):
 
         self.logger.info("PiCar-X hardware initialized and motion reset complete")
 
+        # Let a TTS interrupt or shutdown cut a running gesture short mid-frame
+        # instead of waiting for it to finish
+        set_cancel_check(lambda: busy_state.should_interrupt() or self.shutdown_event.is_set())
+
         # Start action processing thread
         self.action_thread = threading.Thread(
             target=self._action_processing_loop,
@@ -216,12 +255,12 @@ class NavigationNode(NevilNode):
                     conversation_id = f"auto_{uuid.uuid4().hex[:8]}"
                     self.nav.auto_conversation_id = conversation_id
 
-                    # Clear any old response in queue
-                    while not self.nav.auto_response_queue.empty():
+                    # Drop a late reply left over from a timed-out request
+                    for slot in (self.nav._auto_text_q, self.nav._auto_action_q):
                         try:
-                            self.nav.auto_response_queue.get_nowait()
+                            slot.get_nowait()
                         except queue.Empty:
-                            break
+                            pass
 
                     # Request snapshot if vision is needed
                     if use_image:
@@ -249,16 +288,21 @@ class NavigationNode(NevilNode):
                     # Wait for response from AI cognition (via on_robot_action callback)
                     # Timeout after 10 seconds
                     try:
-                        response = self.nav.auto_response_queue.get(timeout=10.0)
-                        actions = response.get('actions', [])
-                        answer = response.get('answer', '')
-                        self.nav.logger.info(f"[AUTO GPT] Got response: actions={actions}, answer='{answer}'")
-                        return actions, answer
-
+                        actions = self.nav._auto_action_q.get(timeout=10.0)
                     except queue.Empty:
                         self.nav.logger.warning("[AUTO GPT] Timeout waiting for AI response")
                         return [], ""
 
+                    # text_response may trail the actions; if it doesn't
+                    # arrive shortly, treat the reply as silent
+                    try:
+                        answer = self.nav._auto_text_q.get(timeout=0.5)
+                    except queue.Empty:
+                        self.nav.logger.info("[AUTO GPT] No text_response received - assuming silent response")
+                        answer = ''
+                    self.nav.logger.info(f"[AUTO GPT] Got response: actions={actions}, answer='{answer}'")
+                    return actions, answer
+
                 except Exception as e:
                     self.nav.logger.error(f"[AUTO GPT] Error calling GPT: {e}")
                     import traceback
@@ -290,22 +334,20 @@ class NavigationNode(NevilNode):
     def _action_processing_loop(self):
         """Background action processing loop"""
         self.logger.info("🔄 [QUEUE] Action processing loop started")
+        self._set_realtime_priority()
 
         while not self.shutdown_event.is_set():
             try:
-                self.logger.debug(f"🔄 [QUEUE] Checking queue (size: {self.action_queue.qsize()})")
+                self.logger.debug("🔄 [QUEUE] Checking queue (size: %d)", self.action_queue.qsize())
 
-                # Get action from queue with timeout
-                try:
-                    priority, timestamp, action_sequence = self.action_queue.get(timeout=1.0)
-                    self.logger.info(f"📦 [QUEUE] Retrieved action sequence - Priority: {priority}, Timestamp: {timestamp}")
-                    self.logger.debug(f"📦 [QUEUE] Action sequence: {action_sequence}")
+                # Block until work arrives; cleanup() wakes us with a sentinel
+                priority, timestamp, action_sequence = self.action_queue.get()
+                if action_sequence is None:
+                    break
+                self.logger.info(f"📦 [QUEUE] Retrieved action sequence - Priority: {priority}, Timestamp: {timestamp}")
+                self.logger.debug("📦 [QUEUE] Action sequence: %s", action_sequence)
 
-                except queue.Empty:
-                    # Log every 30 seconds in debug mode to show we're alive
-                    if int(time.time()) % 30 == 0:
-                        self.logger.debug(f"🔄 [QUEUE] Queue empty, waiting... (queue size: {self.action_queue.qsize()})")
-                    continue
+                action_sequence, batched = self._collect_action_batch(action_sequence)
 
                 # Process the action sequence
                 self.logger.info(f"🚀 [QUEUE] Starting to process action sequence")
@@ -313,8 +355,9 @@ class NavigationNode(NevilNode):
                 self.logger.info(f"✅ [QUEUE] Completed processing action sequence")
 
                 # Mark task as done
-                self.action_queue.task_done()
-                self.logger.debug(f"📝 [QUEUE] Marked queue task as done")
+                for _ in range(1 + batched):
+                    self.action_queue.task_done()
+                self.logger.debug("📝 [QUEUE] Marked queue task as done")
 
             except Exception as e:
                 self.logger.error(f"❌ [QUEUE] Error in action processing loop: {e}")
@@ -322,13 +365,70 @@ class NavigationNode(NevilNode):
 
         self.logger.info("🛑 [QUEUE] Action processing loop stopped")
 
+    def _collect_action_batch(self, action_sequence: Dict[str, Any]):
+        """Fold sequences already waiting in the queue into this one
+
+        Back-to-back requests (an acknowledge, then a listen) then play as a
+        single chained sequence: one busy/microphone hand-off and start delay,
+        and the earlier request's last gesture skips its return-to-center
+        hold. Nothing is waited for, so a lone command starts at once. The
+        folded sequences' id, source text and mood are kept under 'merged'.
+        Returns the merged sequence and how many extra items it took; the
+        caller marks those done once the sequence has run.
+        """
+        batched = 0
+        while batched + 1 < self.action_batch_max:
+            try:
+                item = self.action_queue.get_nowait()
+            except queue.Empty:
+                break
+            extra = item[2]
+            if extra is None:
+                # Shutdown sentinel: hand it back to the loop without
+                # counting it as outstanding twice
+                self.action_queue.task_done()
+                self.action_queue.put_nowait(item)
+                break
+            if not batched:
+                action_sequence = dict(action_sequence, actions=list(action_sequence['actions']),
+                                       parsed=list(action_sequence['parsed']), merged=[])
+            action_sequence['actions'].extend(extra['actions'])
+            action_sequence['parsed'].extend(extra['parsed'])
+            action_sequence['merged'].append({key: extra.get(key) for key in ('action_id', 'source_text', 'mood')})
+            batched += 1
+        if batched:
+            merged_ids = [merged['action_id'] for merged in action_sequence['merged']]
+            self.logger.info(f"📦 [QUEUE] Merged {batched} queued sequence(s) {merged_ids}: {len(action_sequence['actions'])} actions")
+        return action_sequence, batched
+
+    def _set_realtime_priority(self):
+        """Move the calling thread to SCHED_FIFO, staying on SCHED_OTHER if refused
+
+        Only runs when NEVIL_ACTION_RT_PRIORITY is set above 0. Needs
+        CAP_SYS_NICE (see AmbientCapabilities in nevil.service). Threads
+        started from this one, such as the background servo ramp thread,
+        inherit the policy.
+        """
+        if self.action_rt_priority <= 0:
+            return
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.action_rt_priority))
+            self.logger.info(f"⏱️ [QUEUE] Action thread running SCHED_FIFO priority {self.action_rt_priority}")
+        except (AttributeError, OSError) as e:
+            # EPERM without CAP_SYS_NICE, or no sched_setscheduler on this OS
+            self.logger.info(f"[QUEUE] Action thread staying on default scheduler: {e}")
+            return
+
     def _process_action_sequence(self, action_sequence: Dict[str, Any]):
         """Process a sequence of actions"""
         actions = action_sequence.get('actions', [])
+        parsed = action_sequence['parsed']
         source_text = action_sequence.get('source_text', '')
         mood = action_sequence.get('mood', 'neutral')
 
         self.logger.info(f"📝 SOURCE: '{source_text}'")
+        for merged in action_sequence.get('merged', ()):
+            self.logger.info(f"📝 SOURCE (merged {merged['action_id']}, mood: {merged['mood']}): '{merged['source_text']}'")
 
         # Acquire busy state for entire action sequence - actions are interruptible
         self.logger.debug("Acquiring busy state for navigation...")
@@ -353,7 +453,7 @@ class NavigationNode(NevilNode):
                 "timestamp": time.time()
             })
 
-            for i, action_str in enumerate(actions, 1):
+            for i, (action_str, action_data) in enumerate(zip(actions, parsed), 1):
                 # Check for shutdown or interrupt
                 if self.shutdown_event.is_set():
                     self.logger.warning(f"❌ Action sequence stopped at {i}/{len(actions)}")
@@ -366,20 +466,22 @@ class NavigationNode(NevilNode):
 
                 self.logger.info(f"🎬 [{i}/{len(actions)}] Executing: '{action_str}'")
 
-                # Parse and execute action
-                action_data = self._parse_action(action_str)
                 if action_data:
+                    # Another action follows: skip the gesture's return-to-center hold
+                    if i < len(actions):
+                        action_data['params']['tail'] = False
                     start_time = time.time()
                     self._execute_action(action_data)
                     execution_time = time.time() - start_time
                     self.logger.info(f"✅ [{i}/{len(actions)}] Completed '{action_str}' in {execution_time:.2f}s")
+
+                    # Pause between actions to allow servos to complete physical movement
+                    settle = self._settle_time(action_data['name'])
+                    if settle:
+                        time.sleep(settle)
                 else:
                     self.logger.error(f"❌ [{i}/{len(actions)}] Failed to parse action: '{action_str}'")
 
-                # Pause between actions to allow servos to complete physical movement
-                # v1.0 used 0.5s - servos need time to physically finish moving
-                time.sleep(0.5)
-
             self.logger.info(f"🏁 ACTION SEQUENCE COMPLETE: {len(actions)} actions finished")
 
             # Publish navigation status - completed
@@ -397,6 +499,13 @@ class NavigationNode(NevilNode):
             self.logger.error(f"Error processing action sequence: {e}")
 
         finally:
+            if self.car is not None:
+                try:
+                    if not self.car.wait_servos_idle(self.servo_idle_timeout):
+                        self.logger.warning("Servos still moving after navigation; releasing anyway")
+                except Exception as e:
+                    self.logger.error(f"Error waiting for servos to settle: {e}")
+
             # Always release busy state
             busy_state.release()
             self.logger.debug("Released busy state after navigation")
@@ -404,11 +513,33 @@ class NavigationNode(NevilNode):
             # Release microphone mutex
             microphone_mutex.release_noisy_activity("navigation")
 
+    def _settle_time(self, name: str) -> float:
+        """Seconds to wait after action name before starting the next one"""
+        # Gesture names carry a ':speed' suffix when not at 'med'
+        if name.split(':', 1)[0] in gesture_frames:
+            return 0.0
+        return self.action_settle_time
+
     def _parse_action(self, action_str: str) -> Optional[Dict[str, Any]]:
+        """Parse an action string into function and parameters, reusing earlier parses"""
+        cached = self._parse_cache.get(action_str)
+        if cached is None:
+            cached = self._parse_action_uncached(action_str)
+            if cached is None:
+                return None
+            if len(self._parse_cache) < self.parse_cache_size:
+                self._parse_cache[action_str] = cached
+        else:
+            self.logger.debug("🔍 [PARSE] Cache hit: '%s' -> %s", action_str, cached['name'])
+        # Callers adjust params (e.g. tail), so hand out a fresh dict
+        return dict(cached, params=dict(cached['params']))
+
+    def _parse_action_uncached(self, action_str: str) -> Optional[Dict[str, Any]]:
         """Parse an action string into function and parameters"""
         self.logger.info(f"🔍 [PARSE] Parsing action: '{action_str}'")
-        self.logger.debug(f"🔍 [PARSE] Available action functions: {len(self.action_functions)} total")
-        self.logger.debug(f"🔍 [PARSE] Action functions keys (first 10): {list(self.action_functions.keys())[:10]}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("🔍 [PARSE] Available action functions: %d total", len(self.action_functions))
+            self.logger.debug("🔍 [PARSE] Action functions keys (first 10): %s", list(self.action_functions)[:10])
 
         try:
             # First, check for speed modifier (e.g., "happy_spin:fast" or "ponder:slow")
@@ -417,17 +548,17 @@ class NavigationNode(NevilNode):
                 action_str, speed_part = action_str.rsplit(':', 1)
                 if speed_part.strip() in ['slow', 'med', 'fast']:
                     gesture_speed = speed_part.strip()
-                    self.logger.debug(f"🔍 [PARSE] Detected speed modifier: {gesture_speed}")
+                    self.logger.debug("🔍 [PARSE] Detected speed modifier: %s", gesture_speed)
 
             parts = action_str.split()
-            self.logger.debug(f"🔍 [PARSE] Split into parts: {parts}")
+            self.logger.debug("🔍 [PARSE] Split into parts: %s", parts)
 
             if not parts:
                 self.logger.error(f"🔍 [PARSE] Empty action string after split")
                 return None
 
             action_name = parts[0]
-            self.logger.debug(f"🔍 [PARSE] Primary action name: '{action_name}'")
+            self.logger.debug("🔍 [PARSE] Primary action name: '%s'", action_name)
 
             # Handle parameterized movement actions
             if action_name in ['forward', 'backward']:
@@ -437,7 +568,7 @@ class NavigationNode(NevilNode):
 
                 function = self.action_functions.get(action_name)
                 self.logger.info(f"🔍 [PARSE] Movement function found: {function is not None}")
-                self.logger.debug(f"🔍 [PARSE] Distance: {distance}cm, Speed: {speed}")
+                self.logger.debug("🔍 [PARSE] Distance: %scm, Speed: %s", distance, speed)
 
                 result = {
                     'function': function,
@@ -455,7 +586,7 @@ class NavigationNode(NevilNode):
 
                 function = self.action_functions.get(action_name)
                 self.logger.info(f"🔍 [PARSE] Sound function found: {function is not None}")
-                self.logger.debug(f"🔍 [PARSE] Sound: {sound_name}, Volume: {volume}")
+                self.logger.debug("🔍 [PARSE] Sound: %s, Volume: %s", sound_name, volume)
 
                 result = {
                     'function': function,
@@ -483,7 +614,7 @@ class NavigationNode(NevilNode):
 
                 # Try joining parts for multi-word actions like "shake head"
                 full_action = ' '.join(parts)
-                self.logger.debug(f"🔍 [PARSE] Trying full action: '{full_action}'")
+                self.logger.debug("🔍 [PARSE] Trying full action: '%s'", full_action)
 
                 if full_action in self.action_functions:
                     self.logger.info(f"🔍 [PARSE] Found full action match: '{full_action}'")
@@ -498,7 +629,7 @@ class NavigationNode(NevilNode):
 
                 # Try converting underscores to spaces for AI-generated action names
                 underscore_to_space = action_str.replace('_', ' ')
-                self.logger.debug(f"🔍 [PARSE] Trying underscore conversion: '{underscore_to_space}'")
+                self.logger.debug("🔍 [PARSE] Trying underscore conversion: '%s'", underscore_to_space)
 
                 if underscore_to_space in self.action_functions:
                     self.logger.info(f"🔍 [PARSE] Found underscore match: '{underscore_to_space}'")
@@ -512,17 +643,24 @@ class NavigationNode(NevilNode):
                     return result
 
             self.logger.warning(f"❌ [PARSE] Unknown action: '{action_str}' - not found in action_functions")
-            self.logger.debug(f"❌ [PARSE] Available actions: {list(self.action_functions.keys())}")
+            self.logger.debug("❌ [PARSE] Available actions: %s", list(self.action_functions))
             return None
 
         except Exception as e:
             self.logger.error(f"❌ [PARSE] Error parsing action '{action_str}': {e}")
             return None
 
+    def _accepted_params(self, func) -> frozenset:
+        """Parameter names func accepts, looked up once per function"""
+        names = self._func_params.get(func)
+        if names is None:
+            names = self._func_params[func] = frozenset(inspect.signature(func).parameters)
+        return names
+
     def _execute_action(self, action_data: Dict[str, Any]):
         """Execute a parsed action"""
         self.logger.info(f"⚡ [EXEC] Starting action execution")
-        self.logger.debug(f"⚡ [EXEC] Full action data: {action_data}")
+        self.logger.debug("⚡ [EXEC] Full action data: %s", action_data)
 
         if not action_data:
             self.logger.error(f"❌ [EXEC] No action data provided")
@@ -538,32 +676,34 @@ class NavigationNode(NevilNode):
             name = action_data['name']
 
             self.logger.info(f"⚡ [EXEC] Action: {name}")
-            self.logger.debug(f"⚡ [EXEC] Function: {func}")
-            self.logger.debug(f"⚡ [EXEC] Parameters: {params}")
-            self.logger.debug(f"⚡ [EXEC] Car object: {self.car}")
+            self.logger.debug("⚡ [EXEC] Function: %s", func)
+            self.logger.debug("⚡ [EXEC] Parameters: %s", params)
+            self.logger.debug("⚡ [EXEC] Car object: %s", self.car)
 
             # Execute on real hardware
             self.logger.info(f"🚗 [HARDWARE] Calling action_helper function: {func.__name__ if hasattr(func, '__name__') else str(func)}")
-            self.logger.debug(f"🚗 [HARDWARE] With car: {self.car} and params: {params}")
+            self.logger.debug("🚗 [HARDWARE] With car: %s and params: %s", self.car, params)
 
             start_time = time.time()
 
             if params:
-                self.logger.debug(f"🚗 [HARDWARE] Calling with params: func(car, **{params})")
+                self.logger.debug("🚗 [HARDWARE] Calling with params: func(car, **%s)", params)
                 # Check if function accepts speed parameter
-                import inspect
-                sig = inspect.signature(func)
-                if 'speed' in params and 'speed' not in sig.parameters:
+                accepted = self._accepted_params(func)
+                if 'speed' in params and 'speed' not in accepted:
                     # Function doesn't accept speed, remove it from params
-                    self.logger.debug(f"🚗 [HARDWARE] Function doesn't accept 'speed' parameter, removing it")
+                    self.logger.debug("🚗 [HARDWARE] Function doesn't accept 'speed' parameter, removing it")
                     params = {k: v for k, v in params.items() if k != 'speed'}
+                if 'tail' in params and 'tail' not in accepted:
+                    # Only frame-table gestures take tail
+                    params = {k: v for k, v in params.items() if k != 'tail'}
 
                 if params:
                     func(self.car, **params)
                 else:
                     func(self.car)
             else:
-                self.logger.debug(f"🚗 [HARDWARE] Calling without params: func(car)")
+                self.logger.debug("🚗 [HARDWARE] Calling without params: func(car)")
                 func(self.car)
 
             execution_time = time.time() - start_time
@@ -572,8 +712,7 @@ class NavigationNode(NevilNode):
         except Exception as e:
             self.logger.error(f"❌ [EXEC] Action execution error for '{action_data.get('name', 'unknown')}': {e}")
             self.logger.error(f"❌ [EXEC] Exception details: {type(e).__name__}: {str(e)}")
-            import traceback
-            self.logger.debug(f"❌ [EXEC] Full traceback: {traceback.format_exc()}")
+            self.logger.debug("❌ [EXEC] Full traceback", exc_info=True)
 
     def on_text_response(self, message):
         """Handle text response messages from AI cognition (for autonomous mode)"""
@@ -585,20 +724,10 @@ class NavigationNode(NevilNode):
             if conversation_id and conversation_id == self.auto_conversation_id:
                 self.logger.info(f"[AUTO GPT] Received text_response for autonomous mode: '{text}'")
 
-                with self.auto_response_lock:
-                    # Store the text response
-                    if conversation_id not in self.auto_pending_response:
-                        self.auto_pending_response[conversation_id] = {}
-                    self.auto_pending_response[conversation_id]['answer'] = text
-
-                    # Check if we have both text and actions
-                    if 'actions' in self.auto_pending_response[conversation_id]:
-                        # We have complete response, send it to queue
-                        complete_response = self.auto_pending_response[conversation_id]
-                        self.logger.info(f"[AUTO GPT] Complete response ready: {complete_response}")
-                        self.auto_response_queue.put(complete_response)
-                        # Clean up
-                        del self.auto_pending_response[conversation_id]
+                try:
+                    self._auto_text_q.put_nowait(text)
+                except queue.Full:
+                    self.logger.warning("[AUTO GPT] Duplicate text_response ignored")
 
         except Exception as e:
             self.logger.error(f"Error handling text response: {e}")
@@ -613,34 +742,24 @@ class NavigationNode(NevilNode):
         # DEBUG: Log what we're checking
         self.logger.info(f"🔍 [AUTO CHECK] Checking source_text for triggers: '{source_text}'")
 
-        # Auto mode triggers
-        auto_triggers = ['start auto', 'go play', 'seeya nevil', 'see ya nevil',
-                        'auto mode', 'automatic mode', 'go have fun', 'go explore',
-                        'entertain yourself', 'do your thing']
-        stop_triggers = ['stop auto', 'stop playing', 'come back', 'stop automatic',
-                        'manual mode', 'stop exploring']
-
         # Check for auto mode commands
-        for trigger in auto_triggers:
-            if trigger in source_text:
-                self.logger.info(f"🤖 [AUTO] Auto mode triggered by: '{trigger}'")
-                self.start_auto_mode()
-                # Still process any immediate actions before going auto
-                break
-
-        for trigger in stop_triggers:
-            if trigger in source_text:
-                self.logger.info(f"🛑 [AUTO] Auto mode stopped by: '{trigger}'")
-                self.stop_auto_mode()
-                break
-        self.logger.debug(f"📨 [MESSAGE] Full message object: {message}")
-        self.logger.debug(f"📨 [MESSAGE] Message type: {type(message)}")
-        self.logger.debug(f"📨 [MESSAGE] Message attributes: {dir(message)}")
+        match = AUTO_TRIGGERS_RE.search(source_text)
+        if match:
+            self.logger.info(f"🤖 [AUTO] Auto mode triggered by: '{match.group()}'")
+            self.start_auto_mode()
+            # Still process any immediate actions before going auto
+
+        match = STOP_TRIGGERS_RE.search(source_text)
+        if match:
+            self.logger.info(f"🛑 [AUTO] Auto mode stopped by: '{match.group()}'")
+            self.stop_auto_mode()
+        self.logger.debug("📨 [MESSAGE] Full message object: %s", message)
+        self.logger.debug("📨 [MESSAGE] Message type: %s", type(message))
 
         try:
             data = message.data
             self.logger.info(f"📨 [MESSAGE] Message data: {data}")
-            self.logger.debug(f"📨 [MESSAGE] Data type: {type(data)}")
+            self.logger.debug("📨 [MESSAGE] Data type: %s", type(data))
 
             actions = data.get('actions', [])
             priority = data.get('priority', 100)
@@ -655,36 +774,10 @@ class NavigationNode(NevilNode):
             if conversation_id and conversation_id == self.auto_conversation_id:
                 self.logger.info(f"[AUTO GPT] Received robot_action for autonomous mode")
 
-                with self.auto_response_lock:
-                    # Store the actions
-                    if conversation_id not in self.auto_pending_response:
-                        self.auto_pending_response[conversation_id] = {}
-                    self.auto_pending_response[conversation_id]['actions'] = actions
-
-                    # Check if we have both text and actions
-                    if 'answer' in self.auto_pending_response[conversation_id]:
-                        # We have complete response, send it to queue
-                        complete_response = self.auto_pending_response[conversation_id]
-                        self.logger.info(f"[AUTO GPT] Complete response ready: {complete_response}")
-                        self.auto_response_queue.put(complete_response)
-                        # Clean up
-                        del self.auto_pending_response[conversation_id]
-                    else:
-                        # No text_response yet - wait briefly for it
-                        # If it doesn't arrive, assume empty answer (silence)
-                        import threading
-                        def check_for_text_response():
-                            time.sleep(0.5)  # Wait 500ms for text_response
-                            with self.auto_response_lock:
-                                if conversation_id in self.auto_pending_response and 'answer' not in self.auto_pending_response[conversation_id]:
-                                    # Still no answer after waiting - assume silent response
-                                    self.logger.info(f"[AUTO GPT] No text_response received - assuming silent response")
-                                    self.auto_pending_response[conversation_id]['answer'] = ''
-                                    complete_response = self.auto_pending_response[conversation_id]
-                                    self.auto_response_queue.put(complete_response)
-                                    del self.auto_pending_response[conversation_id]
-
-                        threading.Thread(target=check_for_text_response, daemon=True).start()
+                try:
+                    self._auto_action_q.put_nowait(actions)
+                except queue.Full:
+                    self.logger.warning("[AUTO GPT] Duplicate robot_action ignored")
 
                 # For autonomous mode, don't queue the actions here - they'll be handled by automatic.py
                 return
@@ -694,15 +787,18 @@ class NavigationNode(NevilNode):
                 return
 
             # Create action sequence
+            # Parse here on the message thread so the action thread goes
+            # straight from one action to the next
             action_sequence = {
                 'actions': actions,
+                'parsed': [self._parse_action(a) for a in actions],
                 'source_text': source_text,
                 'mood': data.get('mood', 'neutral'),
                 'timestamp': time.time(),
                 'action_id': message.message_id if hasattr(message, 'message_id') else f"action_{int(time.time())}"
             }
 
-            self.logger.info(f"📨 [MESSAGE] Created action sequence: {action_sequence}")
+            self.logger.info(f"📨 [MESSAGE] Created action sequence {action_sequence['action_id']}: {len(actions)} actions")
 
             # Add to priority queue
             self.logger.info(f"📨 [MESSAGE] Adding to queue with priority {priority}")
@@ -718,8 +814,7 @@ class NavigationNode(NevilNode):
         except Exception as e:
             self.logger.error(f"❌ [MESSAGE] Error handling robot action: {e}")
             self.logger.error(f"❌ [MESSAGE] Exception type: {type(e).__name__}")
-            import traceback
-            self.logger.debug(f"❌ [MESSAGE] Full traceback: {traceback.format_exc()}")
+            self.logger.debug("❌ [MESSAGE] Full traceback", exc_info=True)
 
     def on_mood_change(self, message):
         """Handle mood change messages from AI cognition"""
@@ -839,6 +934,7 @@ class NavigationNode(NevilNode):
                         # Queue actions for execution
                         action_sequence = {
                             'actions': actions,
+                            'parsed': [self._parse_action(a) for a in actions],
                             'source_text': f'Auto mode ({self.automatic.current_mood_name})',
                             'mood': self.automatic.current_mood_name,
                             'timestamp': time.time()
@@ -1054,6 +1150,13 @@ class NavigationNode(NevilNode):
 
         # Signal shutdown to all threads
         self.shutdown_event.set()
+        cancel_gesture()
+        # Wake the action thread from its blocking get(); the sentinel sorts
+        # ahead of any queued sequence
+        try:
+            self.action_queue.put_nowait((float('-inf'), time.time(), None))
+        except queue.Full:
+            pass  # thread is busy and will see shutdown_event when it returns
 
         # Stop auto mode if running
         if self.auto_enabled:
@@ -1076,9 +1179,7 @@ class NavigationNode(NevilNode):
         if self.car:
             try:
                 self.car.stop()
-                self.car.set_dir_servo_angle(0)
-                self.car.set_cam_pan_angle(0)
-                self.car.set_cam_tilt_angle(0)
+                self.car.recenter()
                 self.logger.info("Hardware reset complete")
             except Exception as e:
                 self.logger.warning(f"Error resetting hardware: {e}")
@@ -4,6 +4,8 @@ from robot_hat import Ultrasonic, utils
 from robot_hat import reset_mcu 
 import time
 import os
+import threading
+from functools import lru_cache
 
 try:
     from robot_hat import Grayscale_Module
@@ -18,6 +20,27 @@ def constrain(x, min_val, max_val):
     '''
     return max(min_val, min(max_val, x))
 
+# Easing applied to smooth servo moves: 'cubic' eases in and out of the
+# move, 'linear' steps evenly
+RAMP_PROFILE = 'cubic'
+
+@lru_cache(maxsize=None)
+def ramp_positions(start, target, steps, profile=RAMP_PROFILE):
+    '''
+    Intermediate angles of a smooth servo move, ending on target.
+
+    The cubic profile (3t^2 - 2t^3) starts and stops the servo gently
+    instead of jerking it at the ends of the move. Gestures reuse a small
+    set of angles, so each ramp is computed once and then served from the
+    cache.
+    '''
+    span = target - start
+    if profile == 'cubic':
+        fractions = ((i + 1) / steps for i in range(steps))
+        return tuple(start + span * t * t * (3 - 2 * t) for t in fractions)
+    step_size = span / steps
+    return tuple(start + step_size * (i + 1) for i in range(steps))
+
 class Picarx(object):
     CONFIG = '/opt/picar-x/picar-x.conf'
 
@@ -71,10 +94,16 @@ class Picarx(object):
         self.cam_tilt.angle(self.cam_tilt_cali_val)
         time.sleep(0.1)
 
-        # Track current servo positions for smooth movements
+        # Track current servo positions for smooth movements. These are logical
+        # angles: the servos were just written to their calibrated zero.
         self.current_dir_angle = self.dir_cali_val
-        self.current_pan_angle = self.cam_pan_cali_val
-        self.current_tilt_angle = self.cam_tilt_cali_val
+        self.current_pan_angle = 0
+        self.current_tilt_angle = 0
+        # Background smooth moves started by apply(wait=False):
+        # current-angle attribute -> [writer, remaining positions, last position]
+        self._servo_ramps = {}
+        self._servo_cond = threading.Condition()
+        self._servo_thread = None
 
         # --------- motors init ---------
         self.left_rear_dir_pin = Pin(motor_pins[0])
@@ -88,6 +117,8 @@ class Picarx(object):
         self.cali_dir_value = [int(i.strip()) for i in self.cali_dir_value.strip().strip("[]").split(",")]
         self.cali_speed_value = [0, 0]
         self.dir_current_angle = 0
+        # last (direction, pwm) written per motor, None when unknown
+        self._motor_outputs = [None, None]
         # init pwm
         for pin in self.motor_speed_pins:
             pin.period(self.PERIOD)
@@ -139,25 +170,81 @@ class Picarx(object):
         param motor: motor index, 1 means left motor, 2 means right motor
         type motor: int
         param speed: speed
-        type speed: int      
+        type speed: int
         '''
-        speed = constrain(speed, -100, 100)
         motor -= 1
+        output = self._motor_output(motor, speed)
+        if output == self._motor_outputs[motor]:
+            return
+        direction, speed = output
+        try:
+            if direction < 0:
+                self.motor_direction_pins[motor].high()
+                self.motor_speed_pins[motor].pulse_width_percent(speed)
+            else:
+                self.motor_direction_pins[motor].low()
+                self.motor_speed_pins[motor].pulse_width_percent(speed)
+        except BaseException:
+            # The pins may be anywhere now: forget them so the next
+            # command is written rather than skipped
+            self._motor_outputs[motor] = None
+            raise
+        self._motor_outputs[motor] = output
+
+    def set_motor_speeds(self, left_speed, right_speed):
+        ''' set both motor speeds in one call
+
+        Both direction pins are latched first and the two PWM channels are
+        then written back-to-back, so the wheels change speed together
+        instead of one full set_motor_speed() apart. Only the pins whose
+        value changed are written, so e.g. a speed change in the same
+        direction costs two PWM writes and no direction-pin writes.
+
+        param left_speed: left motor speed
+        type left_speed: int
+        param right_speed: right motor speed
+        type right_speed: int
+        '''
+        outputs = [self._motor_output(0, left_speed), self._motor_output(1, right_speed)]
+        previous = self._motor_outputs
+        if outputs == previous:
+            return
+        # None means the pin state is unknown, so it is always written
+        known = [p or (None, None) for p in previous]
+        try:
+            for pin, (direction, _), (old_direction, _) in zip(self.motor_direction_pins, outputs, known):
+                if old_direction is None or (direction < 0) != (old_direction < 0):
+                    if direction < 0:
+                        pin.high()
+                    else:
+                        pin.low()
+            for pin, (_, speed), (_, old_speed) in zip(self.motor_speed_pins, outputs, known):
+                if speed != old_speed:
+                    pin.pulse_width_percent(speed)
+        except BaseException:
+            # Forget every motor this call was changing, so the next
+            # command is written rather than skipped
+            self._motor_outputs = [old if old == new else None
+                                   for old, new in zip(previous, outputs)]
+            raise
+        self._motor_outputs = outputs
+
+    def motors_off(self):
+        ''' cut both motors at once, without stop()'s speed ramp '''
+        self.set_motor_speeds(0, 0)
+
+    def _motor_output(self, motor, speed):
+        '''Map a -100..100 speed to (direction, pwm percent) for a 0-based motor index'''
+        speed = constrain(speed, -100, 100)
         if speed >= 0:
             direction = 1 * self.cali_dir_value[motor]
-        elif speed < 0:
+        else:
             direction = -1 * self.cali_dir_value[motor]
         speed = abs(speed)
-        # print(f"direction: {direction}, speed: {speed}")
         if speed != 0:
             speed = int(speed /2 ) + 50
         speed = speed - self.cali_speed_value[motor]
-        if direction < 0:
-            self.motor_direction_pins[motor].high()
-            self.motor_speed_pins[motor].pulse_width_percent(speed)
-        else:
-            self.motor_direction_pins[motor].low()
-            self.motor_speed_pins[motor].pulse_width_percent(speed)
+        return direction, speed
 
     def motor_speed_calibration(self, value):
         self.cali_speed_value = value
@@ -187,18 +274,25 @@ class Picarx(object):
         self.dir_cali_val = value
         self.config_flie.set("picarx_dir_servo", "%s"%value)
         self.dir_servo_pin.angle(value)
+        self.dir_current_angle = 0
 
     def set_dir_servo_angle(self, value, smooth=True, steps=5):
-        '''Set direction servo angle with optional smooth movement'''
+        '''Set direction servo angle with optional smooth movement
+
+        smooth='auto' ramps on the background servo thread and returns at
+        once; the next command to this servo cuts the ramp short.
+        '''
+        if smooth == 'auto':
+            self.apply(steer=value, smooth=True, steps=steps, wait=False)
+            return
+        self._cancel_ramp('dir_current_angle')
         target_angle = constrain(value, self.DIR_MIN, self.DIR_MAX)
+        if target_angle == self.dir_current_angle:
+            return  # already there, skip the servo write
 
         if smooth and abs(target_angle - self.dir_current_angle) > 5:
             # Smooth movement for large angle changes
-            current = self.dir_current_angle
-            step_size = (target_angle - current) / steps
-
-            for i in range(steps):
-                intermediate = current + (step_size * (i + 1))
+            for intermediate in ramp_positions(self.dir_current_angle, target_angle, steps):
                 angle_value = intermediate + self.dir_cali_val
                 self.dir_servo_pin.angle(angle_value)
                 time.sleep(0.02)  # Small delay for smooth movement
@@ -213,24 +307,32 @@ class Picarx(object):
         self.cam_pan_cali_val = value
         self.config_flie.set("picarx_cam_pan_servo", "%s"%value)
         self.cam_pan.angle(value)
+        self.current_pan_angle = 0
 
     def cam_tilt_servo_calibrate(self, value):
         self.cam_tilt_cali_val = value
         self.config_flie.set("picarx_cam_tilt_servo", "%s"%value)
         self.cam_tilt.angle(value)
+        self.current_tilt_angle = 0
 
     def set_cam_pan_angle(self, value, smooth=True, steps=5):
-        '''Set camera pan angle with optional smooth movement'''
+        '''Set camera pan angle with optional smooth movement
+
+        smooth='auto' ramps on the background servo thread and returns at
+        once; the next command to this servo cuts the ramp short.
+        '''
+        if smooth == 'auto':
+            self.apply(pan=value, smooth=True, steps=steps, wait=False)
+            return
+        self._cancel_ramp('current_pan_angle')
         target_angle = constrain(value, self.CAM_PAN_MIN, self.CAM_PAN_MAX)
+        if target_angle == self.current_pan_angle:
+            return  # already there, skip the servo write
 
         if smooth and hasattr(self, 'current_pan_angle'):
             if abs(target_angle - self.current_pan_angle) > 10:
                 # Smooth movement for large angle changes
-                current = self.current_pan_angle
-                step_size = (target_angle - current) / steps
-
-                for i in range(steps):
-                    intermediate = current + (step_size * (i + 1))
+                for intermediate in ramp_positions(self.current_pan_angle, target_angle, steps):
                     self.cam_pan.angle(-1*(intermediate + -1*self.cam_pan_cali_val))
                     time.sleep(0.02)
             else:
@@ -241,17 +343,23 @@ class Picarx(object):
         self.current_pan_angle = target_angle
 
     def set_cam_tilt_angle(self, value, smooth=True, steps=5):
-        '''Set camera tilt angle with optional smooth movement'''
+        '''Set camera tilt angle with optional smooth movement
+
+        smooth='auto' ramps on the background servo thread and returns at
+        once; the next command to this servo cuts the ramp short.
+        '''
+        if smooth == 'auto':
+            self.apply(tilt=value, smooth=True, steps=steps, wait=False)
+            return
+        self._cancel_ramp('current_tilt_angle')
         target_angle = constrain(value, self.CAM_TILT_MIN, self.CAM_TILT_MAX)
+        if target_angle == self.current_tilt_angle:
+            return  # already there, skip the servo write
 
         if smooth and hasattr(self, 'current_tilt_angle'):
             if abs(target_angle - self.current_tilt_angle) > 10:
                 # Smooth movement for large angle changes
-                current = self.current_tilt_angle
-                step_size = (target_angle - current) / steps
-
-                for i in range(steps):
-                    intermediate = current + (step_size * (i + 1))
+                for intermediate in ramp_positions(self.current_tilt_angle, target_angle, steps):
                     self.cam_tilt.angle(-1*(intermediate + -1*self.cam_tilt_cali_val))
                     time.sleep(0.02)
             else:
@@ -261,6 +369,154 @@ class Picarx(object):
 
         self.current_tilt_angle = target_angle
 
+    def apply(self, pan=None, tilt=None, steer=None, m1=None, m2=None, smooth=False, steps=5, wait=True):
+        ''' set any mix of camera, steering and motors in one call
+
+        Motors are written first, through one set_motor_speeds() when both
+        are given. Smooth servo moves are stepped together, so a pan+tilt
+        change ramps in a single pass instead of one full ramp per servo.
+        Servos under their usual smoothing threshold are written directly.
+
+        param pan: camera pan angle, None leaves it unchanged
+        type pan: int
+        param tilt: camera tilt angle, None leaves it unchanged
+        type tilt: int
+        param steer: direction servo angle, None leaves it unchanged
+        type steer: int
+        param m1: left motor speed, None leaves it unchanged
+        type m1: int
+        param m2: right motor speed, None leaves it unchanged
+        type m2: int
+        param smooth: ramp large servo changes
+        type smooth: bool
+        param wait: block until smooth moves finish; False hands them to a
+            background thread (see wait_servos_idle)
+        type wait: bool
+        '''
+        # (current-angle attribute, start, target, smoothing threshold, writer)
+        moves = []
+        if pan is not None:
+            self._cancel_ramp('current_pan_angle')
+            moves.append(('current_pan_angle', self.current_pan_angle,
+                          constrain(pan, self.CAM_PAN_MIN, self.CAM_PAN_MAX), 10,
+                          self._write_pan))
+        if tilt is not None:
+            self._cancel_ramp('current_tilt_angle')
+            moves.append(('current_tilt_angle', self.current_tilt_angle,
+                          constrain(tilt, self.CAM_TILT_MIN, self.CAM_TILT_MAX), 10,
+                          self._write_tilt))
+        if steer is not None:
+            self._cancel_ramp('dir_current_angle')
+            moves.append(('dir_current_angle', self.dir_current_angle,
+                          constrain(steer, self.DIR_MIN, self.DIR_MAX), 5,
+                          self._write_steer))
+
+        # Sort the moves before touching the hardware, so the motor and
+        # direct servo writes below go out back-to-back
+        ramped = []
+        direct = []
+        for move in moves:
+            _, start, target, threshold, write = move
+            if target == start:
+                continue  # already there, skip the servo write
+            if smooth and abs(target - start) > threshold:
+                ramped.append(move)
+            else:
+                direct.append((write, target))
+
+        if m1 is not None and m2 is not None:
+            self.set_motor_speeds(m1, m2)
+        elif m1 is not None:
+            self.set_motor_speed(1, m1)
+        elif m2 is not None:
+            self.set_motor_speed(2, m2)
+        for write, target in direct:
+            write(target)
+        if ramped and not wait:
+            with self._servo_cond:
+                for attr, start, target, _, write in ramped:
+                    self._servo_ramps[attr] = [write, list(ramp_positions(start, target, steps)), start]
+                self._servo_cond.notify_all()
+            if self._servo_thread is None:
+                self._servo_thread = threading.Thread(target=self._servo_driver, daemon=True)
+                self._servo_thread.start()
+        else:
+            paths = [(write, ramp_positions(start, target, steps)) for _, start, target, _, write in ramped]
+            for i in range(steps if ramped else 0):
+                for write, positions in paths:
+                    write(positions[i])
+                time.sleep(0.02)
+
+        for attr, _, target, _, _ in moves:
+            setattr(self, attr, target)
+
+    # Logical angle -> servo write, with the calibration offset applied at
+    # write time so a recalibration takes effect at once
+    def _write_pan(self, angle):
+        self.cam_pan.angle(-1*(angle + -1*self.cam_pan_cali_val))
+
+    def _write_tilt(self, angle):
+        self.cam_tilt.angle(-1*(angle + -1*self.cam_tilt_cali_val))
+
+    def _write_steer(self, angle):
+        self.dir_servo_pin.angle(angle + self.dir_cali_val)
+
+    def safe_neutral(self):
+        '''Motors off and every servo straight to center, for error paths
+
+        Unlike stop() + set_*_angle(0) there is no speed ramp and no
+        smoothing: both PWM channels go to 0, direction pins low, and each
+        servo gets a single write to its calibrated zero.
+        '''
+        # Held throughout so the servo driver thread can't write between
+        # these writes (it steps ramps under the same condition)
+        with self._servo_cond:
+            self._servo_ramps.clear()
+            self._servo_cond.notify_all()
+            # Unknown until every motor write below has gone out
+            self._motor_outputs = [None, None]
+            for pin in self.motor_speed_pins:
+                pin.pulse_width_percent(0)
+            for pin in self.motor_direction_pins:
+                pin.low()
+            self._motor_outputs = [(1, 0), (1, 0)]  # direction pins low, PWM 0
+            self.cam_pan.angle(self.cam_pan_cali_val)
+            self.cam_tilt.angle(self.cam_tilt_cali_val)
+            self.dir_servo_pin.angle(self.dir_cali_val)
+            self.current_pan_angle = 0
+            self.current_tilt_angle = 0
+            self.dir_current_angle = 0
+
+    def wait_servos_idle(self, timeout=None):
+        '''Block until background smooth moves finish. Returns False on timeout.'''
+        with self._servo_cond:
+            return self._servo_cond.wait_for(lambda: not self._servo_ramps, timeout)
+
+    def _cancel_ramp(self, attr):
+        '''Drop a background move on one servo, tracking it where the ramp got to'''
+        if attr not in self._servo_ramps:
+            return
+        with self._servo_cond:
+            ramp = self._servo_ramps.pop(attr, None)
+            if ramp is not None:
+                setattr(self, attr, ramp[2])
+                self._servo_cond.notify_all()
+
+    def _servo_driver(self):
+        '''Step every active background ramp once per 20 ms tick'''
+        while True:
+            with self._servo_cond:
+                self._servo_cond.wait_for(lambda: self._servo_ramps)
+                for attr, ramp in list(self._servo_ramps.items()):
+                    write, positions = ramp[0], ramp[1]
+                    ramp[2] = positions.pop(0)
+                    write(ramp[2])
+                    if not positions:
+                        del self._servo_ramps[attr]
+                if not self._servo_ramps:
+                    self._servo_cond.notify_all()
+            time.sleep(0.02)
+
     def set_power(self, speed):
         self.set_motor_speed(1, speed)
         self.set_motor_speed(2, speed)
@@ -303,6 +559,14 @@ class Picarx(object):
         '''
         Gradually reduce speed to stop smoothly
         '''
+        # Already stopped (both PWM channels known to be 0): nothing to ramp.
+        # The cache only holds writes that completed, so this can't skip a
+        # stop after a failed write
+        previous = self._motor_outputs
+        if all(output is not None and output[1] == 0 for output in previous):
+            return
+        # The ramp leaves PWM at 50/25 if a write fails part way
+        self._motor_outputs = [None, None]
         # Get current speeds (approximate)
         for speed_reduction in [50, 25, 0]:
             if speed_reduction > 0:
@@ -317,6 +581,9 @@ class Picarx(object):
                 # Ensure complete stop
                 self.motor_speed_pins[0].pulse_width_percent(0)
                 self.motor_speed_pins[1].pulse_width_percent(0)
+        # PWM was written directly above and the direction pins are untouched
+        self._motor_outputs = [None if output is None else (output[0], 0)
+                               for output in previous]
 
     def get_distance(self):
         return self.ultrasonic.read()
@@ -351,11 +618,17 @@ class Picarx(object):
         else:
             raise ValueError("grayscale reference must be a 1*3 list")
 
+    def recenter(self, smooth=True):
+        '''Center pan, tilt and steering in one apply() pass
+
+        The three servos ramp together instead of one full ramp after
+        another. Motors are left alone.
+        '''
+        self.apply(pan=0, tilt=0, steer=0, smooth=smooth)
+
     def reset(self):
         self.stop()
-        self.set_dir_servo_angle(0)
-        self.set_cam_tilt_angle(0)
-        self.set_cam_pan_angle(0)
+        self.recenter()
 
 if __name__ == "__main__":
     px = Picarx()
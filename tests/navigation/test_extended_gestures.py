@@ -0,0 +1,248 @@
+"""
+Tests for the extended gesture timeline runner
+
+Gestures run against Mock cars, so the tests check exactly which commands a
+timeline sends and when the safety paths reset the car.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from nodes.navigation import extended_gestures as eg
+
+
+def apply_kwargs(timeline):
+    """The keyword arguments of each car.apply() step in a compiled timeline"""
+    car = Mock()
+    for _, action in timeline:
+        action(car)
+    return [c.kwargs for c in car.apply.call_args_list]
+
+
+class TestCompileFrames(unittest.TestCase):
+    """Frame tables compile to the timeline they describe"""
+
+    def test_restated_setpoints_are_dropped(self):
+        """A field repeating the table's last value is not sent again"""
+        frames = (eg.Frame(pan=20, tilt=5, dt=0.1),
+                  eg.Frame(pan=20, tilt=10, dt=0.1),
+                  eg.Frame(pan=20, tilt=10, dt=0.1))
+
+        steps = apply_kwargs(eg._compile_frames(frames))
+
+        self.assertEqual([{k: v for k, v in step.items() if k not in ('smooth', 'wait')} for step in steps],
+                         [{'pan': 20, 'tilt': 5}, {'tilt': 10}])
+
+    def test_pure_holds_extend_the_wait(self):
+        """Frames without commands add to the next step's offset"""
+        frames = (eg.Frame(pan=20, dt=0.25), eg.Frame(dt=0.5), eg.Frame(pan=0, dt=0.25))
+
+        offsets = [t for t, _ in eg._compile_frames(frames)]
+
+        self.assertEqual(offsets, [0.0, 0.75, 1.0])
+
+    def test_tail_hold_scales_final_recenter(self):
+        """The recenter hold at the end shrinks with tail_hold"""
+        frames = (eg.Frame(pan=20, m1=30, m2=30, dt=0.5),
+                  eg.Frame(m1=0, m2=0, dt=0.1),
+                  eg.Frame(pan=0, tilt=0, steer=0, dt=1.0))
+
+        self.assertAlmostEqual(eg._compile_frames(frames, 1.0)[-1][0], 1.6)
+        self.assertAlmostEqual(eg._compile_frames(frames, 0.5)[-1][0], 1.1)
+        self.assertAlmostEqual(eg._compile_frames(frames, 0.0)[-1][0], 0.6)
+
+    def test_tail_hold_keeps_pose_and_driving_holds(self):
+        """A final pose, or a recenter with the motors still on, keeps its hold"""
+        pose = (eg.Frame(pan=20, dt=0.5), eg.Frame(tilt=15, dt=1.0))
+        driving = (eg.Frame(m1=30, m2=30, dt=0.5), eg.Frame(pan=0, dt=1.0))
+
+        self.assertAlmostEqual(eg._compile_frames(pose, 0.0)[-1][0], 1.5)
+        self.assertAlmostEqual(eg._compile_frames(driving, 0.0)[-1][0], 1.5)
+
+    def test_timeline_ends_in_stop(self):
+        """Every compiled timeline finishes with car.stop()"""
+        car = Mock()
+        eg._compile_frames((eg.Frame(pan=20, dt=0.1),))[-1][1](car)
+
+        car.stop.assert_called_once_with()
+
+    def test_speed_multiplier_scales_offsets(self):
+        """Scaled timelines stretch every offset by the speed multiplier"""
+        timeline = eg._compile_frames((eg.Frame(pan=20, dt=0.1), eg.Frame(pan=0, dt=0.2)))
+
+        for speed in ('slow', 'med', 'fast'):
+            multiplier = eg.SPEED_MULTIPLIERS[speed]
+            scaled = eg._scaled_timeline(timeline, multiplier)
+            self.assertEqual([t for t, _ in scaled], [t * multiplier for t, _ in timeline])
+            self.assertEqual([a for _, a in scaled], [a for _, a in timeline])
+
+    def test_registered_gestures_issue_table_setpoints(self):
+        """Running each registered gesture walks through the table's poses"""
+        fields = eg.Frame._fields[:5]
+        for name, frames in eg.GESTURE_FRAMES.items():
+            with self.subTest(gesture=name):
+                expected = []
+                state = {}
+                for frame in frames:
+                    state.update({k: v for k, v in zip(fields, frame) if v is not None})
+                    if not expected or expected[-1] != state:
+                        expected.append(dict(state))
+
+                car = Mock()
+                with patch.object(eg, '_hold_until'):
+                    eg.run_gesture(car, name)
+                actual = []
+                state = {}
+                for c in car.apply.call_args_list:
+                    state.update({k: v for k, v in c.kwargs.items() if k in fields})
+                    actual.append(dict(state))
+
+                self.assertEqual(actual, expected)
+                car.stop.assert_called_once_with()
+
+    def test_motion_gestures_are_frame_tables(self):
+        """Every gesture that moves the car has a table and takes tail"""
+        sounds = {'play_sound', 'honk', 'rev_engine'}
+        for name, fn in eg.EXTENDED_GESTURES.items():
+            if name in sounds:
+                continue
+            with self.subTest(gesture=name):
+                self.assertIn(name, eg.GESTURE_FRAMES)
+                car = Mock()
+                with patch.object(eg, '_hold_until'):
+                    fn(car, tail=False)
+                car.stop.assert_called_once_with()
+
+
+class TestWatchdog(unittest.TestCase):
+    """The watchdog cuts a stalled gesture without racing the stuck step"""
+
+    def test_stalled_step_is_reset_after_it_returns(self):
+        """A step stuck past the deadline gets a reset once it comes back"""
+        release = threading.Event()
+        stalled = threading.Event()
+        in_step = threading.Event()
+        reset_done = threading.Event()
+        overlaps = []
+
+        def apply(**kwargs):
+            in_step.set()
+            stalled.set()
+            release.wait(2.0)
+            in_step.clear()
+
+        def safe_neutral():
+            overlaps.append(in_step.is_set())
+            reset_done.set()
+
+        car = Mock()
+        car.apply.side_effect = apply
+        car.safe_neutral.side_effect = safe_neutral
+        timeline = eg._compile_frames((eg.Frame(pan=20, dt=0.05), eg.Frame(pan=0, dt=0.05)))
+        errors = []
+
+        def run():
+            try:
+                eg._play_timeline(car, timeline)
+            except eg.GestureAbort as e:
+                errors.append(e)
+
+        with patch.multiple(eg, WATCHDOG_FACTOR=1.0, WATCHDOG_MARGIN=0.1):
+            worker = threading.Thread(target=run)
+            worker.start()
+            self.assertTrue(stalled.wait(1.0))
+            # Well past the 0.15s deadline, the step is still stuck: no reset yet
+            time.sleep(0.4)
+            car.safe_neutral.assert_not_called()
+            release.set()
+            worker.join(2.0)
+
+        self.assertTrue(reset_done.wait(2.0))
+        self.assertEqual(overlaps, [False])
+        self.assertEqual(len(errors), 1)
+        car.stop.assert_not_called()
+
+    def test_finished_gesture_is_not_reset(self):
+        """A timeline that ends on time disarms the watchdog"""
+        car = Mock()
+        timeline = eg._compile_frames((eg.Frame(pan=20, dt=0.02), eg.Frame(pan=0, dt=0.02)))
+
+        with patch.multiple(eg, WATCHDOG_FACTOR=1.0, WATCHDOG_MARGIN=0.05):
+            eg._play_timeline(car, timeline)
+            time.sleep(0.2)
+
+        car.safe_neutral.assert_not_called()
+        car.stop.assert_called_once_with()
+
+
+class TestLoadGestureFile(unittest.TestCase):
+    """Gesture files are checked in full before any table is installed"""
+
+    def setUp(self):
+        for table in (eg.GESTURE_FRAMES, eg.EXTENDED_GESTURES):
+            patcher = patch.dict(table)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write(self, text):
+        f = tempfile.NamedTemporaryFile('w', suffix='.yaml', delete=False)
+        self.addCleanup(os.unlink, f.name)
+        with f:
+            f.write(text)
+        return f.name
+
+    def test_tables_load_and_dispatch(self):
+        """A new table becomes an action; a built-in name is replaced"""
+        path = self.write(
+            "nudge:\n"
+            "  - {pan: 20, m1: 10, m2: 10, dt: 0.25}\n"
+            "  - {pan: 0, m1: 0, m2: 0, dt: 0.5, smooth: false}\n"
+            "look_up:\n"
+            "  - {tilt: 25, dt: 0.5}\n")
+
+        with patch.dict(os.environ, NEVIL_GESTURE_FILE=path):
+            actions = eg.register_extended({})
+
+        self.assertIn('nudge', actions)
+        car = Mock()
+        with patch.object(eg, '_hold_until'):
+            actions['nudge'](car, speed='fast', tail=False)
+            actions['look_up'](car)
+        self.assertEqual(car.apply.call_args_list[0].kwargs,
+                         {'pan': 20, 'm1': 10, 'm2': 10, 'smooth': True, 'wait': False})
+        self.assertEqual(car.apply.call_args_list[1].kwargs,
+                         {'pan': 0, 'm1': 0, 'm2': 0, 'smooth': False, 'wait': False})
+        self.assertEqual(car.apply.call_args_list[2].kwargs,
+                         {'tilt': 25, 'smooth': True, 'wait': False})
+
+    def test_bad_values_leave_tables_unchanged(self):
+        """A bad value anywhere in the file raises before anything is installed"""
+        before = dict(eg.GESTURE_FRAMES)
+        for frame in ('{dt: "0.2"}', '{pan: left, dt: 0.2}', '{pan: 10, dt: -0.1}',
+                      '{pan: 10, dt: 0.2, smooth: 1}', '{pan: true, dt: 0.2}', '{yaw: 10}'):
+            with self.subTest(frame=frame):
+                path = self.write("look_up:\n  - {tilt: 10, dt: 0.2}\n"
+                                  f"nudge:\n  - {frame}\n")
+                with self.assertRaises(ValueError):
+                    eg.load_gesture_file(path)
+                self.assertEqual(eg.GESTURE_FRAMES, before)
+                self.assertNotIn('nudge', eg.EXTENDED_GESTURES)
+
+    def test_bad_file_at_startup_is_logged(self):
+        """register_extended keeps the built-ins when the file is rejected"""
+        path = self.write("honk:\n  - {pan: 10, dt: 0.2}\n")
+
+        with patch.dict(os.environ, NEVIL_GESTURE_FILE=path), \
+                self.assertLogs(eg.logger, 'ERROR'):
+            actions = eg.register_extended({})
+
+        self.assertIs(actions['honk'], eg.honk)
+        self.assertNotIn('honk', eg.GESTURE_FRAMES)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+Tests for NavigationNode action dispatch
+
+The node is built without NevilNode.__init__ (no message bus or config),
+with just the attributes the methods under test use.
+"""
+
+import logging
+import queue
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+# Hardware and host-only packages that aren't needed to dispatch actions
+sys.modules.setdefault('robot_hat', MagicMock())
+for _name in ('dotenv', 'readchar'):
+    try:
+        __import__(_name)
+    except ImportError:
+        sys.modules[_name] = MagicMock()
+
+from nodes.navigation import extended_gestures
+from nodes.navigation import navigation_node
+from nodes.navigation.navigation_node import NavigationNode
+
+
+def nod(car, speed='med', tail=True):
+    pass
+
+
+def make_node(**attrs):
+    node = NavigationNode.__new__(NavigationNode)
+    node.logger = logging.getLogger('test_navigation')
+    node.action_functions = {'nod': nod}
+    node.default_speed = 30
+    node._parse_cache = {}
+    node.parse_cache_size = 512
+    node._func_params = {}
+    node.action_settle_time = 0.5
+    node.action_queue = queue.PriorityQueue(maxsize=50)
+    node.action_batch_max = 4
+    node.__dict__.update(attrs)
+    return node
+
+
+def sequence(action_id, *actions):
+    return {'actions': list(actions), 'parsed': ['parsed ' + a for a in actions],
+            'action_id': action_id, 'source_text': 'said ' + action_id, 'mood': 'happy'}
+
+
+class TestParseCache(unittest.TestCase):
+    """Parsed actions are cached but never shared"""
+
+    def test_cached_parse_returns_independent_copies(self):
+        """Changing one parse result's params leaves the next one untouched"""
+        node = make_node()
+
+        first = node._parse_action('nod')
+        first['params']['tail'] = False
+        second = node._parse_action('nod')
+
+        self.assertIs(second['function'], nod)
+        self.assertNotIn('tail', second['params'])
+        self.assertIsNot(first['params'], second['params'])
+        self.assertIn('nod', node._parse_cache)
+
+    def test_unknown_action_is_not_cached(self):
+        """A failed parse returns None and leaves the cache empty"""
+        node = make_node()
+
+        self.assertIsNone(node._parse_action('no_such_action'))
+        self.assertEqual(node._parse_cache, {})
+
+
+class TestSettleTime(unittest.TestCase):
+    """Only non-frame-table actions pause after running"""
+
+    def setUp(self):
+        frames = patch.object(navigation_node, 'gesture_frames', extended_gestures.GESTURE_FRAMES)
+        frames.start()
+        self.addCleanup(frames.stop)
+        self.node = make_node()
+
+    def test_frame_gestures_need_no_settle(self):
+        """Registered frame tables, with or without a speed suffix, don't wait"""
+        for name in list(extended_gestures.GESTURE_FRAMES)[:5]:
+            self.assertEqual(self.node._settle_time(name), 0.0)
+            self.assertEqual(self.node._settle_time(name + ':fast'), 0.0)
+
+    def test_other_actions_keep_settle(self):
+        """Driving and v1.0 actions keep the 0.5s pause"""
+        for name in ('forward 10cm @ 30', 'shake head', 'honk'):
+            self.assertEqual(self.node._settle_time(name), 0.5)
+
+
+class TestActionQueue(unittest.TestCase):
+    """Queue ordering and batching"""
+
+    def test_shutdown_sentinel_sorts_first(self):
+        """cleanup()'s sentinel is taken ahead of queued sequences"""
+        node = make_node(shutdown_event=threading.Event(), auto_enabled=False,
+                         car=None, actions_processed=0)
+        node.action_queue.put((100, time.time(), sequence('a', 'nod')))
+        node.action_queue.put((-5, time.time(), sequence('b', 'nod')))
+
+        with patch.object(navigation_node, 'cancel_gesture'):
+            node.cleanup()
+
+        self.assertIsNone(node.action_queue.get_nowait()[2])
+        self.assertTrue(node.shutdown_event.is_set())
+
+    def test_batch_merge_keeps_order(self):
+        """Queued sequences are appended in queue order, up to the batch limit"""
+        node = make_node()
+        for i, action_id in enumerate('bcde'):
+            node.action_queue.put((100, i, sequence(action_id, 'nod ' + action_id, 'wave ' + action_id)))
+        first = sequence('a', 'nod a')
+
+        merged, batched = node._collect_action_batch(first)
+
+        self.assertEqual(batched, 3)
+        self.assertEqual(merged['actions'], ['nod a', 'nod b', 'wave b', 'nod c', 'wave c', 'nod d', 'wave d'])
+        self.assertEqual(merged['parsed'], ['parsed ' + a for a in merged['actions']])
+        self.assertEqual([m['action_id'] for m in merged['merged']], ['b', 'c', 'd'])
+        self.assertEqual(merged['action_id'], 'a')
+        self.assertEqual(first['actions'], ['nod a'])
+        self.assertEqual(node.action_queue.qsize(), 1)
+
+    def test_batch_leaves_sentinel_for_loop(self):
+        """A sentinel met while batching is put back without a second count"""
+        node = make_node()
+        node.action_queue.put((float('-inf'), 0, None))
+        outstanding = node.action_queue.unfinished_tasks
+
+        merged, batched = node._collect_action_batch(sequence('a', 'nod'))
+
+        self.assertEqual(batched, 0)
+        self.assertEqual(node.action_queue.unfinished_tasks, outstanding)
+        self.assertIsNone(node.action_queue.get_nowait()[2])
+
+    def test_lone_sequence_is_not_delayed(self):
+        """An empty queue returns the sequence at once"""
+        node = make_node()
+        start = time.monotonic()
+
+        merged, batched = node._collect_action_batch(sequence('a', 'nod'))
+
+        self.assertLess(time.monotonic() - start, 0.01)
+        self.assertEqual(batched, 0)
+
+
+class TestSequenceRelease(unittest.TestCase):
+    """The microphone stays muted until the servos have stopped"""
+
+    def run_sequence(self, car, events):
+        busy = Mock()
+        busy.acquire.return_value = True
+        busy.should_interrupt.return_value = False
+        busy.release.side_effect = lambda: events.append('busy')
+        mic = Mock()
+        mic.release_noisy_activity.side_effect = lambda who: events.append('mic')
+        node = make_node(car=car, publish=Mock(), shutdown_event=threading.Event(),
+                         servo_idle_timeout=1.0, actions_processed=0)
+
+        with patch.multiple(navigation_node, busy_state=busy, microphone_mutex=mic), \
+                patch.object(navigation_node.time, 'sleep'):
+            node._process_action_sequence({'actions': ['nod'],
+                                           'parsed': [node._parse_action('nod')]})
+
+    def test_release_waits_for_servos(self):
+        """wait_servos_idle runs before busy state and the microphone are released"""
+        events = []
+        car = Mock()
+        car.wait_servos_idle.side_effect = lambda timeout: events.append(('wait', timeout)) or True
+
+        self.run_sequence(car, events)
+
+        self.assertEqual(events, [('wait', 1.0), 'busy', 'mic'])
+
+    def test_wait_failure_still_releases(self):
+        """A failing wait is logged and both are released anyway"""
+        events = []
+        car = Mock()
+        car.wait_servos_idle.side_effect = OSError('bus')
+
+        with self.assertLogs('test_navigation', 'ERROR'):
+            self.run_sequence(car, events)
+
+        self.assertEqual(events, ['busy', 'mic'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Tests for the Picarx motor write cache
+
+Runs without a Robot HAT: robot_hat is replaced by mocks and every pin is
+a Mock, so the tests see exactly which hardware writes go out.
+"""
+
+import sys
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+# robot_hat only exists on the Pi
+sys.modules.setdefault('robot_hat', MagicMock())
+
+from nodes.navigation import picarx
+from nodes.navigation.picarx import Picarx
+
+
+def make_car():
+    """A Picarx whose pins are independent Mocks and whose config is defaults"""
+    config = Mock()
+    config.get.side_effect = lambda key, default_value=None: default_value
+    with patch.multiple(picarx,
+                        reset_mcu=Mock(),
+                        fileDB=Mock(return_value=config),
+                        Pin=Mock(side_effect=lambda *a, **k: Mock()),
+                        PWM=Mock(side_effect=lambda *a, **k: Mock()),
+                        Servo=Mock(side_effect=lambda *a, **k: Mock()),
+                        ADC=Mock(side_effect=lambda *a, **k: Mock()),
+                        Ultrasonic=Mock(),
+                        Grayscale_Module=None), \
+            patch.object(picarx.time, 'sleep'):
+        return Picarx()
+
+
+class TestMotorWriteCache(unittest.TestCase):
+    """Repeated motor commands are skipped only while the cache is right"""
+
+    def setUp(self):
+        self.car = make_car()
+        self.left_pwm, self.right_pwm = self.car.motor_speed_pins
+        sleep = patch.object(picarx.time, 'sleep')
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def test_repeated_command_skips_writes(self):
+        """A second identical command writes nothing"""
+        self.car.set_motor_speeds(40, -40)
+        self.left_pwm.reset_mock()
+        self.right_pwm.reset_mock()
+
+        self.car.set_motor_speeds(40, -40)
+
+        self.left_pwm.pulse_width_percent.assert_not_called()
+        self.right_pwm.pulse_width_percent.assert_not_called()
+
+    def test_failed_write_is_retried(self):
+        """A command whose write raised is sent again, not skipped"""
+        self.left_pwm.pulse_width_percent.side_effect = [OSError("I2C"), None]
+
+        with self.assertRaises(OSError):
+            self.car.set_motor_speed(1, 40)
+        self.car.set_motor_speed(1, 40)
+
+        self.assertEqual(self.left_pwm.pulse_width_percent.call_count, 2)
+
+    def test_failed_pair_write_is_retried(self):
+        """set_motor_speeds forgets both motors it was changing on failure"""
+        self.right_pwm.pulse_width_percent.side_effect = [OSError("I2C"), None]
+
+        with self.assertRaises(OSError):
+            self.car.set_motor_speeds(40, 40)
+        self.assertEqual(self.car._motor_outputs, [None, None])
+
+    def test_stop_writes_after_failed_zero_write(self):
+        """stop() still cuts PWM when the earlier zero write never landed"""
+        self.car.set_motor_speeds(60, -60)
+        self.left_pwm.pulse_width_percent.side_effect = [OSError("I2C")]
+
+        with self.assertRaises(OSError):
+            self.car.set_motor_speeds(0, 0)
+        self.left_pwm.pulse_width_percent.side_effect = None
+        self.left_pwm.reset_mock()
+        self.car.stop()
+
+        self.left_pwm.pulse_width_percent.assert_called_with(0)
+
+    def test_stop_skips_when_known_stopped(self):
+        """stop() after a completed stop writes nothing"""
+        self.car.set_motor_speeds(60, -60)
+        self.car.stop()
+        self.left_pwm.reset_mock()
+
+        self.car.stop()
+
+        self.left_pwm.pulse_width_percent.assert_not_called()
+
+    def test_stop_writes_after_failed_stop(self):
+        """A stop() that failed part way is not taken as a completed one"""
+        self.car.set_motor_speeds(60, -60)
+        self.left_pwm.pulse_width_percent.side_effect = [None, OSError("I2C")]
+
+        with self.assertRaises(OSError):
+            self.car.stop()
+        self.left_pwm.pulse_width_percent.side_effect = None
+        self.left_pwm.reset_mock()
+        self.car.stop()
+
+        self.left_pwm.pulse_width_percent.assert_called_with(0)
+
+    def test_speed_rewritten_after_failed_stop(self):
+        """The ramp may have left PWM at 50, so the old speed is written again"""
+        self.car.set_motor_speeds(60, -60)
+        self.left_pwm.pulse_width_percent.side_effect = [None, OSError("I2C")]
+
+        with self.assertRaises(OSError):
+            self.car.stop()
+        self.left_pwm.pulse_width_percent.side_effect = None
+        self.left_pwm.reset_mock()
+        self.car.set_motor_speeds(60, -60)
+
+        self.left_pwm.pulse_width_percent.assert_called_once()
+
+    def test_speed_rewritten_after_failed_safe_neutral(self):
+        """safe_neutral() only marks the motors stopped once its writes land"""
+        self.car.set_motor_speeds(60, -60)
+        self.car.motor_direction_pins[1].low.side_effect = OSError("I2C")
+
+        with self.assertRaises(OSError):
+            self.car.safe_neutral()
+        self.car.motor_direction_pins[1].low.side_effect = None
+        self.left_pwm.reset_mock()
+        self.car.set_motor_speeds(60, -60)
+
+        self.left_pwm.pulse_width_percent.assert_called_once()
+
+
+class TestRampPositions(unittest.TestCase):
+    """Smooth servo ramps"""
+
+    def test_ramps_end_exactly_on_target(self):
+        """Both profiles land on the target with no float error"""
+        for profile in ('cubic', 'linear'):
+            for start, target, steps in ((0, 30, 5), (-90, 65, 7), (12.5, -3, 3), (0, 10, 1)):
+                with self.subTest(profile=profile, start=start, target=target):
+                    positions = picarx.ramp_positions(start, target, steps, profile)
+                    self.assertEqual(len(positions), steps)
+                    self.assertEqual(positions[-1], target)
+
+    def test_cubic_eases_in_and_out(self):
+        """Cubic steps are small at the ends, large mid-move and symmetric"""
+        positions = (0,) + picarx.ramp_positions(0, 100, 4, 'cubic')
+        steps = [b - a for a, b in zip(positions, positions[1:])]
+
+        self.assertAlmostEqual(positions[2], 50)
+        self.assertLess(steps[0], steps[1])
+        self.assertAlmostEqual(steps[0], steps[-1])
+
+    def test_linear_steps_evenly(self):
+        """Linear ramps move the same amount each step"""
+        self.assertEqual(picarx.ramp_positions(0, 40, 4, 'linear'), (10, 20, 30, 40))
+
+
+class TestBackgroundRamps(unittest.TestCase):
+    """Smooth moves with wait=False finish on the servo thread"""
+
+    def test_wait_servos_idle_waits_for_ramps(self):
+        """wait_servos_idle returns once the ramp has reached its target"""
+        car = make_car()
+        self.assertTrue(car.wait_servos_idle(0))
+
+        car.apply(pan=30, smooth=True, steps=5, wait=False)
+
+        self.assertTrue(car.wait_servos_idle(2.0))
+        self.assertEqual(car.current_pan_angle, 30)
+        self.assertFalse(car._servo_ramps)
+
+
+if __name__ == '__main__':
+    unittest.main()
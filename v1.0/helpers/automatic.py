@@ -2,16 +2,36 @@ import random
 import time
 import warnings
 import os
+from types import MappingProxyType
 
 # Suppress ALSA warnings if environment variable is set
 if os.getenv('HIDE_ALSA_LOGGING', '').lower() == 'true':
     warnings.filterwarnings("ignore", category=RuntimeWarning, module="ALSA")
 
+# Console chatter from the auto loop; set NEVIL_VERBOSE=0 to silence it
+VERBOSE = os.getenv('NEVIL_VERBOSE', '1') != '0'
+_log = print if VERBOSE else (lambda *args, **kwargs: None)
+
+def _mood_text(mood):
+    """Mood for a log line: a profile is a read-only view, shown as a plain dict"""
+    return dict(mood) if isinstance(mood, MappingProxyType) else mood
+
 # Actions: forward, backward, left, right, stop, twist left, twist right, come here, shake head, 
 #    nod, wave hands, resist, act cute, rub hands, think, twist body, celebrate, depressed, keep think
 #
 # Sounds: honk, start engine
 
+# -----------------------
+# Fixed Action Sequences
+# -----------------------
+_CIRCLE_SPIN = ("right",) * 3
+_CIRCLE_FULL = ("right",) * 9
+_SING_HONKS = ("celebrate", "honk", "celebrate", "honk", "honk")
+_DANCE_OPENING = ("twist body", "celebrate", "twist body", "celebrate")
+_DANCE_WHIMSY = ("forward 3 90", "backward 3 90", "forward 2 70", "backward 3 80", "forward 10 90", "backward 10 90")
+_DANCE_SHUFFLE = ("right", "left", "backward 10 90", "right", "left", "backward 10 90")
+_DANCE_HONKS = ("celebrate", "honk", "celebrate", "honk", "honk", "celebrate", "honk", "celebrate", "celebrate", "honk")
+
 # -----------------------
 # Main Auto Class
 # -----------------------
@@ -20,21 +40,21 @@ class Automatic:
     # -----------------------
     # Mood Profiles (Expanded)
     # -----------------------
-    MOOD_PROFILES = {
-        "playful":     {"volume": 85, "curiosity": 70, "sociability": 90, "whimsy": 95, "energy": 90},
-        "brooding":    {"volume": 25, "curiosity": 40, "sociability": 10, "whimsy": 15, "energy": 30},
-        "curious":     {"volume": 40, "curiosity": 85, "sociability": 50, "whimsy": 35, "energy": 60},
-        "melancholic": {"volume": 30, "curiosity": 30, "sociability": 20, "whimsy": 20, "energy": 20},
-        "zippy":       {"volume": 70, "curiosity": 60, "sociability": 60, "whimsy": 50, "energy": 95},
-        "lonely":      {"volume": 60, "curiosity": 40, "sociability": 80, "whimsy": 20, "energy": 50},
-        "mischievous": {"volume": 90, "curiosity": 75, "sociability": 50, "whimsy": 95, "energy": 85},
-        "sleepy":      {"volume": 10, "curiosity": 20, "sociability": 10, "whimsy": 5,  "energy": 15}
-    }
+    MOOD_PROFILES = MappingProxyType({
+        "playful":     MappingProxyType({"volume": 85, "curiosity": 70, "sociability": 90, "whimsy": 95, "energy": 90}),
+        "brooding":    MappingProxyType({"volume": 25, "curiosity": 40, "sociability": 10, "whimsy": 15, "energy": 30}),
+        "curious":     MappingProxyType({"volume": 40, "curiosity": 85, "sociability": 50, "whimsy": 35, "energy": 60}),
+        "melancholic": MappingProxyType({"volume": 30, "curiosity": 30, "sociability": 20, "whimsy": 20, "energy": 20}),
+        "zippy":       MappingProxyType({"volume": 70, "curiosity": 60, "sociability": 60, "whimsy": 50, "energy": 95}),
+        "lonely":      MappingProxyType({"volume": 60, "curiosity": 40, "sociability": 80, "whimsy": 20, "energy": 50}),
+        "mischievous": MappingProxyType({"volume": 90, "curiosity": 75, "sociability": 50, "whimsy": 95, "energy": 85}),
+        "sleepy":      MappingProxyType({"volume": 10, "curiosity": 20, "sociability": 10, "whimsy": 5,  "energy": 15})
+    })
 
     # -----------------------
     # Base Behavior Weights
     # -----------------------
-    BEHAVIOR_BASE_WEIGHTS = {
+    BEHAVIOR_BASE_WEIGHTS = MappingProxyType({
         "explore": 0.3,
         "rest": 0.1,
         "sleep": 0.2,
@@ -46,52 +66,42 @@ class Automatic:
         "sing": 0.05,
         "mutter": 0.05,
         "dance": 0.1
-    }
+    })
 
     # -----------------------
     # Trait Biases for Weight Calculation
     # -----------------------
-    BEHAVIOR_TRAIT_BIASES = {
-        "explore":     {"curiosity": 1.2, "energy": 1.1},
-        "rest":        {"energy": 0.6},
-        "sleep":       {"energy": 0.3},
-        "fidget":      {"whimsy": 1.2, "energy": 0.8},
-        "address":     {"sociability": 1.4},
-        "play":        {"whimsy": 1.2, "energy": 1.2},
-        "panic":       {"energy": 1.5},
-        "circle":      {"curiosity": 1.1, "energy": 1.1},
-        "sing":        {"whimsy": 1.3},
-        "mutter":      {"curiosity": 0.7, "sociability": 0.6},
-        "dance":       {"energy": 1.3, "whimsy": 1.5}
-    }
+    BEHAVIOR_TRAIT_BIASES = MappingProxyType({
+        "explore":     MappingProxyType({"curiosity": 1.2, "energy": 1.1}),
+        "rest":        MappingProxyType({"energy": 0.6}),
+        "sleep":       MappingProxyType({"energy": 0.3}),
+        "fidget":      MappingProxyType({"whimsy": 1.2, "energy": 0.8}),
+        "address":     MappingProxyType({"sociability": 1.4}),
+        "play":        MappingProxyType({"whimsy": 1.2, "energy": 1.2}),
+        "panic":       MappingProxyType({"energy": 1.5}),
+        "circle":      MappingProxyType({"curiosity": 1.1, "energy": 1.1}),
+        "sing":        MappingProxyType({"whimsy": 1.3}),
+        "mutter":      MappingProxyType({"curiosity": 0.7, "sociability": 0.6}),
+        "dance":       MappingProxyType({"energy": 1.3, "whimsy": 1.5})
+    })
 
     # -----------------------
     # Behavior Functions
     # -----------------------
+    # Behavior names in a fixed order; BEHAVIOR_FUNCS (same order) and the
+    # name -> function map are attached once after the class body.
+    BEHAVIOR_NAMES = ("explore", "rest", "sleep", "fidget", "address", "play",
+                      "panic", "circle", "sing", "mutter", "dance")
+
     def __init__(self, nevil_self):
         self.current_mood_name = "curious"  # Default mood
         self.current_mood = self.MOOD_PROFILES[self.current_mood_name]
         self.nevil = nevil_self  # Store the nevil reference
         self.last_interaction_time = 0  # Track when we last had an interaction
-        
-        # Map behavior names to their functions
-        self.BEHAVIOR_FUNCTIONS = {
-            "explore": self.explore,
-            "rest": self.rest,
-            "sleep": self.sleep,
-            "fidget": self.fidget,
-            "address": self.address,
-            "play": self.play,
-            "panic": self.panic,
-            "circle": self.circle,
-            "sing": self.sing,
-            "mutter": self.mutter,
-            "dance": self.dance
-        }
 
     def do_actions(self, actions, mood=None):
         """Queue actions for execution by action thread"""
-        print(f"[actions] {actions.all}" + (f" ({mood})" if mood else ""))
+        _log(f"[actions] {actions.all}" + (f" ({_mood_text(mood)})" if mood else ""))
         
         # Parse to check if it's a sound
         #action, params = self.nevil.parse_action(actions)
@@ -247,17 +257,7 @@ class Automatic:
         curiosity = mood["curiosity"]
         energy = mood["energy"]
 
-        actions.append("right")
-        actions.append("right")
-        actions.append("right")
-
-        if energy > 50:
-            actions.append("right")
-            actions.append("right")
-            actions.append("right")
-            actions.append("right")
-            actions.append("right")
-            actions.append("right")
+        actions.extend(_CIRCLE_FULL if energy > 50 else _CIRCLE_SPIN)
         if curiosity > 70:
             actions.append("think")
 
@@ -271,11 +271,7 @@ class Automatic:
         whimsy = mood["whimsy"]
 
         if volume > 60:
-            actions.append("celebrate")
-            actions.append("honk")
-            actions.append("celebrate")
-            actions.append("honk")
-            actions.append("honk")
+            actions.extend(_SING_HONKS)
         else:
             actions.append("act cute")
 
@@ -308,37 +304,15 @@ class Automatic:
         energy = mood["energy"]
         whimsy = mood["whimsy"]
 
-        actions.append("twist body")
-        actions.append("celebrate")
-        actions.append("twist body")
-        actions.append("celebrate")
+        actions.extend(_DANCE_OPENING)
 
         if whimsy > 50:
-            actions.append("forward 3 90")
-            actions.append("backward 3 90")
-            actions.append("forward 2 70")
-            actions.append("backward 3 80")
-            actions.append("forward 10 90")
-            actions.append("backward 10 90")
+            actions.extend(_DANCE_WHIMSY)
         else:
-            actions.append("right")
-            actions.append("left")
-            actions.append("backward 10 90")
-            actions.append("right")
-            actions.append("left")
-            actions.append("backward 10 90")
+            actions.extend(_DANCE_SHUFFLE)
 
         if mood["volume"] > 60:
-            actions.append("celebrate")
-            actions.append("honk")
-            actions.append("celebrate")
-            actions.append("honk")
-            actions.append("honk")
-            actions.append("celebrate")
-            actions.append("honk")
-            actions.append("celebrate")
-            actions.append("celebrate")
-            actions.append("honk")
+            actions.extend(_DANCE_HONKS)
 
         actions.append("sleep 2")
 
@@ -360,7 +334,7 @@ class Automatic:
                 break
             
             rando = random.random()
-            print(f"\n[auto] Random value: {rando:.3f} ({'GPT' if rando < 0.25 else 'Behavior'})")
+            _log(f"\n[auto] Random value: {rando:.3f} ({'GPT' if rando < 0.25 else 'Behavior'})")
             
             if rando < 0.25:  # 25% chance of GPT
                 use_vision = random.random() < (self.current_mood.get('curiosity', 50) / 100)
@@ -379,22 +353,22 @@ class Automatic:
                 # Handle speech output
                 if message:
                     self.nevil.handle_TTS_generation(message)
-                    print(f"[auto speech] {message}")
+                    _log(f"[auto speech] {message}")
                 
                 # Handle actions one at a time like in behaviors
                 if actions:
                     self.do_actions(actions)
             else:
                 # Use behavior system with vocalizations
-                print(f"\n[auto] Mood: {self.current_mood_name}")
+                _log(f"\n[auto] Mood: {self.current_mood_name}")
                 weights = self.compute_behavior_weights(
                     self.BEHAVIOR_BASE_WEIGHTS,
                     self.current_mood,
                     self.BEHAVIOR_TRAIT_BIASES
                 )
                 behavior_name = self.weighted_choice(weights)
-                print(f"[auto] Chosen behavior: {behavior_name}")
-                print(f"[auto] Mood: {self.current_mood}")
+                _log(f"[auto] Chosen behavior: {behavior_name}")
+                _log(f"[auto] Mood: {dict(self.current_mood)}")
                 self.do_behavior(behavior_name, self.current_mood)
                 
                 # Wait for any speech to complete
@@ -435,7 +409,7 @@ class Automatic:
     def set_mood(self, mood_name):
         if mood_name in self.MOOD_PROFILES:
             self.current_mood_name = mood_name
-            self.current_mood = self.MOOD_PROFILES[mood_name].copy()
+            self.current_mood = self.MOOD_PROFILES[mood_name]
             # Perform transition behavior
             self.mood_transition()
             return True
@@ -463,7 +437,7 @@ class Automatic:
         mood_factor = (energy + whimsy) / 100  # 0 to 2 range
         cycles = max(2, min(10, int(base_cycles * mood_factor)))
         
-        print(f"[system] Feeling {'energetic' if mood_factor > 1 else 'mellow'}, doing {cycles} cycles")
+        _log(f"[system] Feeling {'energetic' if mood_factor > 1 else 'mellow'}, doing {cycles} cycles")
         return cycles
 
     BEHAVIOR_VOCALIZATIONS = {
@@ -561,20 +535,26 @@ class Automatic:
         ]
     }
 
+    # Fixed prompt text around the three sampled examples, built once
+    AUTO_PROMPT_PREFIX = "Running in autonomous mode. Respond with a VERY brief comment like '"
+    AUTO_PROMPT_SEPARATOR = "' or '"
+    AUTO_PROMPT_SUFFIX_VISION = (
+        "'. Keep it to 1-5 words usually."
+        "Comment on things you see, or let them inspire your commentary or exclamations or questions or utterances."
+    )
+    AUTO_PROMPT_SUFFIX_GENERAL = "'. Keep it to 1-5 words usually.What's on your mind?"
+
     def get_auto_prompt(self, use_vision):
         """Generate appropriate prompt for auto mode"""
-        example_list = self.AUTO_PROMPT_EXAMPLES["vision" if use_vision else "general"]
-        examples = random.sample(example_list, 3)
-        prompt = (
-            "Running in autonomous mode. Respond with a VERY brief comment "
-            f"like '{examples[0]}' or '{examples[1]}' or '{examples[2]}'. "
-            "Keep it to 1-5 words usually."
-        )
         if use_vision:
-            prompt += "Comment on things you see, or let them inspire your commentary or exclamations or questions or utterances."
+            example_list = self.AUTO_PROMPT_EXAMPLES["vision"]
+            suffix = self.AUTO_PROMPT_SUFFIX_VISION
         else:
-            prompt += "What's on your mind?"
-        return prompt
+            example_list = self.AUTO_PROMPT_EXAMPLES["general"]
+            suffix = self.AUTO_PROMPT_SUFFIX_GENERAL
+        i, j, k = random.sample(range(len(example_list)), 3)
+        sep = self.AUTO_PROMPT_SEPARATOR
+        return "".join((self.AUTO_PROMPT_PREFIX, example_list[i], sep, example_list[j], sep, example_list[k], suffix))
 
     def do_behavior(self, behavior_name, mood):
         """Execute behavior with possible vocalization"""
@@ -584,15 +564,15 @@ class Automatic:
             vocalizations = self.BEHAVIOR_VOCALIZATIONS.get(behavior_name, [])
             vocalization_chance = (self.current_mood["energy"] + self.current_mood["whimsy"] + self.current_mood["sociability"] + self.current_mood["curiosity"] + self.current_mood["volume"]) / 500
             
-            print(f"[vocal] Chance {vocalization_chance:.2f} from traits: energy={self.current_mood['energy']} whimsy={self.current_mood['whimsy']} sociability={self.current_mood['sociability']} curiosity={self.current_mood['curiosity']} volume={self.current_mood['volume']}")
-            print(f"[vocal] Vocalizations: {vocalizations}")
+            _log(f"[vocal] Chance {vocalization_chance:.2f} from traits: energy={self.current_mood['energy']} whimsy={self.current_mood['whimsy']} sociability={self.current_mood['sociability']} curiosity={self.current_mood['curiosity']} volume={self.current_mood['volume']}")
+            _log(f"[vocal] Vocalizations: {vocalizations}")
             if vocalizations and random.random() < vocalization_chance:
                 message = random.choice(vocalizations)
                 self.nevil.handle_TTS_generation(message)
-                print(f"[auto vocalization] {message}")
+                _log(f"[auto vocalization] {message}")
             
             # Do the behavior
-            behavior_func(mood)
+            behavior_func(self, mood)
 
     def do_actions(self, actions, mood=None):
         """Queue multiple actions for execution"""
@@ -601,7 +581,7 @@ class Automatic:
         
         # Log the actions
         action_str = ", ".join(actions)
-        print(f"[actions] Queueing: {action_str}" + (f" ({mood})" if mood else ""))
+        _log(f"[actions] Queueing: {action_str}" + (f" ({_mood_text(mood)})" if mood else ""))
         
         # Queue the actions
         with self.nevil.action_lock:
@@ -617,3 +597,7 @@ class Automatic:
                     break
             time.sleep(.01)
 
+
+# Behavior functions are shared by every instance as plain (unbound) functions
+Automatic.BEHAVIOR_FUNCS = tuple(getattr(Automatic, name) for name in Automatic.BEHAVIOR_NAMES)
+Automatic.BEHAVIOR_FUNCTIONS = MappingProxyType(dict(zip(Automatic.BEHAVIOR_NAMES, Automatic.BEHAVIOR_FUNCS)))